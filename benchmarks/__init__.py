@@ -0,0 +1,93 @@
+# BENCHMARKS: Suite de medición de rendimiento (motor, búsqueda, entrenamiento, persistencia e interfaz)
+
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# =============================================================================
+#  NÚCLEO DE LA SUITE
+# =============================================================================
+#  Cada benchmark es una función f(semilla) -> valor que mide UNA muestra
+#  (jugadas por segundo, milisegundos, ...). Se registra con @benchmark
+#  indicando su unidad y si un valor mayor es mejor. La suite ejecuta una
+#  pasada de calentamiento y luego `repeticiones` muestras con la misma
+#  semilla, de modo que todas miden exactamente el mismo trabajo.
+#
+#  Uso: python -m benchmarks [--repeticiones 5] [--filtro entrenamiento] [--salida archivo.json]
+# =============================================================================
+
+REGISTRO = {}
+
+def benchmark(nombre, unidad, mayor_es_mejor=True):
+    """Decorador que registra f(semilla) -> valor en la suite."""
+    def registrar(funcion):
+        REGISTRO[nombre] = {"funcion": funcion, "unidad": unidad, "mayor_es_mejor": mayor_es_mejor}
+        return funcion
+    return registrar
+
+
+def resumir(muestras):
+    return {
+        "mediana": statistics.median(muestras),
+        "media": statistics.fmean(muestras),
+        "desviacion": statistics.stdev(muestras) if len(muestras) > 1 else 0.0,
+        "minimo": min(muestras),
+        "maximo": max(muestras),
+    }
+
+
+def metadatos(semilla, repeticiones):
+    return {
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementacion": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "maquina": {
+            "nombre": platform.node(),
+            "arquitectura": platform.machine(),
+            "procesador": platform.processor(),
+            "nucleos": os.cpu_count(),
+        },
+        "semilla": semilla,
+        "repeticiones": repeticiones,
+    }
+
+
+def ejecutar_suite(repeticiones=5, semilla=0, filtro=None, mostrar=True):
+    """
+    Ejecuta los benchmarks registrados (o los que contienen `filtro` en el nombre).
+    Retorna {'metadatos': {...}, 'benchmarks': {nombre: {'unidad', 'mayor_es_mejor', 'muestras', ...}}}
+    """
+    # Las definiciones se importan aquí para que `import benchmarks` sea liviano
+    from benchmarks import suite  # noqa: F401
+
+    resultados = {}
+    for nombre, definicion in REGISTRO.items():
+        if filtro and filtro not in nombre:
+            continue
+        funcion = definicion["funcion"]
+        inicio = time.perf_counter()
+        funcion(semilla)  # calentamiento (cachés, imports perezosos, archivos en disco)
+        muestras = [funcion(semilla) for _ in range(repeticiones)]
+        resultado = {"unidad": definicion["unidad"], "mayor_es_mejor": definicion["mayor_es_mejor"], "muestras": muestras}
+        resultado.update(resumir(muestras))
+        resultados[nombre] = resultado
+        if mostrar:
+            print(f"{nombre:<48} {resultado['mediana']:>14.3f} {definicion['unidad']:<12}"
+                  f" ±{resultado['desviacion']:.3f}  ({time.perf_counter() - inicio:.1f} s)")
+
+    return {"metadatos": metadatos(semilla, repeticiones), "benchmarks": resultados}
+
+
+def guardar_resultados(resultados, ruta):
+    with open(ruta, "w") as f:
+        json.dump(resultados, f, indent=2)
+
+
+def cargar_resultados(ruta):
+    with open(ruta, "r") as f:
+        return json.load(f)
@@ -0,0 +1,21 @@
+# __MAIN__.PY: python -m benchmarks
+
+import argparse
+
+from benchmarks import ejecutar_suite, guardar_resultados
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ejecuta la suite de benchmarks y guarda los resultados en JSON.")
+    parser.add_argument("--repeticiones", type=int, default=5, help="muestras por benchmark")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--filtro", help="solo los benchmarks cuyo nombre contiene este texto")
+    parser.add_argument("--salida", default="resultados_benchmarks.json")
+    args = parser.parse_args(argv)
+
+    resultados = ejecutar_suite(args.repeticiones, args.semilla, args.filtro)
+    guardar_resultados(resultados, args.salida)
+    print(f"\nResultados guardados en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
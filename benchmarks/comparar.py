@@ -0,0 +1,212 @@
+# COMPARAR.PY: Líneas base con nombre y detección de regresiones entre revisiones
+
+import argparse
+import math
+import os
+import sys
+from functools import lru_cache
+
+from benchmarks import cargar_resultados, ejecutar_suite, guardar_resultados
+
+# =============================================================================
+#  LÍNEAS BASE Y COMPARACIÓN
+# =============================================================================
+#  Una línea base es un resultado de la suite guardado con nombre en
+#  benchmarks/lineas_base/<nombre>.json (incluye máquina y versión de Python).
+#  Al comparar, cada benchmark se juzga con sus muestras repetidas:
+#  - Prueba U de Mann-Whitney (no asume normalidad; exacta con pocas muestras
+#    y sin empates, aproximación normal con corrección por empates si no).
+#  - Hay regresión si la diferencia es significativa (p < alfa) Y la mediana
+#    empeora más que `umbral` (fracción) en la dirección "mala" del benchmark.
+#
+#  Uso:
+#     python -m benchmarks.comparar guardar antes_del_cambio
+#     python -m benchmarks.comparar comparar antes_del_cambio --umbral 0.05
+#     python -m benchmarks.comparar listar
+#  `comparar` sale con código 1 si algún benchmark empeoró.
+# =============================================================================
+
+DIRECTORIO_BASES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lineas_base")
+
+
+def ruta_base(nombre):
+    return os.path.join(DIRECTORIO_BASES, f"{nombre}.json")
+
+
+def guardar_base(nombre, resultados):
+    os.makedirs(DIRECTORIO_BASES, exist_ok=True)
+    resultados["metadatos"]["nombre_base"] = nombre
+    guardar_resultados(resultados, ruta_base(nombre))
+    return ruta_base(nombre)
+
+
+def listar_bases():
+    if not os.path.isdir(DIRECTORIO_BASES):
+        return []
+    return sorted(os.path.splitext(f)[0] for f in os.listdir(DIRECTORIO_BASES) if f.endswith(".json"))
+
+
+# --------------------
+# PRUEBA U DE MANN-WHITNEY (solo biblioteca estándar)
+# --------------------
+@lru_cache(maxsize=None)
+def _arreglos_con_u(n1, n2, u):
+    """Número de ordenamientos de n1 + n2 muestras cuyo estadístico U vale exactamente u."""
+    if u < 0 or u > n1 * n2:
+        return 0
+    if n1 == 0 or n2 == 0:
+        return 1 if u == 0 else 0
+    # El mayor elemento pertenece a la muestra 1 (aporta n2 a U) o a la muestra 2
+    return _arreglos_con_u(n1 - 1, n2, u - n2) + _arreglos_con_u(n1, n2 - 1, u)
+
+
+def mann_whitney_u(a, b):
+    """Retorna (U de la muestra a, p bilateral)."""
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+
+    # Rangos promedio (los empates comparten rango)
+    valores = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    rangos = [0.0] * len(valores)
+    grupos_empate = []
+    i = 0
+    while i < len(valores):
+        j = i
+        while j + 1 < len(valores) and valores[j + 1][0] == valores[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            rangos[k] = (i + j) / 2 + 1
+        if j > i:
+            grupos_empate.append(j - i + 1)
+        i = j + 1
+
+    suma_rangos_a = sum(r for r, (_, grupo) in zip(rangos, valores) if grupo == 0)
+    u = suma_rangos_a - n1 * (n1 + 1) / 2
+
+    if not grupos_empate and n1 * n2 <= 400:
+        total = math.comb(n1 + n2, n1)
+        u_entero = int(u)
+        cola_baja = sum(_arreglos_con_u(n1, n2, k) for k in range(u_entero + 1)) / total
+        cola_alta = sum(_arreglos_con_u(n1, n2, k) for k in range(u_entero, n1 * n2 + 1)) / total
+        return u, min(1.0, 2 * min(cola_baja, cola_alta))
+
+    n = n1 + n2
+    media = n1 * n2 / 2
+    correccion = sum(t ** 3 - t for t in grupos_empate) / (n * (n - 1))
+    varianza = n1 * n2 / 12 * ((n + 1) - correccion)
+    if varianza <= 0:
+        return u, 1.0
+    z = (abs(u - media) - 0.5) / math.sqrt(varianza)
+    return u, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+# --------------------
+# COMPARACIÓN
+# --------------------
+def comparar(base, actual, umbral=0.05, alfa=0.05):
+    """
+    Compara dos resultados de la suite benchmark por benchmark.
+    Retorna una lista de dicts con 'nombre', 'cambio' (fracción, positivo = mejor),
+    'p', 'veredicto' ('regresion', 'mejora' o 'igual').
+    """
+    filas = []
+    for nombre, actual_b in actual["benchmarks"].items():
+        base_b = base["benchmarks"].get(nombre)
+        if base_b is None:
+            continue
+        mediana_base = base_b["mediana"]
+        cambio = (actual_b["mediana"] - mediana_base) / mediana_base if mediana_base else 0.0
+        if not actual_b["mayor_es_mejor"]:
+            cambio = -cambio
+        _, p = mann_whitney_u(base_b["muestras"], actual_b["muestras"])
+
+        veredicto = "igual"
+        if p < alfa and cambio < -umbral:
+            veredicto = "regresion"
+        elif p < alfa and cambio > umbral:
+            veredicto = "mejora"
+        filas.append({"nombre": nombre, "unidad": actual_b["unidad"], "base": mediana_base,
+                      "actual": actual_b["mediana"], "cambio": cambio, "p": p, "veredicto": veredicto})
+    return filas
+
+
+def diferencias_de_entorno(base, actual):
+    """Avisos cuando la línea base se midió en otra máquina o con otro Python."""
+    avisos = []
+    mb, ma = base["metadatos"], actual["metadatos"]
+    if mb.get("python") != ma.get("python"):
+        avisos.append(f"Python {mb.get('python')} (base) vs {ma.get('python')} (actual)")
+    if mb.get("maquina") != ma.get("maquina"):
+        avisos.append(f"máquina {mb.get('maquina')} (base) vs {ma.get('maquina')} (actual)")
+    return avisos
+
+
+def imprimir_comparacion(filas):
+    print(f"{'Benchmark':<48} {'Base':>12} {'Actual':>12} {'Cambio':>8} {'p':>7}  Veredicto")
+    for f in filas:
+        marca = {"regresion": "REGRESIÓN", "mejora": "mejora", "igual": "="}[f["veredicto"]]
+        print(f"{f['nombre']:<48} {f['base']:>12.3f} {f['actual']:>12.3f} {f['cambio'] * 100:>+7.1f}% {f['p']:>7.4f}  {marca}")
+
+
+# --------------------
+# LÍNEA DE COMANDOS
+# --------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Guarda líneas base de la suite y detecta regresiones.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    def opciones_de_ejecucion(p):
+        p.add_argument("--desde", help="usar un JSON de `python -m benchmarks` en vez de ejecutar la suite")
+        p.add_argument("--repeticiones", type=int, default=7)
+        p.add_argument("--semilla", type=int, default=0)
+        p.add_argument("--filtro")
+
+    p_guardar = sub.add_parser("guardar", help="ejecuta la suite y la guarda como línea base")
+    p_guardar.add_argument("nombre")
+    opciones_de_ejecucion(p_guardar)
+
+    p_comparar = sub.add_parser("comparar", help="compara una ejecución nueva contra una línea base")
+    p_comparar.add_argument("nombre")
+    opciones_de_ejecucion(p_comparar)
+    p_comparar.add_argument("--umbral", type=float, default=0.05, help="empeoramiento relativo tolerado (0.05 = 5%%)")
+    p_comparar.add_argument("--alfa", type=float, default=0.05, help="nivel de significancia de la prueba U")
+
+    sub.add_parser("listar", help="muestra las líneas base guardadas")
+    args = parser.parse_args(argv)
+
+    if args.comando == "listar":
+        for nombre in listar_bases():
+            metadatos = cargar_resultados(ruta_base(nombre))["metadatos"]
+            print(f"{nombre:<24} {metadatos['fecha']}  Python {metadatos['python']}  {metadatos.get('maquina', {}).get('nombre', '')}")
+        return 0
+
+    if args.desde:
+        resultados = cargar_resultados(args.desde)
+    else:
+        resultados = ejecutar_suite(args.repeticiones, args.semilla, args.filtro)
+
+    if args.comando == "guardar":
+        print(f"\nLínea base guardada en {guardar_base(args.nombre, resultados)}")
+        return 0
+
+    if not os.path.exists(ruta_base(args.nombre)):
+        print(f"No existe la línea base {args.nombre!r} (disponibles: {', '.join(listar_bases()) or 'ninguna'})")
+        return 2
+    base = cargar_resultados(ruta_base(args.nombre))
+    for aviso in diferencias_de_entorno(base, resultados):
+        print(f"AVISO: {aviso}")
+
+    filas = comparar(base, resultados, args.umbral, args.alfa)
+    print()
+    imprimir_comparacion(filas)
+    regresiones = [f["nombre"] for f in filas if f["veredicto"] == "regresion"]
+    if regresiones:
+        print(f"\n{len(regresiones)} regresión(es): {', '.join(regresiones)}")
+        return 1
+    print("\nSin regresiones.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+# SUITE.PY: Definición de los benchmarks del proyecto
+
+import contextlib
+import io
+import os
+import json
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import benchmark
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CEREBRO_JSON = os.path.join(RAIZ, "conocimiento_gato.json")
+CEREBRO_BINARIO = os.path.join(RAIZ, "conocimiento_gato.qtb")
+
+
+@contextlib.contextmanager
+def _silencio():
+    """Oculta los print del código medido (cargar/guardar/entrenar informan por consola)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+# --------------------
+# MOTOR DE REGLAS
+# --------------------
+@benchmark("logica.jugadas_por_segundo", "jugadas/s")
+def logica_jugadas(semilla, partidas=5000):
+    """Partidas al azar con LogicaTresRayas: realizar_movimiento + estado de la partida."""
+    from game.logic import LogicaTresRayas
+
+    rng = random.Random(semilla)
+    secuencias = [rng.sample(range(9), 9) for _ in range(partidas)]
+
+    jugadas = 0
+    inicio = time.perf_counter()
+    for secuencia in secuencias:
+        juego = LogicaTresRayas()
+        ficha = "X"
+        for mov in secuencia:
+            jugadas += 1
+            juego.realizar_movimiento(mov, ficha)
+            if juego.terminado:
+                break
+            ficha = "O" if ficha == "X" else "X"
+    return jugadas / (time.perf_counter() - inicio)
+
+
+# --------------------
+# BÚSQUEDA
+# --------------------
+@benchmark("minimax.arbol_completo_ms", "ms", mayor_es_mejor=False)
+def minimax_arbol_completo(semilla):
+    """Minimax recursivo desde el tablero vacío, con la memoización limpia."""
+    from game.ai import limpiar_cache, movimiento_minimax_recursivo
+
+    limpiar_cache()
+    inicio = time.perf_counter()
+    movimiento_minimax_recursivo([" "] * 9, "X")
+    return (time.perf_counter() - inicio) * 1000
+
+
+@benchmark("minimax.tablebase_resolver_ms", "ms", mayor_es_mejor=False)
+def tablebase_resolver(semilla):
+    from game.tablebase import Tablebase
+
+    inicio = time.perf_counter()
+    Tablebase.resolver()
+    return (time.perf_counter() - inicio) * 1000
+
+
+# --------------------
+# AGENTE
+# --------------------
+_POSICIONES = {}
+
+def _posiciones_no_terminales(semilla, n=5000):
+    """Muestra fija de posiciones alcanzables donde aún se puede jugar."""
+    if semilla not in _POSICIONES:
+        from game.estados import CODIGOS, NUM_ESTADOS, decodificar
+        from game.tablebase import obtener_tablebase
+
+        tablebase = obtener_tablebase()
+        abiertas = [s for s in range(NUM_ESTADOS) if tablebase.mejor_movimiento(s) is not None]
+        rng = random.Random(semilla)
+        elegidas = [rng.choice(abiertas) for _ in range(n)]
+        tableros = [decodificar(CODIGOS[s]) for s in elegidas]
+        _POSICIONES[semilla] = [(t, [i for i in range(9) if t[i] == " "]) for t in tableros]
+    return _POSICIONES[semilla]
+
+
+@benchmark("agente.obtener_accion_us", "us/jugada", mayor_es_mejor=False)
+def obtener_accion(semilla):
+    """Latencia de QAgent.obtener_accion en modo experto con el cerebro del repositorio."""
+    from game.ai import QAgent
+
+    with _silencio():
+        agente = QAgent(archivo=CEREBRO_JSON)
+    posiciones = _posiciones_no_terminales(semilla)
+    random.seed(semilla)
+
+    inicio = time.perf_counter()
+    for tablero, movimientos in posiciones:
+        agente.obtener_accion(tablero, movimientos, en_entrenamiento=False)
+    return (time.perf_counter() - inicio) / len(posiciones) * 1e6
+
+
+@benchmark("agente.politica_compilada_us", "us/jugada", mayor_es_mejor=False)
+def politica_compilada(semilla):
+    """Lo mismo con la política compilada (game/politica.py) del mismo cerebro."""
+    from game.ai import QAgent
+    from game.politica import PoliticaCompilada
+
+    with _silencio():
+        politica = PoliticaCompilada.desde_q_table(QAgent(archivo=CEREBRO_JSON).q_table)
+    posiciones = _posiciones_no_terminales(semilla)
+
+    inicio = time.perf_counter()
+    for tablero, movimientos in posiciones:
+        politica.obtener_accion(tablero, movimientos)
+    return (time.perf_counter() - inicio) / len(posiciones) * 1e6
+
+
+# --------------------
+# ENTRENAMIENTO
+# --------------------
+@benchmark("entrenamiento.episodios_por_segundo", "episodios/s")
+def entrenamiento_referencia(semilla, episodios=5000):
+    from game.ai import QAgent
+    from game.trainer import ejecutar_entrenamiento
+
+    random.seed(semilla)
+    agente = QAgent(cargar=False)
+    with _silencio():
+        inicio = time.perf_counter()
+        ejecutar_entrenamiento(episodios, agente=agente, guardar=False)
+    return episodios / (time.perf_counter() - inicio)
+
+
+@benchmark("entrenamiento.vectorizado_episodios_por_segundo", "episodios/s")
+def entrenamiento_vectorizado(semilla, episodios=50000):
+    from game.ai import QAgent
+    from game.trainer import ejecutar_entrenamiento_vectorizado
+
+    agente = QAgent(cargar=False)
+    with _silencio():
+        inicio = time.perf_counter()
+        ejecutar_entrenamiento_vectorizado(episodios, agente=agente, semilla=semilla, guardar=False)
+    return episodios / (time.perf_counter() - inicio)
+
+
+# --------------------
+# ARRANQUE
+# En un proceso nuevo, para que no cuenten módulos ya importados ni cachés llenos:
+# importar game.ai, cargar el cerebro principal y compilar su política, o leer
+# su .pol ya compilado (TIEMPOS_ARRANQUE de game/ai.py). Se corre en un
+# directorio temporal con una copia del cerebro, para elegir si hay .pol o no.
+# --------------------
+_SCRIPT_ARRANQUE = """
+import json, time
+inicio = time.perf_counter()
+import game.ai
+importar = time.perf_counter() - inicio
+from game.politica import obtener_politica
+obtener_politica()
+print(json.dumps(dict(game.ai.TIEMPOS_ARRANQUE, importar_game_ai=importar)))
+"""
+
+
+def _tiempos_arranque(con_politica=False):
+    from game.ai import QAgent
+    from game.politica import ARCHIVO_POLITICA, PoliticaCompilada
+
+    with tempfile.TemporaryDirectory() as directorio:
+        for origen in (CEREBRO_JSON, CEREBRO_BINARIO):
+            if os.path.exists(origen):
+                shutil.copy2(origen, directorio)
+        if con_politica:
+            with _silencio():
+                agente = QAgent(archivo=os.path.join(directorio, os.path.basename(CEREBRO_JSON)))
+            PoliticaCompilada.desde_q_table(agente.q_table).guardar(os.path.join(directorio, ARCHIVO_POLITICA))
+        entorno = dict(os.environ, PYTHONPATH=RAIZ)
+        salida = subprocess.run([sys.executable, "-c", _SCRIPT_ARRANQUE], cwd=directorio, env=entorno,
+                                check=True, capture_output=True, text=True).stdout
+    return json.loads(salida.strip().splitlines()[-1])  # antes van los print de la carga
+
+
+@benchmark("arranque.importar_game_ai_ms", "ms", mayor_es_mejor=False)
+def arranque_importar(semilla):
+    """import game.ai en un intérprete nuevo (no lee ningún cerebro)."""
+    return _tiempos_arranque()["importar_game_ai"] * 1000
+
+
+@benchmark("arranque.cargar_cerebro_ms", "ms", mayor_es_mejor=False)
+def arranque_cargar(semilla):
+    """Primer obtener_agente(): construir el QAgent principal y leer su cerebro."""
+    return _tiempos_arranque()["cargar_principal"] * 1000
+
+
+@benchmark("arranque.compilar_politica_ms", "ms", mayor_es_mejor=False)
+def arranque_compilar(semilla):
+    """Primer obtener_politica() sin .pol: compilar la Tabla Q del cerebro principal."""
+    return _tiempos_arranque()["compilar_principal"] * 1000
+
+
+@benchmark("arranque.cargar_politica_ms", "ms", mayor_es_mejor=False)
+def arranque_cargar_politica(semilla):
+    """Primer obtener_politica() con conocimiento_gato.pol al día: leerlo sin cargar el cerebro."""
+    return _tiempos_arranque(con_politica=True)["cargar_politica_principal"] * 1000
+
+
+# --------------------
+# PERSISTENCIA
+# Cada medición copia el cerebro a un directorio temporal con un solo formato,
+# para que cargar_conocimiento no pueda elegir el otro.
+# --------------------
+def _cargar_desde(origen):
+    from game.ai import QAgent
+
+    with tempfile.TemporaryDirectory() as directorio:
+        destino = os.path.join(directorio, os.path.basename(origen))
+        shutil.copyfile(origen, destino)
+        agente = QAgent(cargar=False, archivo=os.path.join(directorio, "conocimiento_gato.json"))
+        with _silencio():
+            inicio = time.perf_counter()
+            agente.cargar_conocimiento()
+            duracion = time.perf_counter() - inicio
+        if not agente.q_table:
+            raise RuntimeError(f"No se pudo cargar {origen}")
+    return duracion * 1000
+
+
+@benchmark("persistencia.cargar_json_ms", "ms", mayor_es_mejor=False)
+def cargar_json(semilla):
+    return _cargar_desde(CEREBRO_JSON)
+
+
+@benchmark("persistencia.cargar_binario_ms", "ms", mayor_es_mejor=False)
+def cargar_binario(semilla):
+    return _cargar_desde(CEREBRO_BINARIO)
+
+
+@benchmark("persistencia.guardar_ms", "ms", mayor_es_mejor=False)
+def guardar(semilla):
+    """guardar_conocimiento escribe el binario (el JSON es opcional, guardar_json=True)."""
+    from game.ai import QAgent
+    from game.persistencia import leer_q_table
+
+    q_table = leer_q_table(CEREBRO_BINARIO)
+    with tempfile.TemporaryDirectory() as directorio:
+        agente = QAgent(cargar=False, archivo=os.path.join(directorio, "conocimiento_gato.json"))
+        agente.q_table = q_table
+        with _silencio():
+            inicio = time.perf_counter()
+            agente.guardar_conocimiento()
+            return (time.perf_counter() - inicio) * 1000
+
+
+# --------------------
+# INTERFAZ (SDL sin ventana ni audio)
+# --------------------
+_UI = {}
+
+def _interfaz():
+    if "ui" not in _UI:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from ui.interface import InterfazGrafica
+
+        _UI["ui"] = InterfazGrafica()
+    return _UI["ui"]
+
+
+_TABLERO_UI = ["X", "O", "X", " ", "O", " ", " ", " ", "X"]
+
+@benchmark("interfaz.frame_humano_ms", "ms/frame", mayor_es_mejor=False)
+def frame_humano(semilla, frames=200):
+    ui = _interfaz()
+    inicio = time.perf_counter()
+    for _ in range(frames):
+        ui.dibujar_interfaz_humano(_TABLERO_UI, "Tu turno (O)", 3, 2, 1)
+    return (time.perf_counter() - inicio) / frames * 1000
+
+
+@benchmark("interfaz.frame_minimax_ms", "ms/frame", mayor_es_mejor=False)
+def frame_minimax(semilla, frames=200):
+    ui = _interfaz()
+    inicio = time.perf_counter()
+    for _ in range(frames):
+        ui.dibujar_interfaz_minimax(_TABLERO_UI, "Turno: Q-Learning (X)", 3, 2, 1, [])
+    return (time.perf_counter() - inicio) / frames * 1000
+
+
+# --------------------
+# TELEMETRÍA
+# sobrecosto_desactivada_pct: QAgent con telemetria = None (y sin diario ni visitas)
+# contra un agente con los cuerpos de obtener_accion/aprender sin ningún gancho,
+# jugando los mismos episodios con la misma semilla. sobrecosto_activa_pct: lo que
+# cuesta tenerla activa escribiendo JSONL.
+# --------------------
+def _agente_sin_ganchos():
+    """QAgent con obtener_accion/aprender como antes de telemetría, diario y visitas."""
+    from game.ai import QAgent
+
+    class QAgentSinGanchos(QAgent):
+        def obtener_accion(self, tablero, movimientos_posibles, en_entrenamiento=True):
+            estado = self.obtener_estado(tablero)
+            if en_entrenamiento and random.uniform(0, 1) < self.epsilon:
+                return random.choice(movimientos_posibles)
+            if estado not in self.q_table:
+                self.q_table[estado] = {mov: 0.0 for mov in movimientos_posibles}
+            valores_movimientos = self.q_table[estado]
+            valores_validos = {m: valores_movimientos.get(m, 0.0) for m in movimientos_posibles}
+            max_valor = max(valores_validos.values())
+            return random.choice([m for m, v in valores_validos.items() if v == max_valor])
+
+        def aprender(self, estado_actual, accion, recompensa, estado_siguiente, movimientos_siguientes, termino_juego):
+            estado_t = self.obtener_estado(estado_actual)
+            estado_t1 = self.obtener_estado(estado_siguiente)
+            if estado_t not in self.q_table:
+                self.q_table[estado_t] = {accion: 0.0}
+            if estado_t1 not in self.q_table:
+                self.q_table[estado_t1] = {m: 0.0 for m in movimientos_siguientes}
+            q_actual = self.q_table[estado_t].get(accion, 0.0)
+            if termino_juego:
+                max_q_futuro = 0.0
+            else:
+                vals_siguientes = [self.q_table[estado_t1].get(m, 0.0) for m in movimientos_siguientes]
+                max_q_futuro = max(vals_siguientes) if vals_siguientes else 0.0
+            self.q_table[estado_t][accion] = q_actual + self.alpha * (recompensa + (self.gamma * max_q_futuro) - q_actual)
+
+    return QAgentSinGanchos(cargar=False)
+
+
+@benchmark("telemetria.sobrecosto_desactivada_pct", "%", mayor_es_mejor=False)
+def telemetria_desactivada(semilla, episodios=10000, bloque=250):
+    from game.ai import QAgent
+    from game.trainer import jugar_episodio_entrenamiento
+
+    # Los dos agentes juegan los mismos episodios (cada uno con su propio estado de
+    # `random`) alternando bloques cortos, y se toma la mediana de la razón por bloque:
+    # así el ruido de la máquina afecta a ambos por igual.
+    agentes = {"ganchos": QAgent(cargar=False), "sin_ganchos": _agente_sin_ganchos()}
+    random.seed(semilla)
+    estados_rng = {nombre: random.getstate() for nombre in agentes}
+    razones = []
+    for primero in range(1, episodios + 1, bloque):
+        duraciones = {}
+        for nombre, agente in agentes.items():
+            random.setstate(estados_rng[nombre])
+            inicio = time.perf_counter()
+            for i in range(primero, min(primero + bloque, episodios + 1)):
+                jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+                agente.reducir_epsilon()
+            duraciones[nombre] = time.perf_counter() - inicio
+            estados_rng[nombre] = random.getstate()
+        razones.append(duraciones["ganchos"] / duraciones["sin_ganchos"])
+    assert agentes["ganchos"].q_table == agentes["sin_ganchos"].q_table  # mismo trabajo
+    return (statistics.median(razones) - 1) * 100
+
+
+@benchmark("telemetria.sobrecosto_activa_pct", "%", mayor_es_mejor=False)
+def telemetria_sobrecosto(semilla, episodios=5000):
+    from game.ai import QAgent
+    from game.telemetria import Telemetria
+    from game.trainer import ejecutar_entrenamiento
+
+    duraciones = {}
+    with tempfile.TemporaryDirectory() as directorio:
+        for activa in (False, True):
+            random.seed(semilla)
+            agente = QAgent(cargar=False)
+            telemetria = Telemetria(os.path.join(directorio, "telemetria.jsonl"), intervalo=0.05) if activa else None
+            with _silencio():
+                inicio = time.perf_counter()
+                ejecutar_entrenamiento(episodios, agente=agente, guardar=False, telemetria=telemetria)
+                duraciones[activa] = time.perf_counter() - inicio
+    return (duraciones[True] / duraciones[False] - 1) * 100
@@ -2,7 +2,8 @@ import time
 import os
 import datetime
 from game.logic import LogicaTresRayas
-from game.ai import agente_global, obtener_movimiento_minimax_adaptable
+from game.ai import obtener_movimiento_minimax_adaptable
+from game.politica import obtener_politica
 
 # Generamos un nombre de archivo único con la hora actual
 TIMESTAMP = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -39,9 +40,9 @@ def ejecutar_duelo():
     juego = LogicaTresRayas()
     turno = "X"
     
-    # Modo Serio
-    agente_global.epsilon = 0.0
-    log(f"🧠 Cerebro Q-Learning cargado. Epsilon: {agente_global.epsilon}")
+    # Modo Serio: política greedy compilada (sin exploración y sin tocar la Tabla Q)
+    agente = obtener_politica()
+    log("🧠 Cerebro Q-Learning cargado y compilado. Epsilon: 0.0")
     log(f"📂 El historial se guardará en: {ARCHIVO_LOG}")
     
     time.sleep(2)
@@ -63,7 +64,7 @@ def ejecutar_duelo():
             time.sleep(1)
             
             movimientos_validos = juego.obtener_movimientos_posibles()
-            accion = agente_global.obtener_accion(juego.tablero, movimientos_validos, en_entrenamiento=False)
+            accion = agente.obtener_accion(juego.tablero, movimientos_validos)
             
             log(f"🤖 Q-Learning elige casilla: {accion}")
             juego.realizar_movimiento(accion, "X")
@@ -1,10 +1,12 @@
 import random
 import os
-import json
-import ast
 import time
 from copy import deepcopy
 from game.logic import LogicaTresRayas
+from game.diario import DiarioQ, rutas_diarios
+from game.estados import codificar, indice_estado
+from game.persistencia import escribir_binario, escribir_json, leer_q_table
+from game.tablebase import indice_si_alcanzable, obtener_tablebase
 
 # =============================================================================
 #  MÓDULO DE INTELIGENCIA ARTIFICIAL (CEREBRO DEL AGENTE)
@@ -18,9 +20,11 @@ from game.logic import LogicaTresRayas
 # =============================================================================
 
 ARCHIVO_Q_TABLE = "conocimiento_gato.json"
+ARCHIVO_Q_TABLE_BINARIO = "conocimiento_gato.qtb"
 
 class QAgent:
-    def __init__(self, alpha=0.5, gamma=0.9, epsilon=1.0):
+    def __init__(self, alpha=0.5, gamma=0.9, epsilon=1.0, cargar=True, archivo=ARCHIVO_Q_TABLE,
+                 epsilon_min=0.01, epsilon_decay=0.9995, guardar_json=False):
         """
         Inicializa al agente de Aprendizaje por Refuerzo (Q-Learning).
         
@@ -31,6 +35,13 @@ class QAgent:
                           (Visionario vs Miope).
         :param epsilon (ε): Tasa de Exploración. Probabilidad de tomar una acción aleatoria 
                             para descubrir nuevas estrategias.
+        :param cargar: Si es False el agente arranca con la Tabla Q vacía (Tabula Rasa)
+                       en lugar de leer el cerebro guardado.
+        :param archivo: JSON del cerebro; su copia binaria es el mismo nombre con extensión .qtb.
+        :param epsilon_min: Piso de la exploración tras el decay.
+        :param epsilon_decay: Factor por el que se multiplica epsilon al final de cada episodio.
+        :param guardar_json: Si es True, guardar_conocimiento también escribe el JSON indentado
+                             (el binario .qtb se escribe siempre).
         """
         # Ref PDF (Pág. 5): "La Estructura de Memoria: La Tabla Q".
         # Es una Lookup Table que mapea Estados (S) -> Valores de Acciones (Q).
@@ -39,14 +50,41 @@ class QAgent:
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
-        self.epsilon_min = 0.01
-        self.epsilon_decay = 0.9995 
+        self.epsilon_min = epsilon_min
+        self.epsilon_decay = epsilon_decay
         
-        self.cargar_conocimiento()
+        self.archivo = archivo
+        self.archivo_binario = os.path.splitext(archivo)[0] + ".qtb"
+        self.guardar_json = guardar_json
+        
+        # Conteo opcional de actualizaciones por (estado, acción): None = desactivado.
+        # Lo usa el entrenamiento paralelo para promediar tablas ponderando por visitas.
+        self.visitas = None
+
+        # Telemetría opcional (game/telemetria.py): None = desactivada, sin costo extra
+        self.telemetria = None
+
+        # Diario opcional (game/diario.py): guardar_conocimiento solo escribe los
+        # estados de `cambios` en vez de reescribir toda la tabla. None = desactivado.
+        self.diario = None
+        self.cambios = None
+        
+        if cargar:
+            self.cargar_conocimiento()
 
     def obtener_estado(self, tablero):
-        """Convierte el tablero (Lista) en una Tupla (Inmutable) para usarla como clave en el Diccionario (Tabla Q)."""
-        return tuple(tablero)
+        """
+        Convierte el tablero (Lista) en el índice denso de su posición (game/estados.py)
+        para usarlo como clave en el Diccionario (Tabla Q). Un entero pequeño se hashea y
+        ocupa mucho menos que una tupla de 9 strings.
+        Precondición: el tablero debe ser alcanzable en una partida (empieza X, se alternan
+        turnos y nadie sigue jugando tras una línea); si no, lanza ValueError con el tablero.
+        """
+        try:
+            return indice_estado(tablero)
+        except ValueError:
+            raise ValueError(f"El tablero {list(tablero)} no es una posición alcanzable "
+                             "del Tres en Raya y no tiene estado en la Tabla Q") from None
 
     def obtener_accion(self, tablero, movimientos_posibles, en_entrenamiento=True):
         """
@@ -69,8 +107,16 @@ class QAgent:
         # El agente consulta su Tabla Q y elige la acción con el valor más alto (Max Q).
         
         # Si el estado es nuevo, lo inicializamos en 0 (Tabula Rasa).
+        telemetria = self.telemetria
+        if telemetria is not None:
+            telemetria.consultas += 1
         if estado not in self.q_table:
             self.q_table[estado] = {mov: 0.0 for mov in movimientos_posibles}
+            if self.cambios is not None:
+                self.cambios.add(estado)
+            if telemetria is not None:
+                telemetria.fallos += 1
+                telemetria.nuevos_estados += 1
 
         valores_movimientos = self.q_table[estado]
         valores_validos = {m: valores_movimientos.get(m, 0.0) for m in movimientos_posibles}
@@ -92,10 +138,13 @@ class QAgent:
         estado_t1 = self.obtener_estado(estado_siguiente)
 
         # Asegurar que los estados existan en la memoria
+        nuevos = 0
         if estado_t not in self.q_table:
             self.q_table[estado_t] = {accion: 0.0}
+            nuevos += 1
         if estado_t1 not in self.q_table:
             self.q_table[estado_t1] = {m: 0.0 for m in movimientos_siguientes}
+            nuevos += 1
 
         # 1. Obtener Q(s,a) -> Valor Antiguo (Lo que creíamos saber)
         q_actual = self.q_table[estado_t].get(accion, 0.0)
@@ -114,6 +163,24 @@ class QAgent:
         # 4. Actualizar la Tabla Q
         self.q_table[estado_t][accion] = nuevo_q
 
+        if self.cambios is not None:
+            # El estado actualizado y, si se acaba de crear, el siguiente
+            self.cambios.add(estado_t)
+            if nuevos:
+                self.cambios.add(estado_t1)
+
+        if self.visitas is not None:
+            clave = (estado_t, accion)
+            self.visitas[clave] = self.visitas.get(clave, 0) + 1
+
+        telemetria = self.telemetria
+        if telemetria is not None:
+            # Dos consultas por actualización: Q(s, ·) y Q(s', ·)
+            telemetria.actualizaciones += 1
+            telemetria.consultas += 2
+            telemetria.fallos += nuevos
+            telemetria.nuevos_estados += nuevos
+
     def reducir_epsilon(self):
         """
         Decay de Epsilon: Reduce gradualmente la curiosidad.
@@ -124,73 +191,170 @@ class QAgent:
             self.epsilon *= self.epsilon_decay
 
     def guardar_conocimiento(self):
-        """Persistencia de datos: Guarda la Tabla Q en un archivo JSON."""
+        """
+        Persistencia de datos: Guarda la Tabla Q en el binario .qtb (game/persistencia.py),
+        que es el que se usa al arrancar, y con guardar_json=True también en el JSON indentado.
+        Ambos se escriben de forma atómica.
+        Con un diario adjunto (game/diario.py) solo agrega los estados que cambiaron.
+        """
+        if self.diario is not None:
+            # tabla_q: con QAgentNumpy el diario lee solo las filas que cambiaron
+            registros = self.diario.guardar(tabla_q(self), self.cambios)
+            print(f" Diario actualizado: {len(self.cambios)} estados, {registros} registros.")
+            self.cambios.clear()
+            return
         try:
-            data_para_json = {str(k): v for k, v in self.q_table.items()}
-            with open(ARCHIVO_Q_TABLE, "w") as f:
-                json.dump(data_para_json, f, indent=4)
-            print(f" Cerebro guardado en {ARCHIVO_Q_TABLE} ({len(self.q_table)} estados).")
+            q_table = self.q_table
+            escribir_binario(q_table, self.archivo_binario)
+            if self.guardar_json:
+                escribir_json(q_table, self.archivo)
+            print(f" Cerebro guardado en {self.archivo_binario} ({len(q_table)} estados).")
         except Exception as e:
             print(f" Error guardando cerebro: {e}")
 
     def cargar_conocimiento(self):
-        """Carga la Tabla Q para jugar usando el conocimiento previo."""
-        if os.path.exists(ARCHIVO_Q_TABLE):
+        """
+        Carga la Tabla Q para jugar usando el conocimiento previo.
+        Si se entrenó con diario (game/diario.py) reconstruye la tabla desde la base
+        .qtb y sus diarios .qlog, que es donde quedaron los últimos guardados.
+        Si no, prefiere el binario mapeable si existe y no es más viejo que el JSON;
+        si no, lee el JSON histórico.
+        """
+        if rutas_diarios(self.archivo_binario):
+            diario = DiarioQ(self.archivo_binario)
             try:
-                with open(ARCHIVO_Q_TABLE, "r") as f:
-                    data_cargada = json.load(f)
-                
+                self.q_table = diario.cargar()
+                print(f"Cerebro cargado (base + diario): {len(self.q_table)} estados aprendidos.")
+                self.epsilon = 0.0
+            except Exception as e:
+                print(f" Error cargando cerebro {self.archivo_binario} con su diario: {e}")
                 self.q_table = {}
-                for k_str, v in data_cargada.items():
-                    # Reconstruye la tupla del estado desde el string del JSON
-                    key_tupla = ast.literal_eval(k_str)
-                    valores_int = {int(m): valor for m, valor in v.items()}
-                    self.q_table[key_tupla] = valores_int
-                    
+            finally:
+                diario.cerrar()
+            return
+
+        ruta = self.archivo
+        if os.path.exists(self.archivo_binario) and (
+            not os.path.exists(self.archivo)
+            or os.path.getmtime(self.archivo_binario) >= os.path.getmtime(self.archivo)
+        ):
+            ruta = self.archivo_binario
+
+        if os.path.exists(ruta):
+            try:
+                self.q_table = leer_q_table(ruta)
                 print(f"Cerebro cargado: {len(self.q_table)} estados aprendidos.")
                 # IMPORTANTE: Si cargamos un cerebro, asumimos que ya sabe jugar.
                 # Bajamos Epsilon a 0.0 para que juegue en modo "Experto" (Solo Explotación).
                 self.epsilon = 0.0 
             except Exception as e:
-                print(f" Error cargando cerebro JSON: {e}")
+                print(f" Error cargando cerebro {ruta}: {e}")
                 self.q_table = {}
         else:
             print("No hay cerebro guardado.")
 
-# Instancia global del Q-Agent
-agente_global = QAgent()
+def tabla_q(agente):
+    """
+    Tabla Q del agente para leerla sin copiarla: la TablaQNumpy de QAgentNumpy
+    (cuyo `q_table` arma un diccionario nuevo en cada acceso) o el diccionario de los demás.
+    """
+    tabla = getattr(agente, "tabla", None)
+    return tabla if tabla is not None else agente.q_table
+
+# =============================================================================
+# REGISTRO DE AGENTES (carga perezosa)
+# =============================================================================
+# Importar este módulo ya no lee ningún cerebro: cada agente se construye y
+# carga la primera vez que se pide con obtener_agente(nombre), y queda cacheado.
+# Se pueden registrar varios cerebros con nombre (por ejemplo para comparar dos
+# entrenamientos). TIEMPOS_ARRANQUE guarda, en segundos, cuánto costó cargar
+# cada cerebro (y compilar su política, game/politica.py); `python main.py --tiempos`
+# los muestra al salir y `python -m benchmarks --filtro arranque` los mide en un
+# proceso nuevo junto con el costo de importar este módulo.
+
+TIEMPOS_ARRANQUE = {}
+
+_CEREBROS = {"principal": {"archivo": ARCHIVO_Q_TABLE, "clase": QAgent}}
+_AGENTES = {}
+
+def registrar_cerebro(nombre, archivo, clase=QAgent):
+    """Declara un cerebro con nombre; no se lee del disco hasta que se use."""
+    _CEREBROS[nombre] = {"archivo": archivo, "clase": clase}
+    _AGENTES.pop(nombre, None)
+
+def archivo_cerebro(nombre="principal"):
+    """Archivo JSON del cerebro registrado con ese nombre (sin leerlo)."""
+    return _CEREBROS[nombre]["archivo"]
+
+def obtener_agente(nombre="principal"):
+    """Devuelve el agente registrado con ese nombre, construyéndolo y cargándolo en el primer uso."""
+    if nombre not in _AGENTES:
+        cerebro = _CEREBROS[nombre]
+        inicio = time.perf_counter()
+        _AGENTES[nombre] = cerebro["clase"](archivo=cerebro["archivo"])
+        TIEMPOS_ARRANQUE[f"cargar_{nombre}"] = time.perf_counter() - inicio
+    return _AGENTES[nombre]
+
+def agentes_cargados():
+    return dict(_AGENTES)
+
+def __getattr__(nombre):
+    # Compatibilidad: `agente_global` sigue existiendo, pero se resuelve al usarlo
+    if nombre == "agente_global":
+        return obtener_agente()
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 
 # =============================================================================
 # SECCIÓN 2: ALGORITMO MINIMAX (El Dios Calculador - Benchmark)
 # =============================================================================
-# Implementación clásica recursiva para comparar contra el Q-Learning.
+# Las posiciones alcanzables se resuelven una sola vez en game/tablebase.py
+# (análisis retrógrado), así que minimax y el wrapper adaptable son consultas O(1).
+# La implementación clásica recursiva se conserva como referencia y como respaldo
+# para tableros que no son alcanzables desde una partida normal.
 
 CACHE_MINIMAX = {}
 
 def limpiar_cache():
-    """Limpia la memoria de memoización del Minimax."""
+    """Limpia la memoria de memoización del Minimax recursivo (la tablebase no cambia entre partidas)."""
     CACHE_MINIMAX.clear()
 
-def minimax(tablero, profundidad, es_turno_max):
+def minimax(tablero, profundidad, es_turno_max, variante=None):
     """
     Algoritmo Minimax.
+    Devuelve el puntaje de la jugada matemáticamente perfecta, ponderado por profundidad.
+    Con una `variante` m,n,k (game/mnk.py) distinta del 3x3 se usa el motor Negamax.
+    """
+    if variante is not None and not variante.es_estandar:
+        return _minimax_variante(tablero, profundidad, es_turno_max, variante)
+    indice = indice_si_alcanzable(tablero, es_turno_max)
+    if indice is None:
+        return minimax_recursivo(tablero, profundidad, es_turno_max)
+    return obtener_tablebase().puntaje(indice, profundidad)
+
+def minimax_recursivo(tablero, profundidad, es_turno_max):
+    """
+    Algoritmo Minimax clásico.
     Explora el árbol de juego completo para encontrar la jugada matemáticamente perfecta.
     """
-    estado_clave = (tuple(tablero), es_turno_max)
+    juego = LogicaTresRayas()
+    juego.establecer_tablero(tablero)
+    return _minimax_en_juego(juego, profundidad, es_turno_max)
+
+def _minimax_en_juego(juego, profundidad, es_turno_max):
+    # Un único tablero mutable: cada rama juega con realizar_movimiento y lo
+    # restaura con deshacer_movimiento, sin copiar listas.
+    # El puntaje depende de la profundidad, así que también forma parte de la clave
+    estado_clave = (codificar(juego.tablero) * 2 + es_turno_max) * 10 + profundidad
     if estado_clave in CACHE_MINIMAX:
         return CACHE_MINIMAX[estado_clave]
 
-    juego = LogicaTresRayas()
-    juego.tablero = list(tablero)
-    ganador = juego.verificar_ganador()
-
     # Función de Utilidad Ponderada por Profundidad
-    if ganador == "X":
+    if juego.ganador == "X":
         return 10 - profundidad # Ganar rápido es mejor
-    elif ganador == "O":
+    elif juego.ganador == "O":
         return profundidad - 10 # Perder lento es mejor (si es inevitable)
-    elif not juego.existe_espacio_libre():
+    elif juego.terminado:
         return 0
 
     movimientos = juego.obtener_movimientos_posibles()
@@ -198,25 +362,60 @@ def minimax(tablero, profundidad, es_turno_max):
     if es_turno_max: # Turno de Maximizar (X)
         mejor_puntaje = -float('inf')
         for mov in movimientos:
-            juego.tablero[mov] = "X"
-            puntaje = minimax(juego.tablero, profundidad + 1, False)
-            juego.tablero[mov] = " "
+            juego.realizar_movimiento(mov, "X")
+            puntaje = _minimax_en_juego(juego, profundidad + 1, False)
+            juego.deshacer_movimiento()
             mejor_puntaje = max(mejor_puntaje, puntaje)
     else: # Turno de Minimizar (O)
         mejor_puntaje = float('inf')
         for mov in movimientos:
-            juego.tablero[mov] = "O"
-            puntaje = minimax(juego.tablero, profundidad + 1, True)
-            juego.tablero[mov] = " "
+            juego.realizar_movimiento(mov, "O")
+            puntaje = _minimax_en_juego(juego, profundidad + 1, True)
+            juego.deshacer_movimiento()
             mejor_puntaje = min(mejor_puntaje, puntaje)
     
     CACHE_MINIMAX[estado_clave] = mejor_puntaje
     return mejor_puntaje
 
-def obtener_movimiento_minimax_adaptable(tablero, ficha_jugador):
+def obtener_movimiento_minimax_adaptable(tablero, ficha_jugador, variante=None, tiempo_limite=1.0):
     """
     Wrapper para permitir que Minimax juegue como 'X' o 'O' en el duelo de IAs.
+    En variantes m,n,k grandes el árbol no se puede resolver entero: el motor
+    Negamax profundiza hasta agotar `tiempo_limite` segundos.
     """
+    if variante is not None and not variante.es_estandar:
+        from game.mnk import mejor_movimiento_mnk
+        return mejor_movimiento_mnk(variante, tablero, tiempo_limite=tiempo_limite)[0]
+
+    es_maximizador = (ficha_jugador == "X")
+    indice = indice_si_alcanzable(tablero, es_maximizador)
+    if indice is not None:
+        return obtener_tablebase().mejor_movimiento(indice)
+
+    return movimiento_minimax_recursivo(tablero, ficha_jugador)
+
+def _minimax_variante(tablero, profundidad, es_turno_max, variante, tiempo_limite=1.0):
+    """Puntaje de una variante m,n,k en la misma escala que minimax (positivo = gana X)."""
+    from game.mnk import mejor_movimiento_mnk
+
+    juego = variante.crear_juego()
+    for i, ficha in enumerate(tablero):
+        if ficha != " ":
+            juego.realizar_movimiento(i, ficha)
+    victoria = variante.num_casillas + 1
+    if juego.hay_ganador():
+        return (victoria - profundidad) if juego.ganador == "X" else (profundidad - victoria)
+    if not juego.existe_espacio_libre():
+        return 0
+
+    _, puntaje = mejor_movimiento_mnk(variante, tablero, tiempo_limite=tiempo_limite)
+    # El motor puntúa desde quien mueve y a distancia de la raíz: se pasa a la escala de X
+    if puntaje:
+        puntaje -= profundidad if puntaje > 0 else -profundidad
+    return puntaje if es_turno_max else -puntaje
+
+def movimiento_minimax_recursivo(tablero, ficha_jugador):
+    """Elige la jugada explorando el árbol con minimax_recursivo (sin tablebase)."""
     mejor_movimiento = None
     es_maximizador = (ficha_jugador == "X")
     
@@ -225,23 +424,23 @@ def obtener_movimiento_minimax_adaptable(tablero, ficha_jugador):
     else:
         mejor_puntaje = float('inf')
 
-    for movimiento in range(9):
-        if tablero[movimiento] == " ":
-            tablero_copia = list(tablero)
-            tablero_copia[movimiento] = ficha_jugador
-            
-            # Se invierte el turno para la llamada recursiva
-            puntaje = minimax(tablero_copia, 0, not es_maximizador)
-            
-            if es_maximizador:
-                if puntaje > mejor_puntaje:
-                    mejor_puntaje = puntaje
-                    mejor_movimiento = movimiento
-            else:
-                if puntaje < mejor_puntaje:
-                    mejor_puntaje = puntaje
-                    mejor_movimiento = movimiento
-                    
+    juego = LogicaTresRayas()
+    juego.establecer_tablero(tablero)
+    for movimiento in juego.obtener_movimientos_posibles():
+        juego.realizar_movimiento(movimiento, ficha_jugador)
+        # Se invierte el turno para la llamada recursiva
+        puntaje = _minimax_en_juego(juego, 0, not es_maximizador)
+        juego.deshacer_movimiento()
+        
+        if es_maximizador:
+            if puntaje > mejor_puntaje:
+                mejor_puntaje = puntaje
+                mejor_movimiento = movimiento
+        else:
+            if puntaje < mejor_puntaje:
+                mejor_puntaje = puntaje
+                mejor_movimiento = movimiento
+                
     return mejor_movimiento
 
 # =============================================================================
@@ -290,4 +489,4 @@ def generar_arbol_visual(historial):
             
         return nodos_hermanos
 
-    return construir_nivel_recursivo([" "]*9, 0)
\ No newline at end of file
+    return construir_nivel_recursivo([" "]*9, 0)
@@ -0,0 +1,322 @@
+# ARENA.PY: Series masivas de partidas agente contra agente, sin interfaz gráfica
+
+import argparse
+import importlib
+import json
+import math
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+from game.logic import LogicaTresRayas
+
+# =============================================================================
+#  ARENA DE DUELOS
+# =============================================================================
+#  duel_test.py juega una sola partida "a cámara lenta" para verla en consola.
+#  La arena juega cientos de miles de partidas entre dos agentes cualesquiera
+#  y sirve como prueba de regresión del cerebro (calidad) y del código (velocidad):
+#  - Aperturas aleatorias: las primeras `aperturas` jugadas se sortean, y cada
+#    apertura se juega dos veces cambiando de bando (A con X y luego A con O).
+#  - Reparto en procesos: cada proceso construye sus propios jugadores a partir
+#    del nombre (los cerebros no viajan entre procesos) y juega bloques de partidas.
+#  - Por cada bloque terminado se imprime V/E/D de A, partidas por segundo y los
+#    percentiles de latencia por jugada de cada agente.
+#
+#  Uso: python -m game.arena qlearning minimax --partidas 100000 --workers 4 --min-puntaje 0.5
+#  (sale con código 1 si se cruza algún umbral). Ojo: una apertura al azar puede
+#  dejar una posición ya perdida, así que incluso dos agentes perfectos se ganan
+#  entre sí; para exigir cero derrotas contra Minimax use --aperturas 0.
+# =============================================================================
+
+# --------------------
+# JUGADORES
+# Un jugador es una función (tablero, ficha, movimientos) -> casilla.
+# Cada nombre se asocia a una fábrica fabrica(rng) -> jugador; también se
+# acepta "modulo:funcion" para probar motores nuevos sin tocar este archivo.
+# --------------------
+def _crear_qlearning(rng):
+    from game.ai import obtener_agente
+
+    agente = obtener_agente()
+    agente.epsilon = 0.0
+    return lambda tablero, ficha, movimientos: agente.obtener_accion(tablero, movimientos, en_entrenamiento=False)
+
+def _crear_politica(rng):
+    from game.politica import obtener_politica
+
+    politica = obtener_politica()
+    return lambda tablero, ficha, movimientos: politica.obtener_accion(tablero, movimientos)
+
+def _crear_minimax(rng):
+    from game.ai import obtener_movimiento_minimax_adaptable
+
+    return lambda tablero, ficha, movimientos: obtener_movimiento_minimax_adaptable(tablero, ficha)
+
+def _crear_aleatorio(rng):
+    # Usa el `random` global, que cada bloque siembra con su propia semilla
+    return lambda tablero, ficha, movimientos: random.choice(movimientos)
+
+def _crear_negamax(rng):
+    from game.bitboard import LogicaBitboard
+    from game.busqueda import MotorNegamax
+
+    # El motor conserva su tabla de transposición entre jugadas y partidas
+    motor = MotorNegamax()
+    juego = LogicaBitboard()
+
+    def jugar(tablero, ficha, movimientos):
+        juego.tablero = tablero
+        return motor.buscar(juego)[0]
+    return jugar
+
+FABRICAS = {
+    "qlearning": _crear_qlearning,
+    "politica": _crear_politica,
+    "minimax": _crear_minimax,
+    "aleatorio": _crear_aleatorio,
+    "negamax": _crear_negamax,
+}
+
+def registrar_jugador(nombre, fabrica):
+    """Añade un jugador a la arena: fabrica(rng) debe devolver (tablero, ficha, movimientos) -> casilla."""
+    FABRICAS[nombre] = fabrica
+
+def crear_jugador(nombre, rng):
+    if nombre in FABRICAS:
+        return FABRICAS[nombre](rng)
+    if ":" in nombre:
+        modulo, funcion = nombre.split(":", 1)
+        return getattr(importlib.import_module(modulo), funcion)(rng)
+    raise ValueError(f"Jugador desconocido: {nombre!r} (disponibles: {', '.join(FABRICAS)})")
+
+
+# --------------------
+# HISTOGRAMA DE LATENCIAS
+# Cubetas logarítmicas (16 por potencia de 2, ~4% de resolución): ocupa lo mismo
+# con mil que con millones de jugadas y los de varios procesos se suman.
+# --------------------
+_CUBETAS_POR_OCTAVA = 16
+
+class Histograma:
+    def __init__(self, cubetas=None):
+        self.cubetas = cubetas if cubetas is not None else {}
+
+    def registrar(self, ns):
+        cubeta = int(math.log2(ns) * _CUBETAS_POR_OCTAVA) if ns > 1 else 0
+        self.cubetas[cubeta] = self.cubetas.get(cubeta, 0) + 1
+
+    def fusionar(self, cubetas):
+        for cubeta, n in cubetas.items():
+            self.cubetas[cubeta] = self.cubetas.get(cubeta, 0) + n
+
+    @property
+    def total(self):
+        return sum(self.cubetas.values())
+
+    def percentil(self, p):
+        """Latencia en microsegundos por debajo de la cual queda el p% de las jugadas."""
+        total = self.total
+        if not total:
+            return 0.0
+        objetivo = p / 100 * total
+        acumulado = 0
+        for cubeta in sorted(self.cubetas):
+            acumulado += self.cubetas[cubeta]
+            if acumulado >= objetivo:
+                return 2 ** ((cubeta + 0.5) / _CUBETAS_POR_OCTAVA) / 1000
+        return 0.0
+
+    def resumen(self):
+        return {"p50": self.percentil(50), "p90": self.percentil(90), "p99": self.percentil(99)}
+
+
+# --------------------
+# PARTIDAS
+# Con 9 jugadas el tablero queda lleno (la partida ya terminó), así que una
+# apertura tiene como mucho 8; con 8 la mayoría de los sorteos terminan antes
+# en victoria y se repiten, pero siempre hay secuencias válidas.
+# --------------------
+MAX_APERTURA = 8
+
+def validar_aperturas(jugadas):
+    if not 0 <= jugadas <= MAX_APERTURA:
+        raise ValueError(f"La apertura debe tener entre 0 y {MAX_APERTURA} jugadas (se pidieron {jugadas})")
+    return jugadas
+
+def generar_apertura(rng, jugadas):
+    """Secuencia de `jugadas` casillas al azar que no termina la partida."""
+    validar_aperturas(jugadas)
+    while True:
+        juego = LogicaTresRayas()
+        ficha = "X"
+        for _ in range(jugadas):
+            juego.realizar_movimiento(rng.choice(juego.obtener_movimientos_posibles()), ficha)
+            ficha = "O" if ficha == "X" else "X"
+        if not juego.juego_terminado():
+            return list(juego.historial)
+
+def jugar_partida(jugador_x, jugador_o, apertura, latencia_x, latencia_o):
+    """Juega una partida a partir de la apertura dada. Retorna 'X', 'O' o None (empate)."""
+    juego = LogicaTresRayas()
+    ficha = "X"
+    for mov in apertura:
+        juego.realizar_movimiento(mov, ficha)
+        ficha = "O" if ficha == "X" else "X"
+
+    reloj = time.perf_counter_ns
+    while not juego.terminado:
+        jugador, latencia = (jugador_x, latencia_x) if ficha == "X" else (jugador_o, latencia_o)
+        inicio = reloj()
+        mov = jugador(list(juego.tablero), ficha, juego.obtener_movimientos_posibles())
+        latencia.registrar(reloj() - inicio)
+        if not juego.realizar_movimiento(mov, ficha):
+            # Una jugada ilegal pierde la partida
+            return "O" if ficha == "X" else "X"
+        ficha = "O" if ficha == "X" else "X"
+    return juego.ganador
+
+
+# --------------------
+# TRABAJO DE CADA PROCESO
+# --------------------
+_JUGADORES = None
+
+def _iniciar_trabajador(nombre_a, nombre_b, semilla):
+    global _JUGADORES
+    rng = random.Random(semilla)
+    _JUGADORES = (crear_jugador(nombre_a, rng), crear_jugador(nombre_b, rng))
+
+def _jugar_bloque(tarea):
+    indice, n_pares, aperturas, semilla = tarea
+    # Cada bloque tiene su propia semilla: el resultado no depende del reparto entre procesos
+    rng = random.Random(semilla * 1_000_003 + indice)
+    random.seed(semilla * 1_000_003 + indice)  # jugador aleatorio y desempates de QAgent
+    jugador_a, jugador_b = _JUGADORES
+    latencia_a, latencia_b = Histograma(), Histograma()
+
+    conteo = {"victorias": 0, "empates": 0, "derrotas": 0}
+    for _ in range(n_pares):
+        apertura = generar_apertura(rng, aperturas)
+        for a_es_x in (True, False):
+            if a_es_x:
+                ganador = jugar_partida(jugador_a, jugador_b, apertura, latencia_a, latencia_b)
+            else:
+                ganador = jugar_partida(jugador_b, jugador_a, apertura, latencia_b, latencia_a)
+            if ganador is None:
+                conteo["empates"] += 1
+            elif (ganador == "X") == a_es_x:
+                conteo["victorias"] += 1
+            else:
+                conteo["derrotas"] += 1
+
+    conteo["latencia_a"] = latencia_a.cubetas
+    conteo["latencia_b"] = latencia_b.cubetas
+    return conteo
+
+
+# --------------------
+# SERIE COMPLETA
+# --------------------
+def ejecutar_serie(agente_a, agente_b, partidas=10000, workers=1, aperturas=2, semilla=0,
+                   tamano_bloque=500, mostrar=True):
+    """
+    Juega `partidas` (se redondea a par) entre A y B y devuelve el resumen desde el punto de vista de A:
+    {'partidas', 'victorias', 'empates', 'derrotas', 'puntaje', 'partidas_por_segundo', 'latencia_us'}
+    """
+    validar_aperturas(aperturas)
+    pares = (partidas + 1) // 2
+    bloque = max(1, tamano_bloque // 2)
+    tareas = [(i, min(bloque, pares - inicio), aperturas, semilla)
+              for i, inicio in enumerate(range(0, pares, bloque))]
+
+    totales = {"victorias": 0, "empates": 0, "derrotas": 0}
+    latencia_a, latencia_b = Histograma(), Histograma()
+    jugadas = 0
+    inicio = time.perf_counter()
+
+    def acumular(resultado):
+        nonlocal jugadas
+        for clave in totales:
+            totales[clave] += resultado[clave]
+        latencia_a.fusionar(resultado["latencia_a"])
+        latencia_b.fusionar(resultado["latencia_b"])
+        jugadas = sum(totales.values())
+        if mostrar:
+            duracion = time.perf_counter() - inicio
+            pa, pb = latencia_a.resumen(), latencia_b.resumen()
+            print(f"[{jugadas}/{pares * 2}] V/E/D {agente_a}: {totales['victorias']}/{totales['empates']}/{totales['derrotas']}"
+                  f" | {jugadas / duracion:.0f} partidas/s"
+                  f" | {agente_a} p50 {pa['p50']:.1f}us p99 {pa['p99']:.1f}us"
+                  f" | {agente_b} p50 {pb['p50']:.1f}us p99 {pb['p99']:.1f}us")
+
+    if workers <= 1:
+        _iniciar_trabajador(agente_a, agente_b, semilla)
+        for tarea in tareas:
+            acumular(_jugar_bloque(tarea))
+    else:
+        with Pool(workers, initializer=_iniciar_trabajador, initargs=(agente_a, agente_b, semilla)) as pool:
+            for resultado in pool.imap_unordered(_jugar_bloque, tareas):
+                acumular(resultado)
+
+    duracion = time.perf_counter() - inicio
+    resumen = dict(totales)
+    resumen["partidas"] = jugadas
+    resumen["puntaje"] = (totales["victorias"] + 0.5 * totales["empates"]) / jugadas if jugadas else 0.0
+    resumen["partidas_por_segundo"] = jugadas / duracion if duracion else 0.0
+    resumen["latencia_us"] = {agente_a: latencia_a.resumen(), agente_b: latencia_b.resumen()}
+    return resumen
+
+
+# --------------------
+# LÍNEA DE COMANDOS (compuerta de regresión)
+# --------------------
+def verificar_umbrales(resumen, agente_a, max_derrotas=None, min_puntaje=None, min_partidas_s=None, max_p99_us=None):
+    """Lista de umbrales incumplidos (vacía si la serie pasa)."""
+    fallos = []
+    tasa_derrotas = resumen["derrotas"] / resumen["partidas"] if resumen["partidas"] else 0.0
+    if max_derrotas is not None and tasa_derrotas > max_derrotas:
+        fallos.append(f"derrotas {tasa_derrotas:.4f} > {max_derrotas}")
+    if min_puntaje is not None and resumen["puntaje"] < min_puntaje:
+        fallos.append(f"puntaje {resumen['puntaje']:.4f} < {min_puntaje}")
+    if min_partidas_s is not None and resumen["partidas_por_segundo"] < min_partidas_s:
+        fallos.append(f"partidas/s {resumen['partidas_por_segundo']:.0f} < {min_partidas_s}")
+    p99 = resumen["latencia_us"][agente_a]["p99"]
+    if max_p99_us is not None and p99 > max_p99_us:
+        fallos.append(f"p99 de {agente_a} {p99:.1f}us > {max_p99_us}us")
+    return fallos
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serie de partidas entre dos agentes (A contra B).")
+    parser.add_argument("agente_a", help=f"{', '.join(FABRICAS)} o modulo:funcion")
+    parser.add_argument("agente_b")
+    parser.add_argument("--partidas", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--aperturas", type=int, default=2, choices=range(MAX_APERTURA + 1), metavar=f"0..{MAX_APERTURA}",
+                        help="jugadas al azar al inicio de cada partida")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--bloque", type=int, default=500, help="partidas por tarea de cada proceso")
+    parser.add_argument("--json", help="guarda el resumen en este archivo")
+    parser.add_argument("--max-derrotas", type=float, help="fracción máxima de derrotas de A")
+    parser.add_argument("--min-puntaje", type=float, help="puntaje mínimo de A (victoria 1, empate 0.5)")
+    parser.add_argument("--min-partidas-s", type=float, help="partidas por segundo mínimas")
+    parser.add_argument("--max-p99-us", type=float, help="latencia p99 máxima por jugada de A")
+    args = parser.parse_args(argv)
+
+    resumen = ejecutar_serie(args.agente_a, args.agente_b, args.partidas, args.workers,
+                             args.aperturas, args.semilla, args.bloque)
+    print(json.dumps(resumen, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(resumen, f, indent=2)
+
+    fallos = verificar_umbrales(resumen, args.agente_a, args.max_derrotas, args.min_puntaje,
+                                args.min_partidas_s, args.max_p99_us)
+    for fallo in fallos:
+        print(f"UMBRAL INCUMPLIDO: {fallo}")
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# BARRIDO.PY: Búsqueda de hiperparámetros (rejilla o aleatoria) en varios procesos
+
+import argparse
+import itertools
+import json
+import random
+import time
+from multiprocessing import Pool
+
+from game.ai import QAgent
+from game.evaluacion import fraccion_optima
+from game.logic import LogicaTresRayas
+from game.trainer import RECOMPENSAS, jugar_episodio_entrenamiento
+
+# =============================================================================
+#  BARRIDO DE HIPERPARÁMETROS
+# =============================================================================
+#  Cada configuración combina hiperparámetros del agente (alpha, gamma,
+#  epsilon_decay, epsilon_min) con las recompensas del entrenamiento
+#  (victoria, empate, derrota). Cada una se entrena en su propio proceso con
+#  un QAgent aislado (nunca el cerebro compartido de obtener_agente) y la
+#  misma semilla, para que las diferencias vengan de los parámetros y no del
+#  azar. Por configuración se mide:
+#     - episodios hasta jugar de forma óptima todas las posiciones de X
+#       (game/evaluacion.py, revisado cada `cada` episodios)
+#     - tasas de victoria/empate/derrota de la política final (greedy) contra
+#       el rival aleatorio
+#     - tiempo de pared del entrenamiento
+# =============================================================================
+
+ESPACIO = {
+    "alpha": (0.2, 0.5, 0.8),
+    "gamma": (0.9, 0.99),
+    "epsilon": (1.0,),
+    "epsilon_decay": (0.999, 0.9995),
+    "epsilon_min": (0.01,),
+    "victoria": (RECOMPENSAS["victoria"],),
+    "empate": (RECOMPENSAS["empate"],),
+    "derrota": (RECOMPENSAS["derrota"],),
+}
+PARAMETROS_AGENTE = ("alpha", "gamma", "epsilon", "epsilon_decay", "epsilon_min")
+
+
+def generar_configuraciones(espacio=ESPACIO, modo="rejilla", n=20, semilla=0):
+    """Rejilla: producto cartesiano del espacio. Aleatoria: `n` muestras independientes por parámetro."""
+    nombres = list(espacio)
+    if modo == "rejilla":
+        return [dict(zip(nombres, valores)) for valores in itertools.product(*(espacio[p] for p in nombres))]
+    if modo == "aleatorio":
+        rng = random.Random(semilla)
+        return [{p: rng.choice(espacio[p]) for p in nombres} for _ in range(n)]
+    raise ValueError(f"Modo de barrido desconocido: {modo!r} (rejilla o aleatorio)")
+
+
+def evaluar_contra_aleatorio(agente, partidas, rng):
+    """Tasas (victoria, empate, derrota) de la política greedy del agente (X) contra jugadas al azar."""
+    conteo = {"X": 0, "O": 0, "Empate": 0}
+    for _ in range(partidas):
+        juego = LogicaTresRayas()
+        ficha = "X"
+        while True:
+            movimientos = juego.obtener_movimientos_posibles()
+            if ficha == "X":
+                mov = agente.obtener_accion(juego.tablero, movimientos, en_entrenamiento=False)
+            else:
+                mov = rng.choice(movimientos)
+            juego.realizar_movimiento(mov, ficha)
+            if juego.terminado:
+                conteo[juego.ganador or "Empate"] += 1
+                break
+            ficha = "O" if ficha == "X" else "X"
+    return conteo["X"] / partidas, conteo["Empate"] / partidas, conteo["O"] / partidas
+
+
+def ejecutar_configuracion(tarea):
+    """Trabajo de un proceso: entrena una configuración desde cero y la evalúa."""
+    config = tarea["config"]
+    random.seed(tarea["semilla"])
+    agente = QAgent(cargar=False, **{p: config[p] for p in PARAMETROS_AGENTE})
+    recompensas = {r: config[r] for r in ("victoria", "empate", "derrota")}
+
+    episodios_optimo = None
+    inicio = time.perf_counter()
+    for i in range(1, tarea["episodios"] + 1):
+        jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente, recompensas=recompensas)
+        agente.reducir_epsilon()
+        if episodios_optimo is None and i % tarea["cada"] == 0 and fraccion_optima(agente.q_table) == 1.0:
+            episodios_optimo = i
+    duracion = time.perf_counter() - inicio
+
+    victoria, empate, derrota = evaluar_contra_aleatorio(agente, tarea["partidas_finales"],
+                                                         random.Random(tarea["semilla"]))
+    return {
+        "indice": tarea["indice"],
+        "config": config,
+        "episodios_optimo": episodios_optimo,
+        "fraccion_optima": fraccion_optima(agente.q_table),
+        "victoria": victoria,
+        "empate": empate,
+        "derrota": derrota,
+        "segundos": duracion,
+    }
+
+
+def ejecutar_barrido(configuraciones, episodios=50000, cada=1000, workers=1, semilla=0,
+                     partidas_finales=2000, mostrar=True):
+    """Entrena y evalúa cada configuración (en `workers` procesos). Retorna la lista de resultados."""
+    tareas = [{"indice": i, "config": c, "episodios": episodios, "cada": cada, "semilla": semilla,
+               "partidas_finales": partidas_finales} for i, c in enumerate(configuraciones)]
+    resultados = []
+
+    def acumular(resultado):
+        resultados.append(resultado)
+        if mostrar:
+            print(f"[{len(resultados)}/{len(tareas)}] configuración {resultado['indice']} "
+                  f"terminada en {resultado['segundos']:.1f} s")
+
+    if workers <= 1:
+        for tarea in tareas:
+            acumular(ejecutar_configuracion(tarea))
+    else:
+        with Pool(workers) as pool:
+            for resultado in pool.imap_unordered(ejecutar_configuracion, tareas):
+                acumular(resultado)
+
+    # Primero las que llegaron al juego óptimo (las más rápidas arriba), luego por puntaje final
+    resultados.sort(key=lambda r: (r["episodios_optimo"] is None, r["episodios_optimo"] or 0,
+                                   -(r["victoria"] + 0.5 * r["empate"])))
+    return resultados
+
+
+def imprimir_tabla(resultados, episodios):
+    nombres = list(resultados[0]["config"]) if resultados else []
+    encabezado = " ".join(f"{n:>13}" for n in nombres)
+    print(f"\n{encabezado} {'Ep. óptimo':>11} {'Óptimas':>8} {'Victoria':>9} {'Empate':>7} {'Derrota':>8} {'Tiempo':>7}")
+    for r in resultados:
+        valores = " ".join(f"{r['config'][n]:>13g}" for n in nombres)
+        optimo = r["episodios_optimo"] if r["episodios_optimo"] else f">{episodios}"
+        print(f"{valores} {optimo:>11} {r['fraccion_optima'] * 100:>7.1f}% {r['victoria'] * 100:>8.1f}%"
+              f" {r['empate'] * 100:>6.1f}% {r['derrota'] * 100:>7.1f}% {r['segundos']:>6.1f}s")
+
+
+def _leer_espacio(especificaciones):
+    """--parametro alpha=0.1,0.3 sustituye los valores de ese parámetro en ESPACIO."""
+    espacio = dict(ESPACIO)
+    for especificacion in especificaciones:
+        nombre, _, valores = especificacion.partition("=")
+        if nombre not in espacio or not valores:
+            raise ValueError(f"Parámetro inválido: {especificacion!r} (opciones: {', '.join(espacio)})")
+        espacio[nombre] = tuple(float(v) for v in valores.split(","))
+    return espacio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de hiperparámetros y recompensas del agente Q-Learning.")
+    parser.add_argument("--modo", choices=("rejilla", "aleatorio"), default="rejilla")
+    parser.add_argument("--configuraciones", type=int, default=20, help="muestras del modo aleatorio")
+    parser.add_argument("--parametro", action="append", default=[], metavar="NOMBRE=V1,V2",
+                        help=f"valores a probar ({', '.join(ESPACIO)}); se puede repetir")
+    parser.add_argument("--episodios", type=int, default=50000, help="episodios por configuración")
+    parser.add_argument("--cada", type=int, default=1000, help="episodios entre evaluaciones de juego óptimo")
+    parser.add_argument("--partidas-finales", type=int, default=2000, help="partidas contra el azar al final")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--json", help="guarda los resultados en este archivo")
+    args = parser.parse_args(argv)
+
+    try:
+        espacio = _leer_espacio(args.parametro)
+    except ValueError as e:
+        parser.error(str(e))
+    configuraciones = generar_configuraciones(espacio, args.modo, args.configuraciones, args.semilla)
+    print(f"Barrido {args.modo}: {len(configuraciones)} configuraciones x {args.episodios} episodios "
+          f"en {args.workers} procesos")
+
+    resultados = ejecutar_barrido(configuraciones, args.episodios, args.cada, args.workers, args.semilla,
+                                  args.partidas_finales)
+    imprimir_tabla(resultados, args.episodios)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(resultados, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# BITBOARD.PY: Motor alternativo del Tres en Raya basado en bitboards
+
+# =============================================================================
+#  MOTOR BITBOARD
+# =============================================================================
+#  El tablero se guarda como dos enteros de 9 bits (uno por jugador): el bit i
+#  está encendido si la casilla i pertenece a ese jugador.
+#  Todo lo que LogicaTresRayas calcula recorriendo la lista de strings aquí se
+#  resuelve con tablas precalculadas de 512 entradas (una por cada máscara
+#  posible de 9 bits), así que ganar, empatar y listar movimientos es O(1).
+#
+#  La propiedad `tablero` devuelve una vista compatible (índices, iteración,
+#  asignación) para que main.py, game/trainer.py y la UI funcionen sin cambios.
+# =============================================================================
+
+MASCARA_LLENO = 0b111111111
+
+COMBINACIONES_GANADORAS = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8), # Filas
+    (0, 3, 6), (1, 4, 7), (2, 5, 8), # Columnas
+    (0, 4, 8), (2, 4, 6)             # Diagonales
+)
+
+MASCARAS_GANADORAS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in COMBINACIONES_GANADORAS)
+
+# --------------------
+# TABLAS PRECALCULADAS (512 entradas)
+# TABLA_GANADOR[m]: índice de la primera combinación ganadora contenida en m (-1 si no hay)
+# TABLA_MOVIMIENTOS[m]: tupla con las casillas libres cuando las ocupadas son m
+# --------------------
+TABLA_GANADOR = tuple(
+    next((i for i, combo in enumerate(MASCARAS_GANADORAS) if m & combo == combo), -1)
+    for m in range(512)
+)
+TABLA_MOVIMIENTOS = tuple(
+    tuple(i for i in range(9) if not m & (1 << i))
+    for m in range(512)
+)
+
+
+class TableroVista:
+    """
+    Vista de compatibilidad: se comporta como la lista de 9 strings de LogicaTresRayas
+    (" ", "X", "O") pero lee y escribe directamente sobre los bitboards del motor.
+    """
+
+    __slots__ = ("_motor",)
+
+    def __init__(self, motor):
+        self._motor = motor
+
+    def __len__(self):
+        return 9
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._motor.ficha_en(i) for i in range(9)[indice]]
+        if indice < 0:
+            indice += 9
+        if indice < 0 or indice > 8:
+            raise IndexError("índice de tablero fuera de rango")
+        return self._motor.ficha_en(indice)
+
+    def __setitem__(self, indice, valor):
+        if indice < 0:
+            indice += 9
+        if indice < 0 or indice > 8:
+            raise IndexError("índice de tablero fuera de rango")
+        self._motor.poner_ficha(indice, valor)
+
+    def __iter__(self):
+        motor = self._motor
+        return (motor.ficha_en(i) for i in range(9))
+
+    def __contains__(self, valor):
+        return valor in list(self)
+
+    def __eq__(self, otro):
+        try:
+            return list(self) == list(otro)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def count(self, valor):
+        return list(self).count(valor)
+
+    def index(self, valor):
+        return list(self).index(valor)
+
+
+class LogicaBitboard:
+    """Motor de Tres en Raya con la misma interfaz pública que LogicaTresRayas."""
+
+    num_casillas = 9
+
+    def __init__(self):
+        self.reiniciar()
+
+    # --------------------
+    # Vista de compatibilidad: `juego.tablero` se sigue pudiendo leer,
+    # indexar, copiar con list(...) y reemplazar por una lista completa.
+    # Al reemplazarlo el historial queda en orden de casilla, como en
+    # LogicaTresRayas.establecer_tablero (el orden real no se conoce).
+    # --------------------
+    @property
+    def tablero(self):
+        return TableroVista(self)
+
+    @tablero.setter
+    def tablero(self, valores):
+        self.reiniciar()
+        for i, ficha in enumerate(valores):
+            self.poner_ficha(i, ficha)
+            if ficha != " ":
+                self.historial.append(i)
+
+    def ficha_en(self, indice):
+        bit = 1 << indice
+        if self.bits_x & bit:
+            return "X"
+        if self.bits_o & bit:
+            return "O"
+        return " "
+
+    def poner_ficha(self, indice, ficha):
+        """Escribe una casilla sin validar (equivale a `tablero[indice] = ficha`)."""
+        bit = 1 << indice
+        self.bits_x &= ~bit
+        self.bits_o &= ~bit
+        if ficha == "X":
+            self.bits_x |= bit
+        elif ficha == "O":
+            self.bits_o |= bit
+
+    def reiniciar(self):
+        self.bits_x = 0
+        self.bits_o = 0
+        self.historial = []
+        self.ganador = None
+        self.combo_ganador = None
+
+    def existe_espacio_libre(self):
+        return (self.bits_x | self.bits_o) != MASCARA_LLENO
+
+    def es_movimiento_valido(self, indice):
+        if indice < 0 or indice > 8:
+            return False
+        return not (self.bits_x | self.bits_o) & (1 << indice)
+
+    def realizar_movimiento(self, indice, jugador):
+        if self.es_movimiento_valido(indice):
+            if jugador == "X":
+                self.bits_x |= 1 << indice
+            else:
+                self.bits_o |= 1 << indice
+            self.historial.append(indice)
+            return True
+        return False
+
+    # --------------------
+    # Make/unmake en O(1) para búsquedas: `mover` coloca la ficha del jugador
+    # en turno (X si el historial tiene longitud par) sin validar la casilla,
+    # y `deshacer_movimiento` retira la última ficha del historial.
+    # --------------------
+    def mover(self, indice):
+        if len(self.historial) & 1:
+            self.bits_o |= 1 << indice
+        else:
+            self.bits_x |= 1 << indice
+        self.historial.append(indice)
+
+    def deshacer_movimiento(self):
+        indice = self.historial.pop()
+        limpiar = ~(1 << indice)
+        self.bits_x &= limpiar
+        self.bits_o &= limpiar
+        self.ganador = None
+        self.combo_ganador = None
+        return indice
+
+    def verificar_ganador(self):
+        combo = TABLA_GANADOR[self.bits_x]
+        if combo >= 0:
+            self.ganador = "X"
+        else:
+            combo = TABLA_GANADOR[self.bits_o]
+            if combo < 0:
+                return None
+            self.ganador = "O"
+        self.combo_ganador = list(COMBINACIONES_GANADORAS[combo])
+        return self.ganador
+
+    def hay_ganador(self):
+        """Como verificar_ganador() pero sin actualizar atributos: solo dice si hay línea."""
+        return TABLA_GANADOR[self.bits_x] >= 0 or TABLA_GANADOR[self.bits_o] >= 0
+
+    def juego_terminado(self):
+        if TABLA_GANADOR[self.bits_x] >= 0 or TABLA_GANADOR[self.bits_o] >= 0:
+            self.verificar_ganador()
+            return True
+        return (self.bits_x | self.bits_o) == MASCARA_LLENO
+
+    def obtener_movimientos_posibles(self):
+        """Devuelve una tupla precalculada (compartida, no modificar) con las casillas libres."""
+        return TABLA_MOVIMIENTOS[self.bits_x | self.bits_o]
+
+    def clave(self):
+        """Clave entera única de la posición (18 bits: X en los bajos, O en los altos)."""
+        return self.bits_x | (self.bits_o << 9)
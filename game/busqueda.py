@@ -0,0 +1,258 @@
+# BUSQUEDA.PY: Motor Negamax con poda alfa-beta, tabla de transposición y ordenamiento de jugadas
+
+import time
+
+# =============================================================================
+#  MOTOR DE BÚSQUEDA NEGAMAX
+# =============================================================================
+#  Negamax es Minimax escrito desde el punto de vista de quien mueve: el
+#  puntaje de una posición es el negativo del mejor puntaje de sus hijas.
+#  Sobre eso se añaden:
+#  - Poda alfa-beta: deja de explorar ramas que no pueden cambiar el resultado.
+#  - Tabla de transposición (TT): recuerda posiciones ya buscadas con su
+#    puntaje y si es EXACTO, una COTA_INFERIOR (hubo corte beta) o una
+#    COTA_SUPERIOR (ninguna jugada superó alfa).
+#  - Ordenamiento: primero la jugada de la TT, luego las "killer" de ese ply
+#    (las que provocaron cortes en posiciones hermanas) y el resto por su
+#    puntaje de historia (cortes acumulados, ponderados por profundidad).
+#  - Profundización iterativa: busca a profundidad 1, 2, ... reutilizando la
+#    TT, y puede cortar por tiempo quedándose con la última iteración completa.
+#
+#  El motor no conoce el Tres en Raya: trabaja contra cualquier tablero que
+#  ofrezca esta interfaz (LogicaBitboard la implementa):
+#     num_casillas                    -> número de casillas del tablero
+#     obtener_movimientos_posibles()  -> casillas libres
+#     mover(casilla)                  -> coloca la ficha de quien está en turno
+#     deshacer_movimiento()           -> retira la última ficha
+#     hay_ganador()                   -> True si alguien completó una línea
+#     existe_espacio_libre()          -> False si el tablero está lleno
+#     clave()                         -> clave hashable única de la posición
+#
+#  Puntajes: ganar a `p` jugadas de la raíz vale VICTORIA - p con
+#  VICTORIA = num_casillas + 1 (10 en el 3x3, igual que el Minimax del
+#  proyecto); 0 es empate o posición no resuelta en el horizonte.
+# =============================================================================
+
+EXACTO = 0
+COTA_INFERIOR = 1
+COTA_SUPERIOR = 2
+
+
+class TiempoAgotado(Exception):
+    pass
+
+
+class MotorNegamax:
+    def __init__(self, max_entradas_tt=1_000_000):
+        self.max_entradas_tt = max_entradas_tt
+        self.tt = {}
+        self.nodos = 0
+
+    def limpiar(self):
+        self.tt.clear()
+
+    # --------------------
+    # BÚSQUEDA PRINCIPAL
+    # --------------------
+    def buscar(self, tablero, profundidad_max=None, tiempo_limite=None):
+        """
+        Devuelve (mejor_casilla, puntaje) para quien está en turno.
+        :param profundidad_max: plies a explorar (por defecto hasta llenar el tablero).
+        :param tiempo_limite: segundos; al agotarse se usa la última iteración completa.
+        """
+        movimientos = list(tablero.obtener_movimientos_posibles())
+        if not movimientos or tablero.hay_ganador():
+            return None, 0
+
+        self.victoria = tablero.num_casillas + 1
+        self.killers = [[None, None] for _ in range(tablero.num_casillas + 1)]
+        self.historia = [0] * tablero.num_casillas
+        self.nodos = 0
+        self.limite = None if tiempo_limite is None else time.perf_counter() + tiempo_limite
+        if profundidad_max is None:
+            profundidad_max = len(movimientos)
+
+        mejor = (movimientos[0], 0)
+        self.mejor_raiz = movimientos[0]
+        for profundidad in range(1, profundidad_max + 1):
+            try:
+                puntaje = self._negamax(tablero, profundidad, 0, -self.victoria, self.victoria)
+            except TiempoAgotado:
+                break
+            # La jugada la deja _negamax en ply 0: la raíz puede no estar en la TT si se llenó
+            mejor = (self.mejor_raiz, puntaje)
+            # Una victoria o derrota forzada ya no cambia buscando más hondo
+            if abs(puntaje) > 0 and abs(puntaje) >= self.victoria - profundidad:
+                break
+        return mejor
+
+    def _negamax(self, tablero, profundidad, ply, alfa, beta):
+        self.nodos += 1
+        if self.limite is not None and self.nodos & 1023 == 0 and time.perf_counter() > self.limite:
+            raise TiempoAgotado()
+
+        alfa_original = alfa
+        clave = tablero.clave()
+        entrada = self.tt.get(clave)
+        movimiento_tt = None
+        if entrada is not None:
+            prof_tt, puntaje_tt, tipo, movimiento_tt = entrada
+            if prof_tt >= profundidad:
+                puntaje_tt = self._desde_tt(puntaje_tt, ply)
+                if tipo != EXACTO:
+                    if tipo == COTA_INFERIOR:
+                        alfa = max(alfa, puntaje_tt)
+                    else:
+                        beta = min(beta, puntaje_tt)
+                if tipo == EXACTO or alfa >= beta:
+                    if ply == 0:
+                        self.mejor_raiz = movimiento_tt
+                    return puntaje_tt
+
+        if profundidad == 0:
+            return 0
+
+        mejor_puntaje = -self.victoria
+        mejor_movimiento = None
+        for mov in self._ordenar(tablero.obtener_movimientos_posibles(), movimiento_tt, ply):
+            tablero.mover(mov)
+            if tablero.hay_ganador():
+                # Quien acaba de mover gana en este ply
+                puntaje = self.victoria - (ply + 1)
+            elif not tablero.existe_espacio_libre():
+                puntaje = 0
+            else:
+                puntaje = -self._negamax(tablero, profundidad - 1, ply + 1, -beta, -alfa)
+            tablero.deshacer_movimiento()
+
+            if puntaje > mejor_puntaje:
+                mejor_puntaje = puntaje
+                mejor_movimiento = mov
+            if puntaje > alfa:
+                alfa = puntaje
+            if alfa >= beta:
+                self._registrar_corte(mov, ply, profundidad)
+                break
+
+        if mejor_puntaje <= alfa_original:
+            tipo = COTA_SUPERIOR
+        elif mejor_puntaje >= beta:
+            tipo = COTA_INFERIOR
+        else:
+            tipo = EXACTO
+        if len(self.tt) < self.max_entradas_tt or clave in self.tt:
+            self.tt[clave] = (profundidad, self._hacia_tt(mejor_puntaje, ply), tipo, mejor_movimiento)
+        if ply == 0:
+            self.mejor_raiz = mejor_movimiento
+        return mejor_puntaje
+
+    # --------------------
+    # ORDENAMIENTO DE JUGADAS
+    # --------------------
+    def _ordenar(self, movimientos, movimiento_tt, ply):
+        killers = self.killers[ply]
+        historia = self.historia
+
+        def prioridad(mov):
+            if mov == movimiento_tt:
+                return (3, 0)
+            if mov == killers[0] or mov == killers[1]:
+                return (2, 0)
+            return (1, historia[mov])
+
+        return sorted(movimientos, key=prioridad, reverse=True)
+
+    def _registrar_corte(self, mov, ply, profundidad):
+        killers = self.killers[ply]
+        if killers[0] != mov:
+            killers[1] = killers[0]
+            killers[0] = mov
+        self.historia[mov] += profundidad * profundidad
+
+    # --------------------
+    # PUNTAJES DE VICTORIA EN LA TT
+    # La TT guarda la distancia a la victoria desde la propia posición, no desde
+    # la raíz, para que la entrada sirva aunque se llegue a ella por otro ply.
+    # --------------------
+    def _hacia_tt(self, puntaje, ply):
+        if puntaje > 0:
+            return puntaje + ply
+        if puntaje < 0:
+            return puntaje - ply
+        return 0
+
+    def _desde_tt(self, puntaje, ply):
+        if puntaje > 0:
+            return puntaje - ply
+        if puntaje < 0:
+            return puntaje + ply
+        return 0
+
+
+# =============================================================================
+#  BENCHMARK CONTRA EL MINIMAX ORIGINAL (python -m game.busqueda)
+# =============================================================================
+
+POSICIONES_BENCHMARK = (
+    [],              # tablero vacío
+    [4],             # centro
+    [0],             # esquina
+    [1],             # lado
+    [4, 0],
+    [0, 4, 8],
+    [0, 1, 4],
+    [4, 0, 8, 2],
+)
+
+
+def comparar_con_minimax(posiciones=POSICIONES_BENCHMARK):
+    """Nodos visitados y tiempo por jugada del Negamax frente a minimax_recursivo."""
+    from game import ai
+    from game.bitboard import LogicaBitboard
+
+    original = ai._minimax_en_juego
+    contador = [0]
+
+    def minimax_contado(juego, profundidad, es_turno_max):
+        contador[0] += 1
+        return original(juego, profundidad, es_turno_max)
+
+    print(f"{'Historial':<14} {'Minimax nodos':>13} {'ms':>8} {'Negamax nodos':>13} {'ms':>8} {'Mismo puntaje':>13}")
+    filas = []
+    for historial in posiciones:
+        juego = LogicaBitboard()
+        for mov in historial:
+            juego.mover(mov)
+        ficha = "X" if len(historial) % 2 == 0 else "O"
+
+        ai.limpiar_cache()
+        contador[0] = 0
+        ai._minimax_en_juego = minimax_contado
+        try:
+            inicio = time.perf_counter()
+            mov_minimax = ai.movimiento_minimax_recursivo(list(juego.tablero), ficha)
+            ms_minimax = (time.perf_counter() - inicio) * 1000
+        finally:
+            ai._minimax_en_juego = original
+        nodos_minimax = contador[0]
+
+        motor = MotorNegamax()
+        inicio = time.perf_counter()
+        mov_negamax, puntaje = motor.buscar(juego)
+        ms_negamax = (time.perf_counter() - inicio) * 1000
+
+        # Puede haber varias jugadas óptimas: se compara el puntaje, no la casilla
+        hija = list(juego.tablero)
+        hija[mov_minimax] = ficha
+        puntaje_minimax = ai.minimax(hija, 1, ficha == "O")
+        if ficha == "O":
+            puntaje_minimax = -puntaje_minimax
+        igual = puntaje_minimax == puntaje
+
+        filas.append((historial, nodos_minimax, ms_minimax, motor.nodos, ms_negamax, igual))
+        print(f"{str(historial):<14} {nodos_minimax:>13} {ms_minimax:>8.2f} {motor.nodos:>13} {ms_negamax:>8.2f} {'sí' if igual else 'NO':>13}")
+    return filas
+
+
+if __name__ == "__main__":
+    comparar_con_minimax()
@@ -0,0 +1,78 @@
+# CHECKPOINT.PY: Puntos de control atómicos para reanudar entrenamientos largos
+
+import json
+import os
+import random
+
+# =============================================================================
+#  CHECKPOINTS DEL ENTRENAMIENTO
+# =============================================================================
+#  guardar_conocimiento solo guarda la Tabla Q (y al cargarla el agente pasa a
+#  epsilon = 0.0), así que un entrenamiento interrumpido no se podía continuar.
+#  Un checkpoint guarda todo lo necesario para seguir exactamente donde iba:
+#     - la Tabla Q, en el mismo orden de inserción
+#     - epsilon e hiperparámetros (alpha, gamma, epsilon_min, epsilon_decay)
+#     - el estado del generador `random` (exploración y rival aleatorio)
+#     - episodios jugados y contadores de resultados
+#     - la política greedy de la última evaluación (parada temprana), si la hay
+#  Los floats se escriben con repr (ida y vuelta exacta), por lo que reanudar
+#  da el mismo resultado bit a bit que no haberse detenido.
+#
+#  Escritura atómica: se escribe un archivo temporal, se fuerza a disco y se
+#  renombra encima del anterior con os.replace. Si el proceso muere a mitad,
+#  el checkpoint anterior sigue intacto.
+# =============================================================================
+
+VERSION_CHECKPOINT = 1
+HIPERPARAMETROS = ("alpha", "gamma", "epsilon", "epsilon_min", "epsilon_decay")
+
+
+def escribir_atomico(ruta, texto):
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "w") as f:
+        f.write(texto)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def guardar_checkpoint(ruta, agente, episodio, contadores, politica_anterior=None):
+    """
+    Guarda el estado completo del entrenamiento tras `episodio` episodios.
+    :param politica_anterior: {estado: jugadas greedy} de la última evaluación de la parada temprana.
+    """
+    version_rng, estado_rng, gauss = random.getstate()
+    datos = {
+        "version": VERSION_CHECKPOINT,
+        "episodio": episodio,
+        "contadores": contadores,
+        "hiperparametros": {nombre: getattr(agente, nombre) for nombre in HIPERPARAMETROS},
+        "rng": [version_rng, list(estado_rng), gauss],
+        # Lista de pares para conservar claves enteras y orden de inserción
+        "q_table": [[estado, list(acciones.items())] for estado, acciones in agente.q_table.items()],
+        "politica_anterior": None if politica_anterior is None else
+                             [[estado, list(jugadas)] for estado, jugadas in politica_anterior.items()],
+    }
+    escribir_atomico(ruta, json.dumps(datos, separators=(",", ":")))
+
+
+def cargar_checkpoint(ruta, agente):
+    """
+    Restaura en `agente` la Tabla Q y los hiperparámetros, y en `random` su estado.
+    Retorna (episodios ya jugados, contadores, política de la última evaluación o None).
+    """
+    with open(ruta, "r") as f:
+        datos = json.load(f)
+    if datos.get("version") != VERSION_CHECKPOINT:
+        raise ValueError(f"{ruta} no es un checkpoint compatible (versión {datos.get('version')})")
+
+    agente.q_table = {estado: {mov: valor for mov, valor in acciones} for estado, acciones in datos["q_table"]}
+    for nombre, valor in datos["hiperparametros"].items():
+        setattr(agente, nombre, valor)
+    version_rng, estado_rng, gauss = datos["rng"]
+    random.setstate((version_rng, tuple(estado_rng), gauss))
+    # Los checkpoints anteriores a la parada temprana no la traen
+    politica = datos.get("politica_anterior")
+    if politica is not None:
+        politica = {estado: tuple(jugadas) for estado, jugadas in politica}
+    return datos["episodio"], datos["contadores"], politica
@@ -0,0 +1,279 @@
+# DIARIO.PY: Tabla Q persistida como instantánea base + diario de cambios (solo anexar)
+
+import glob
+import os
+import re
+import struct
+import threading
+import time
+
+from game.estados import CODIGOS, indice_de_codigo
+from game.persistencia import escribir_binario, leer_binario, leer_generacion
+
+# =============================================================================
+#  DIARIO DE LA TABLA Q
+# =============================================================================
+#  guardar_conocimiento reescribe la tabla completa (JSON indentado + binario),
+#  así que guardar seguido durante un entrenamiento largo sale caro. El diario
+#  separa la persistencia en dos partes:
+#     <base>              instantánea .qtb (game/persistencia.py) con su
+#                         número de generación en la cabecera
+#     <base>.<g>.qlog     diarios de la generación g: cabecera + registros
+#                         "<HBd" (código base 3 del estado, casilla, valor)
+#  Guardar solo anexa los estados que cambiaron desde el último guardado, así
+#  que el costo depende de lo que cambió y no del tamaño de la tabla. Una
+#  casilla 255 marca un estado que existe pero no tiene jugadas (terminal).
+#  Como QAgent solo agrega o cambia casillas (nunca las borra), anexar el
+#  valor nuevo de cada casilla basta para reconstruir la tabla. Los agentes
+#  anotan en `agente.cambios` los estados que tocan: QAgent, QAgentNumpy y
+#  QAgentReplay al jugar y aprender, y los entrenamientos por lotes o en
+#  paralelo anotan todos los estados al terminar.
+#
+#  Compactación (en un hilo): cuando los diarios superan `umbral` veces los
+#  registros de la base, se abre el diario de la generación g+1 (los guardados
+#  siguientes van ahí) y el hilo escribe la nueva base g+1 (escribir_binario usa
+#  un temporal que reemplaza a la anterior con os.replace); después borra los
+#  diarios viejos.
+#
+#  Carga segura ante caídas: se lee la base (generación G) y se aplican en orden
+#  los diarios con generación >= G; los menores ya están dentro de la base.
+#     - Si el proceso muere antes del os.replace, sigue la base g y se aplican
+#       los diarios g y g+1: no se pierde nada.
+#     - Un registro a medio escribir al final de un diario se descarta (y se
+#       trunca antes de seguir anexando). Cada registro es el valor completo de
+#       una casilla, así que un guardado interrumpido deja valores viejos o
+#       nuevos, nunca una mezcla dentro de la misma casilla.
+# =============================================================================
+
+MAGIC = b"QTDJ"
+VERSION_DIARIO = 1
+_CABECERA = struct.Struct("<4sHxxI")
+_REGISTRO = struct.Struct("<HBd")
+SIN_CASILLA = 255
+
+
+def _ruta_diario(ruta_base, generacion):
+    return f"{ruta_base}.{generacion}.qlog"
+
+
+def _diarios_existentes(ruta_base):
+    """{generación: ruta} de los diarios que hay en disco para esta base."""
+    patron = re.compile(re.escape(ruta_base) + r"\.(\d+)\.qlog$")
+    diarios = {}
+    for ruta in glob.glob(glob.escape(ruta_base) + ".*.qlog"):
+        encontrado = patron.match(ruta)
+        if encontrado:
+            diarios[int(encontrado.group(1))] = ruta
+    return diarios
+
+
+def rutas_diarios(ruta_base):
+    """Rutas de los diarios que hay en disco para la base `ruta_base` (vacío si no se usó diario)."""
+    return list(_diarios_existentes(ruta_base).values())
+
+
+def aplicar_diario(ruta, q_table):
+    """Aplica los registros completos de un diario sobre `q_table`. Retorna cuántos aplicó."""
+    with open(ruta, "rb") as f:
+        datos = f.read()
+    if len(datos) < _CABECERA.size:
+        return 0  # se cayó antes de terminar la cabecera: diario vacío
+    magic, version, _ = _CABECERA.unpack_from(datos, 0)
+    if magic != MAGIC or version != VERSION_DIARIO:
+        raise ValueError(f"{ruta} no es un diario de Tabla Q compatible")
+
+    completos = (len(datos) - _CABECERA.size) // _REGISTRO.size
+    fin = _CABECERA.size + completos * _REGISTRO.size
+    for codigo, mov, valor in _REGISTRO.iter_unpack(datos[_CABECERA.size:fin]):
+        acciones = q_table.setdefault(indice_de_codigo(codigo), {})
+        if mov != SIN_CASILLA:
+            acciones[mov] = valor
+    return completos
+
+
+class DiarioQ:
+    def __init__(self, ruta_base, umbral=2.0, en_segundo_plano=True):
+        """
+        :param ruta_base: instantánea .qtb; los diarios se guardan a su lado.
+        :param umbral: se compacta cuando los registros de los diarios superan
+                       `umbral` veces los de la base.
+        :param en_segundo_plano: compactar en un hilo (False = en el mismo guardado).
+        """
+        self.ruta_base = ruta_base
+        self.umbral = umbral
+        self.en_segundo_plano = en_segundo_plano
+
+        self.tabla = {}            # lo que hay persistido (base + diarios)
+        self.generacion = 0        # generación del diario abierto
+        self.registros_base = 0
+        self.registros_diario = 0
+        self.compactaciones = 0
+        self._archivo = None
+        self._candado = threading.Lock()
+        self._hilo = None
+
+    # --------------------
+    # CARGA
+    # --------------------
+    def cargar(self):
+        """Reconstruye la tabla desde la base y los diarios, y deja abierto el diario actual."""
+        self.tabla = {}
+        generacion_base = 0
+        if os.path.exists(self.ruta_base):
+            self.tabla = leer_binario(self.ruta_base)
+            generacion_base = leer_generacion(self.ruta_base)
+        self.registros_base = sum(max(len(a), 1) for a in self.tabla.values())
+
+        self.registros_diario = 0
+        self.generacion = generacion_base
+        for generacion, ruta in sorted(_diarios_existentes(self.ruta_base).items()):
+            if generacion < generacion_base:
+                os.remove(ruta)  # quedó de una compactación que alcanzó a reemplazar la base
+                continue
+            self.registros_diario += aplicar_diario(ruta, self.tabla)
+            self.generacion = generacion
+
+        self._abrir_diario(self.generacion)
+        return {estado: dict(acciones) for estado, acciones in self.tabla.items()}
+
+    def adjuntar(self, agente):
+        """
+        Carga la tabla en `agente` y hace que su guardar_conocimiento escriba en este diario.
+        El agente debe anotar en `cambios` lo que modifica (QAgent y sus subclases de game/).
+        """
+        if not hasattr(agente, "cambios"):
+            raise TypeError(f"{type(agente).__name__} no anota sus cambios: no se le puede adjuntar un diario")
+        agente.q_table = self.cargar()
+        agente.diario = self
+        agente.cambios = set()
+
+    def _abrir_diario(self, generacion):
+        ruta = _ruta_diario(self.ruta_base, generacion)
+        if os.path.exists(ruta) and os.path.getsize(ruta) >= _CABECERA.size:
+            # Descarta un registro incompleto al final antes de seguir anexando
+            sobrante = (os.path.getsize(ruta) - _CABECERA.size) % _REGISTRO.size
+            self._archivo = open(ruta, "r+b")
+            self._archivo.truncate(os.path.getsize(ruta) - sobrante)
+            self._archivo.seek(0, os.SEEK_END)
+        else:
+            self._archivo = open(ruta, "wb")
+            self._archivo.write(_CABECERA.pack(MAGIC, VERSION_DIARIO, generacion))
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+
+    # --------------------
+    # GUARDADO
+    # --------------------
+    def guardar(self, q_table, estados):
+        """Anexa el contenido actual de `estados` (índices densos). Retorna cuántos registros escribió."""
+        registros = []
+        empaquetar = _REGISTRO.pack
+        for estado in estados:
+            acciones = q_table.get(estado)
+            if acciones is None:
+                continue
+            codigo = CODIGOS[estado]
+            if acciones:
+                registros.extend(empaquetar(codigo, mov, valor) for mov, valor in acciones.items())
+            else:
+                registros.append(empaquetar(codigo, SIN_CASILLA, 0.0))
+            self.tabla[estado] = dict(acciones)
+
+        with self._candado:
+            self._archivo.write(b"".join(registros))
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self.registros_diario += len(registros)
+
+        if self.registros_diario > self.umbral * max(self.registros_base, 1):
+            self.compactar()
+        return len(registros)
+
+    # --------------------
+    # COMPACTACIÓN
+    # --------------------
+    def compactar(self):
+        """Empieza una nueva generación y escribe su base (en un hilo si así se configuró)."""
+        if self._hilo is not None and self._hilo.is_alive():
+            return  # ya hay una en curso; la siguiente la disparará otro guardado
+        with self._candado:
+            instantanea = {estado: dict(acciones) for estado, acciones in self.tabla.items()}
+            self._archivo.close()
+            self.generacion += 1
+            self._abrir_diario(self.generacion)
+            self.registros_base = sum(max(len(a), 1) for a in instantanea.values())
+            self.registros_diario = 0
+
+        if self.en_segundo_plano:
+            self._hilo = threading.Thread(target=self._escribir_base, args=(instantanea, self.generacion),
+                                          daemon=True)
+            self._hilo.start()
+        else:
+            self._escribir_base(instantanea, self.generacion)
+
+    def _escribir_base(self, instantanea, generacion):
+        escribir_binario(instantanea, self.ruta_base, generacion=generacion)
+        for g, ruta in _diarios_existentes(self.ruta_base).items():
+            if g < generacion:
+                os.remove(ruta)
+        self.compactaciones += 1
+
+    def cerrar(self):
+        """Espera a la compactación en curso y cierra el diario."""
+        if self._hilo is not None:
+            self._hilo.join()
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+
+# =============================================================================
+#  MEDICIÓN CONTRA LA REESCRITURA COMPLETA (python -m game.diario)
+# =============================================================================
+
+def comparar_con_reescritura(n_episodios=50000, cada=1000, semilla=0):
+    """Entrena guardando cada `cada` episodios con guardar_conocimiento completo y con el diario."""
+    import contextlib
+    import io
+    import random
+    import tempfile
+
+    from game.ai import QAgent
+    from game.trainer import jugar_episodio_entrenamiento
+
+    resultados = {}
+    with tempfile.TemporaryDirectory() as directorio:
+        for modo in ("completo", "diario"):
+            random.seed(semilla)
+            agente = QAgent(cargar=False, archivo=os.path.join(directorio, f"{modo}.json"))
+            diario = None
+            if modo == "diario":
+                diario = DiarioQ(os.path.join(directorio, "diario.qtb"))
+                diario.adjuntar(agente)
+            tiempo_guardado = 0.0
+            for i in range(1, n_episodios + 1):
+                jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+                agente.reducir_epsilon()
+                if i % cada == 0:
+                    inicio = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        agente.guardar_conocimiento()
+                    tiempo_guardado += time.perf_counter() - inicio
+            resultados[modo] = {"ms_por_guardado": tiempo_guardado / (n_episodios // cada) * 1000}
+            if diario is not None:
+                diario.cerrar()
+                resultados[modo]["compactaciones"] = diario.compactaciones
+                recargado = DiarioQ(diario.ruta_base)
+                resultados[modo]["recarga_exacta"] = recargado.cargar() == agente.q_table
+                recargado.cerrar()
+
+    print(f"{n_episodios} episodios, guardando cada {cada}:")
+    print(f"  guardar_conocimiento completo: {resultados['completo']['ms_por_guardado']:.2f} ms por guardado")
+    d = resultados["diario"]
+    print(f"  diario:                        {d['ms_por_guardado']:.2f} ms por guardado "
+          f"({d['compactaciones']} compactaciones, recarga exacta: {d['recarga_exacta']})")
+    return resultados
+
+
+if __name__ == "__main__":
+    comparar_con_reescritura()
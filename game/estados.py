@@ -0,0 +1,102 @@
+# ESTADOS.PY: Indexado denso de todas las posiciones alcanzables del Tres en Raya
+
+from array import array
+
+# =============================================================================
+#  ESPACIO DE ESTADOS
+# =============================================================================
+#  Se enumeran una sola vez las 5,478 posiciones alcanzables desde el tablero
+#  vacío (empezando X y deteniéndose al ganar o llenar el tablero).
+#
+#  Cada tablero tiene un código en base 3 (" " = 0, "X" = 1, "O" = 2, la
+#  casilla 0 es el dígito más significativo) y cada posición alcanzable un
+#  índice denso entre 0 y NUM_ESTADOS - 1, ordenado por código:
+#     codificar(tablero)        -> código (0..19682)
+#     indice_estado(tablero)    -> índice denso (rank)
+#     tablero_de_indice(indice) -> lista de 9 strings (unrank)
+# =============================================================================
+
+NUM_CODIGOS = 3 ** 9
+
+_A_BASE3 = str.maketrans({" ": "0", "X": "1", "O": "2"})
+_FICHAS = (" ", "X", "O")
+
+_COMBINACIONES_GANADORAS = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6)
+)
+
+
+def codificar(tablero):
+    """Código en base 3 del tablero (la conversión la hace int() en C, sin bucles en Python)."""
+    return int("".join(tablero).translate(_A_BASE3), 3)
+
+
+def decodificar(codigo):
+    """Inverso de codificar: devuelve la lista de 9 strings."""
+    tablero = [" "] * 9
+    for i in range(8, -1, -1):
+        codigo, digito = divmod(codigo, 3)
+        tablero[i] = _FICHAS[digito]
+    return tablero
+
+
+def _enumerar_codigos():
+    """
+    Recorre el árbol de juego completo una vez y devuelve los códigos alcanzables ordenados.
+    Trabaja con máscaras de bits por jugador para que importar el módulo sea barato.
+    """
+    lineas = [sum(1 << i for i in combo) for combo in _COMBINACIONES_GANADORAS]
+    gana = [any(m & l == l for l in lineas) for m in range(512)]
+    aporte = [sum(3 ** (8 - i) for i in range(9) if m & (1 << i)) for m in range(512)]
+    bits_casilla = [1 << i for i in range(9)]
+
+    vistos = set()
+    pendientes = [(0, 0)]
+    while pendientes:
+        bits_x, bits_o = pendientes.pop()
+        codigo = aporte[bits_x] + 2 * aporte[bits_o]
+        if codigo in vistos:
+            continue
+        vistos.add(codigo)
+        ocupadas = bits_x | bits_o
+        if ocupadas == 0b111111111:
+            continue
+        if gana[bits_x] or gana[bits_o]:
+            continue
+        turno_x = bin(bits_x).count("1") == bin(bits_o).count("1")
+        for bit in bits_casilla:
+            if not ocupadas & bit:
+                pendientes.append((bits_x | bit, bits_o) if turno_x else (bits_x, bits_o | bit))
+    return sorted(vistos)
+
+
+# --------------------
+# TABLAS DE RANK / UNRANK
+# CODIGOS[indice] -> código base 3
+# INDICE_POR_CODIGO[codigo] -> índice denso (-1 si la posición no es alcanzable)
+# --------------------
+CODIGOS = array("H", _enumerar_codigos())
+NUM_ESTADOS = len(CODIGOS)
+
+INDICE_POR_CODIGO = array("h", [-1]) * NUM_CODIGOS
+for _indice, _codigo in enumerate(CODIGOS):
+    INDICE_POR_CODIGO[_codigo] = _indice
+
+
+def indice_de_codigo(codigo):
+    indice = INDICE_POR_CODIGO[codigo]
+    if indice < 0:
+        raise ValueError(f"El código {codigo} no corresponde a una posición alcanzable")
+    return indice
+
+
+def indice_estado(tablero):
+    """Rank: índice denso de una posición alcanzable."""
+    return indice_de_codigo(codificar(tablero))
+
+
+def tablero_de_indice(indice):
+    """Unrank: lista de 9 strings de la posición con ese índice."""
+    return decodificar(CODIGOS[indice])
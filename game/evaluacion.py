@@ -0,0 +1,113 @@
+# EVALUACION.PY: Qué tan cerca del juego perfecto está la política de un agente
+
+from game.estados import CODIGOS, INDICE_POR_CODIGO, NUM_ESTADOS, decodificar
+from game.tablebase import obtener_tablebase
+
+# =============================================================================
+#  EVALUACIÓN CONTRA LA TABLEBASE
+# =============================================================================
+#  Para cada posición alcanzable, no terminal y con X en turno se sabe, por la
+#  tablebase, qué jugadas conservan el valor teórico (ganar si se podía ganar,
+#  empatar si se podía empatar). Una posición cuenta como "jugada de forma
+#  óptima" solo si TODAS las jugadas greedy del agente (las empatadas en el
+#  Q máximo, entre las que elige al azar) son de esas.
+# =============================================================================
+
+_POTENCIAS = tuple(3 ** (8 - i) for i in range(9))
+_OPTIMAS = None
+
+
+def jugadas_optimas():
+    """{estado: (casillas legales, frozenset de casillas óptimas)} para las posiciones de X (se calcula una vez)."""
+    global _OPTIMAS
+    if _OPTIMAS is None:
+        tablebase = obtener_tablebase()
+        _OPTIMAS = {}
+        for s in range(NUM_ESTADOS):
+            if tablebase.mejor_movimiento(s) is None:
+                continue  # partida terminada
+            tablero = decodificar(CODIGOS[s])
+            if tablero.count("X") != tablero.count("O"):
+                continue  # le toca a O
+            legales = tuple(i for i in range(9) if tablero[i] == " ")
+            optimas = frozenset(
+                m for m in legales
+                if tablebase.valor[INDICE_POR_CODIGO[CODIGOS[s] + _POTENCIAS[m]]] == tablebase.valor[s]
+            )
+            _OPTIMAS[s] = (legales, optimas)
+    return _OPTIMAS
+
+
+def politica_greedy(q_table):
+    """
+    {estado: tupla de jugadas greedy (empatadas en el Q máximo)} para cada posición de X.
+    `q_table` es el diccionario de QAgent o la TablaQNumpy de QAgentNumpy (game.ai.tabla_q).
+    """
+    if hasattr(q_table, "jugadas_greedy"):
+        return q_table.jugadas_greedy(list(jugadas_optimas()))
+    politica = {}
+    for s, (legales, _) in jugadas_optimas().items():
+        valores = q_table.get(s)
+        if not valores:
+            politica[s] = legales
+            continue
+        q = [valores.get(m, 0.0) for m in legales]
+        mejor = max(q)
+        politica[s] = tuple(m for m, v in zip(legales, q) if v == mejor)
+    return politica
+
+
+def posiciones_suboptimas(q_table, politica=None):
+    """Estados de X donde alguna jugada greedy de la Tabla Q pierde valor teórico."""
+    if politica is None:
+        politica = politica_greedy(q_table)
+    optimas = jugadas_optimas()
+    return [s for s, greedy in politica.items() if not optimas[s][1].issuperset(greedy)]
+
+
+def fraccion_optima(q_table, politica=None):
+    """Fracción de posiciones de X (0 a 1) jugadas de forma óptima por la política greedy."""
+    total = len(jugadas_optimas())
+    return 1.0 - len(posiciones_suboptimas(q_table, politica)) / total
+
+
+def recorrido_de_politica(politica):
+    """
+    Recorre desde el tablero vacío las posiciones de X a las que llega la política greedy
+    (todas sus jugadas empatadas) contra cualquier respuesta de O.
+    Retorna (posiciones de X alcanzadas, si alguna respuesta de O gana).
+    """
+    tablebase = obtener_tablebase()
+    vistos = set()
+    pierde = False
+    pendientes = [INDICE_POR_CODIGO[0]]
+    while pendientes:
+        s = pendientes.pop()
+        if s in vistos:
+            continue
+        vistos.add(s)
+        for m in politica[s]:
+            hija = INDICE_POR_CODIGO[CODIGOS[s] + _POTENCIAS[m]]
+            if tablebase.mejor_movimiento(hija) is None:
+                continue  # X ganó o llenó el tablero
+            codigo_hija = CODIGOS[hija]
+            for o, casilla in enumerate(decodificar(codigo_hija)):
+                if casilla != " ":
+                    continue
+                nieta = INDICE_POR_CODIGO[codigo_hija + 2 * _POTENCIAS[o]]
+                if tablebase.mejor_movimiento(nieta) is not None:
+                    pendientes.append(nieta)
+                elif tablebase.valor[nieta] == -1:
+                    pierde = True
+    return vistos, pierde
+
+
+def nunca_pierde(q_table, politica=None):
+    """
+    True si la política greedy, jugando X desde el tablero vacío, no puede perder contra
+    ninguna respuesta de O. Solo mira las posiciones a las que la política llega, así que
+    puede cumplirse antes de que todas las posiciones de X se jueguen de forma óptima.
+    """
+    if politica is None:
+        politica = politica_greedy(q_table)
+    return not recorrido_de_politica(politica)[1]
@@ -0,0 +1,242 @@
+# ITERACION_VALOR.PY: Entrenamiento sin partidas: iteración Q sobre todo el espacio de estados
+
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from game.ai import ARCHIVO_Q_TABLE, QAgent
+from game.estados import CODIGOS, INDICE_POR_CODIGO, NUM_ESTADOS
+from game.qtabla import LEGALES, TABLEROS, TERMINAL
+from game.tablebase import obtener_tablebase
+from game.trainer import RECOMPENSAS
+
+# =============================================================================
+#  ITERACIÓN Q FUERA DE LÍNEA
+# =============================================================================
+#  El entrenamiento por episodios estima Q(s, a) muestreando partidas. Como el
+#  espacio de estados es diminuto (5,478 posiciones) se puede calcular el modelo
+#  completo de transiciones y aplicar la ecuación de Bellman a TODAS las parejas
+#  (estado, jugada) a la vez hasta que dejen de cambiar:
+#
+#     Q(s, a) = sum_o P(o | s·a) * [ r(s·a·o) + gamma * max_a' Q(s·a·o, a') ]
+#
+#  con exactamente las recompensas de jugar_episodio_entrenamiento (RECOMPENSAS):
+#     X gana con su jugada       -> victoria (+10, sin futuro)
+#     X llena el tablero         -> empate   (+5,  sin futuro)
+#     O gana al responder        -> derrota  (-10, sin futuro)
+#     O llena el tablero         -> empate   (+5,  sin futuro)
+#     la partida sigue           ->  0  + gamma * max Q de la siguiente posición de X
+#
+#  El oponente (O) es un modelo de probabilidad sobre sus respuestas:
+#     aleatorio -> uniforme entre las casillas libres (el rival del entrenamiento)
+#     minimax   -> la jugada de la tablebase (juego perfecto, determinista)
+#     epsilon   -> con probabilidad `epsilon` al azar, si no la de la tablebase
+#
+#  Como cada jugada agrega una ficha el grafo no tiene ciclos: la iteración
+#  síncrona llega al punto fijo exacto en tantas vueltas como jugadas de X
+#  caben en una partida (5), más una que confirma residuo 0.
+# =============================================================================
+
+OPONENTES = ("aleatorio", "minimax", "epsilon")
+_POTENCIAS = 3 ** (8 - np.arange(9))
+
+
+def _probabilidades_oponente(estado, oponente, epsilon, tablebase):
+    """Casillas de respuesta de O en `estado` y la probabilidad de cada una."""
+    legales = LEGALES[estado]
+    uniforme = np.full(len(legales), 1.0 / len(legales))
+    if oponente == "aleatorio":
+        return legales, uniforme
+    perfecta = (legales == tablebase.mejor[estado]).astype(np.float64)
+    if oponente == "minimax":
+        return legales, perfecta
+    return legales, epsilon * uniforme + (1.0 - epsilon) * perfecta
+
+
+class ModeloTransiciones:
+    """
+    Todas las parejas (s, a) con X en turno y su distribución de resultados,
+    aplanada en arreglos para hacer cada iteración con operaciones vectorizadas.
+
+    Por pareja:   estado_par, accion_par, inmediata (recompensa si X termina la partida)
+    Por resultado (una respuesta de O con probabilidad > 0):
+                  par, probabilidad, recompensa, siguiente, continua
+    """
+
+    def __init__(self, oponente="aleatorio", epsilon=0.1):
+        if oponente not in OPONENTES:
+            raise ValueError(f"Oponente desconocido: {oponente!r} (opciones: {', '.join(OPONENTES)})")
+        tablebase = obtener_tablebase()
+        self.oponente = oponente
+        self.epsilon = epsilon
+
+        turno_x = (TABLEROS == 1).sum(axis=1) == (TABLEROS == 2).sum(axis=1)
+        self.estados = np.flatnonzero(turno_x & ~TERMINAL)
+        codigos = np.array(CODIGOS, dtype=np.int64)
+        indice_por_codigo = np.array(INDICE_POR_CODIGO, dtype=np.int64)
+        valor = np.array(tablebase.valor, dtype=np.int8)
+
+        estado_par, accion_par, inmediata = [], [], []
+        par, probabilidad, recompensa, siguiente = [], [], [], []
+        for s in self.estados.tolist():
+            for a in LEGALES[s].tolist():
+                p = len(estado_par)
+                estado_par.append(s)
+                accion_par.append(a)
+                hija = int(indice_por_codigo[codigos[s] + _POTENCIAS[a]])
+                if TERMINAL[hija]:
+                    inmediata.append(float(RECOMPENSAS["victoria"] if valor[hija] == 1 else RECOMPENSAS["empate"]))
+                    continue
+                inmediata.append(0.0)
+
+                respuestas, probs = _probabilidades_oponente(hija, oponente, epsilon, tablebase)
+                nietas = indice_por_codigo[codigos[hija] + 2 * _POTENCIAS[respuestas]]
+                for nieta, prob in zip(nietas.tolist(), probs.tolist()):
+                    if prob == 0.0:
+                        continue
+                    par.append(p)
+                    probabilidad.append(prob)
+                    siguiente.append(nieta)
+                    if not TERMINAL[nieta]:
+                        recompensa.append(0.0)
+                    else:
+                        recompensa.append(float(RECOMPENSAS["derrota"] if valor[nieta] == -1 else RECOMPENSAS["empate"]))
+
+        self.estado_par = np.array(estado_par, dtype=np.int64)
+        self.accion_par = np.array(accion_par, dtype=np.int64)
+        self.inmediata = np.array(inmediata)
+        self.par = np.array(par, dtype=np.int64)
+        self.probabilidad = np.array(probabilidad)
+        self.recompensa = np.array(recompensa)
+        self.siguiente = np.array(siguiente, dtype=np.int64)
+        self.continua = ~TERMINAL[self.siguiente]
+        # Las parejas de un mismo estado son contiguas: inicio de cada bloque para reduceat
+        self._inicio_estado = np.flatnonzero(np.r_[True, self.estado_par[1:] != self.estado_par[:-1]])
+
+    def __len__(self):
+        return self.estado_par.size
+
+    def valores_de_estado(self, q):
+        """V(s) = max_a Q(s, a) por estado (0.0 para los que no son de X o ya terminaron)."""
+        v = np.zeros(NUM_ESTADOS)
+        v[self.estado_par[self._inicio_estado]] = np.maximum.reduceat(q, self._inicio_estado)
+        return v
+
+    def bellman(self, q, gamma):
+        """Una aplicación síncrona de la ecuación de Bellman a todas las parejas."""
+        futuro = np.where(self.continua, gamma * self.valores_de_estado(q)[self.siguiente], 0.0)
+        esperado = np.bincount(self.par, weights=self.probabilidad * (self.recompensa + futuro), minlength=len(self))
+        return self.inmediata + esperado
+
+
+def iterar_q(modelo, gamma=0.9, tolerancia=1e-9, max_iteraciones=1000):
+    """
+    Aplica Bellman hasta que el residuo (máximo |Q_nueva - Q|) baje de `tolerancia`.
+    Retorna (Q por pareja, lista de residuos por iteración).
+    """
+    q = np.zeros(len(modelo))
+    residuos = []
+    for _ in range(max_iteraciones):
+        nueva = modelo.bellman(q, gamma)
+        residuos.append(float(np.abs(nueva - q).max()))
+        q = nueva
+        if residuos[-1] < tolerancia:
+            break
+    return q, residuos
+
+
+def a_tabla_q(modelo, q):
+    """Q por pareja -> Tabla Q en el formato de QAgent ({estado: {casilla: valor}})."""
+    q_table = {}
+    for s, a, valor in zip(modelo.estado_par.tolist(), modelo.accion_par.tolist(), q.tolist()):
+        q_table.setdefault(s, {})[a] = valor
+    return q_table
+
+
+def resolver(oponente="aleatorio", epsilon=0.1, gamma=0.9, tolerancia=1e-9, archivo=None):
+    """
+    Construye el modelo, itera hasta converger y (si se da `archivo`) guarda el cerebro
+    con QAgent.guardar_conocimiento, igual que los entrenamientos por episodios.
+    Retorna (q_table, informe).
+    """
+    inicio = time.perf_counter()
+    modelo = ModeloTransiciones(oponente, epsilon)
+    construido = time.perf_counter()
+    q, residuos = iterar_q(modelo, gamma, tolerancia)
+    q_table = a_tabla_q(modelo, q)
+    fin = time.perf_counter()
+
+    if archivo is not None:
+        agente = QAgent(gamma=gamma, cargar=False, archivo=archivo)
+        agente.q_table = q_table
+        agente.guardar_conocimiento()
+
+    informe = {
+        "oponente": oponente,
+        "estados": len(modelo.estados),
+        "parejas": len(modelo),
+        "transiciones": modelo.par.size,
+        "iteraciones": len(residuos),
+        "residuos": residuos,
+        "segundos_modelo": construido - inicio,
+        "segundos_iteracion": fin - construido,
+    }
+    return q_table, informe
+
+
+# =============================================================================
+#  COMPARACIÓN CONTRA EL ENTRENAMIENTO MUESTREADO
+# =============================================================================
+
+def comparar_con_muestreo(episodios=(20000, 100000), semilla=0):
+    """Tiempo y fracción de posiciones de X jugadas de forma óptima: iteración Q vs episodios."""
+    from game.evaluacion import fraccion_optima
+    from game.trainer import ejecutar_entrenamiento_vectorizado
+
+    filas = []
+    for oponente in OPONENTES:
+        q_table, informe = resolver(oponente)
+        filas.append((f"iteración Q ({oponente})", informe["segundos_modelo"] + informe["segundos_iteracion"],
+                      fraccion_optima(q_table)))
+    for n in episodios:
+        agente = QAgent(cargar=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            ejecutar_entrenamiento_vectorizado(n, agente=agente, semilla=semilla, guardar=False)
+            duracion = time.perf_counter() - inicio
+        filas.append((f"vectorizado {n} episodios", duracion, fraccion_optima(agente.q_table)))
+
+    print(f"{'Método':<34} {'Tiempo (s)':>10} {'Óptimas':>8}")
+    for nombre, segundos, fraccion in filas:
+        print(f"{nombre:<34} {segundos:>10.2f} {fraccion * 100:>7.1f}%")
+    return filas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resuelve la Tabla Q por iteración de valor (sin jugar partidas).")
+    parser.add_argument("--oponente", choices=OPONENTES, default="aleatorio",
+                        help="Modelo del rival O (por defecto el rival aleatorio del entrenamiento)")
+    parser.add_argument("--epsilon", type=float, default=0.1, help="Probabilidad de jugada al azar del oponente 'epsilon'")
+    parser.add_argument("--gamma", type=float, default=0.9)
+    parser.add_argument("--tolerancia", type=float, default=1e-9)
+    parser.add_argument("--archivo", default=ARCHIVO_Q_TABLE, help="Cerebro a escribir (su binario .qtb)")
+    parser.add_argument("--comparar", action="store_true", help="Comparar contra el entrenamiento por episodios")
+    args = parser.parse_args()
+
+    if args.comparar:
+        comparar_con_muestreo()
+        return
+
+    _, informe = resolver(args.oponente, args.epsilon, args.gamma, args.tolerancia, args.archivo)
+    print(f"Oponente: {informe['oponente']} | {informe['estados']} estados de X, "
+          f"{informe['parejas']} parejas (s, a), {informe['transiciones']} transiciones")
+    for i, residuo in enumerate(informe["residuos"], 1):
+        print(f"Iteración {i}: residuo {residuo:.3e}")
+    print(f"Modelo: {informe['segundos_modelo'] * 1000:.1f} ms | Iteración: {informe['segundos_iteracion'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,70 @@
 # LOGIC.PY: Archivo que contiene la lógica del juego
 
+COMBINACIONES_GANADORAS = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8), # Filas
+    (0, 3, 6), (1, 4, 7), (2, 5, 8), # Columnas
+    (0, 4, 8), (2, 4, 6)             # Diagonales
+)
+
+# Líneas que pasan por cada casilla: al colocar una ficha solo esas pueden completarse
+LINEAS_POR_CASILLA = tuple(
+    tuple(combo for combo in COMBINACIONES_GANADORAS if casilla in combo)
+    for casilla in range(9)
+)
+
+
 class LogicaTresRayas:
 
     def __init__(self):
-        self.tablero = [" " for _ in range(9)]
+        self.reiniciar()
+
+    def reiniciar(self):
+        self._casillas = [" " for _ in range(9)]
         self.historial = []
         self.ganador = None
         self.combo_ganador = None
+        self.num_movimientos = 0
+        self.terminado = False
 
-    def reiniciar(self):
-        self.tablero = [" " for _ in range(9)]
+    # --------------------
+    # El ganador y el fin de partida se mantienen al mover, así que el tablero
+    # no se puede modificar casilla a casilla desde fuera: `juego.tablero` es
+    # una copia de solo lectura (tupla) y asignarle un tablero completo pasa
+    # por establecer_tablero, que recalcula el estado.
+    # --------------------
+    @property
+    def tablero(self):
+        return tuple(self._casillas)
+
+    @tablero.setter
+    def tablero(self, valores):
+        self.establecer_tablero(valores)
+
+    # --------------------
+    # Función que carga un tablero completo (p. ej. una posición a analizar)
+    # y recalcula el estado que realizar_movimiento mantiene incrementalmente.
+    # El orden de las jugadas no se conoce: el historial queda en orden de casilla.
+    # --------------------
+    def establecer_tablero(self, tablero):
+        casillas = self._casillas = list(tablero)
+        self.historial = [i for i in range(9) if casillas[i] != " "]
+        self.num_movimientos = len(self.historial)
+        self._buscar_ganador()
+        self.terminado = self.ganador is not None or self.num_movimientos == 9
+
+    def _buscar_ganador(self):
+        """Revisa todas las líneas y deja en ganador/combo_ganador la primera completa (o None)."""
+        casillas = self._casillas
         self.ganador = None
         self.combo_ganador = None
+        for a, b, c in COMBINACIONES_GANADORAS:
+            if casillas[a] != " " and casillas[a] == casillas[b] == casillas[c]:
+                self.ganador = casillas[a]
+                self.combo_ganador = [a, b, c]
+                break
 
     def existe_espacio_libre(self):
-        return " " in self.tablero
+        return self.num_movimientos < 9
 
     # --------------------
     # Función que verifica si el movimiento del jugador es válido:
@@ -23,47 +73,60 @@ class LogicaTresRayas:
     def es_movimiento_valido(self, indice):
         if indice < 0 or indice > 8:
             return False
-        return self.tablero[indice] == " "
+        return self._casillas[indice] == " "
     
     # --------------------
     # Función que añade al tablero el movimiento del jugador
-    # siempre y cuando sea un movimiento válido 
+    # siempre y cuando sea un movimiento válido.
+    # Solo revisa las líneas que pasan por la casilla jugada; el estado de la
+    # partida queda en ganador, combo_ganador, num_movimientos y terminado.
     # --------------------
     def realizar_movimiento(self, indice, jugador):
-        if self.es_movimiento_valido(indice):
-            self.tablero[indice] = jugador
-            self.historial.append(indice)
-            return True
-        return False
+        if not self.es_movimiento_valido(indice):
+            return False
+
+        tablero = self._casillas
+        tablero[indice] = jugador
+        self.historial.append(indice)
+        self.num_movimientos += 1
+
+        if self.ganador is None:
+            for a, b, c in LINEAS_POR_CASILLA[indice]:
+                if tablero[a] == tablero[b] == tablero[c]:
+                    self.ganador = jugador
+                    self.combo_ganador = [a, b, c]
+                    break
+        self.terminado = self.ganador is not None or self.num_movimientos == 9
+        return True
 
     # --------------------
-    # Función que se encarga de verificar si uno de los jugadores ganó
-    # verifica a partir de las combinaciones posibles para ganar
-    # a partir de filas, columnas o diagonales
+    # Función que retira la última ficha colocada (para que las búsquedas
+    # usen un solo tablero mutable en vez de copiarlo en cada rama).
+    # Solo si la ficha retirada era parte de la línea ganadora se vuelve a
+    # buscar ganador: tras establecer_tablero el historial va en orden de
+    # casilla, así que la última ficha no tiene por qué ser la que ganó.
     # --------------------
-    def verificar_ganador(self):
-        combinaciones_ganadoras = [
-            (0, 1, 2), (3, 4, 5), (6, 7, 8), # Filas
-            (0, 3, 6), (1, 4, 7), (2, 5, 8), # Columnas
-            (0, 4, 8), (2, 4, 6)             # Diagonales
-        ]
+    def deshacer_movimiento(self):
+        indice = self.historial.pop()
+        self._casillas[indice] = " "
+        self.num_movimientos -= 1
+        if self.combo_ganador is not None and indice in self.combo_ganador:
+            self._buscar_ganador()
+        self.terminado = self.ganador is not None
+        return indice
 
-        for a, b, c in combinaciones_ganadoras:
-            if self.tablero[a] != " " and self.tablero[a] == self.tablero[b] == self.tablero[c]:
-                self.ganador = self.tablero[a]
-                self.combo_ganador = [a, b, c] 
-                return self.ganador
-        return None
+    # --------------------
+    # Función que indica si uno de los jugadores ganó (filas, columnas o
+    # diagonales). El ganador se calcula al realizar cada movimiento.
+    # --------------------
+    def verificar_ganador(self):
+        return self.ganador
 
     # --------------------
     # Función que indica si el juego ha terminado
     # --------------------
     def juego_terminado(self):
-        if self.verificar_ganador() is not None:
-            return True
-        if not self.existe_espacio_libre():
-            return True
-        return False
+        return self.terminado
 
     # --------------------
     # Función que le indicará al agente como al jugador qué espacios
@@ -72,6 +135,6 @@ class LogicaTresRayas:
     def obtener_movimientos_posibles(self):
         movimientos = []
         for i in range(9):
-            if self.tablero[i] == " ":
+            if self._casillas[i] == " ":
                 movimientos.append(i)
         return movimientos
\ No newline at end of file
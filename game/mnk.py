@@ -0,0 +1,216 @@
+# MNK.PY: Variantes m,n,k del juego (tablero de m x n, gana quien alinea k)
+
+import random
+
+from game.ai import QAgent
+from game.busqueda import MotorNegamax
+from game.persistencia import escribir_json, leer_json
+
+# =============================================================================
+#  VARIANTES m,n,k
+# =============================================================================
+#  El Tres en Raya es el caso 3,3,3. Esta variante generaliza el tablero a
+#  `filas` x `columnas` casillas con victoria al alinear `k` fichas en fila,
+#  columna o diagonal, para poner a prueba a los agentes en 4x4, 5x5, ...
+#
+#  - LogicaMNK tiene la misma interfaz que LogicaTresRayas (y la de búsqueda
+#    de game/busqueda.py), y mantiene un hash Zobrist incremental: cada
+#    (casilla, ficha) tiene un entero aleatorio de 64 bits y el hash de la
+#    posición es el XOR de los de sus fichas, así que poner o quitar una ficha
+#    lo actualiza con un solo XOR. Es la clave de la tabla de transposición.
+#  - La victoria se comprueba solo en las líneas que pasan por la última
+#    casilla jugada.
+#  - QAgentMNK guarda la Tabla Q con el código base 3 del tablero como clave
+#    (invertible, así el cerebro se puede guardar en el JSON histórico).
+#
+#  El 3x3 de siempre sigue usando LogicaTresRayas / QAgent sin cambios.
+# =============================================================================
+
+_A_BASE3 = str.maketrans({" ": "0", "X": "1", "O": "2"})
+_FICHAS = (" ", "X", "O")
+
+
+class Variante:
+    def __init__(self, filas=3, columnas=3, k=3, semilla_zobrist=20240607):
+        if k > max(filas, columnas):
+            raise ValueError("k no puede ser mayor que el lado más largo del tablero")
+        self.filas = filas
+        self.columnas = columnas
+        self.k = k
+        self.num_casillas = filas * columnas
+
+        # Todas las líneas de k casillas (horizontales, verticales y ambas diagonales)
+        self.lineas = []
+        for f in range(filas):
+            for c in range(columnas):
+                for df, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    fin_f, fin_c = f + df * (k - 1), c + dc * (k - 1)
+                    if 0 <= fin_f < filas and 0 <= fin_c < columnas:
+                        self.lineas.append(tuple((f + df * i) * columnas + (c + dc * i) for i in range(k)))
+        self.lineas_por_casilla = [[l for l in self.lineas if casilla in l] for casilla in range(self.num_casillas)]
+
+        rng = random.Random(semilla_zobrist)
+        self.zobrist = [{"X": rng.getrandbits(64), "O": rng.getrandbits(64)} for _ in range(self.num_casillas)]
+
+    @property
+    def es_estandar(self):
+        return (self.filas, self.columnas, self.k) == (3, 3, 3)
+
+    def __repr__(self):
+        return f"Variante({self.filas}x{self.columnas}, k={self.k})"
+
+    def crear_juego(self):
+        return LogicaMNK(self)
+
+    def clave_estado(self, tablero):
+        """Código base 3 del tablero (clave de la Tabla Q)."""
+        return int("".join(tablero).translate(_A_BASE3), 3)
+
+    def tablero_de_clave(self, clave):
+        tablero = [" "] * self.num_casillas
+        for i in range(self.num_casillas - 1, -1, -1):
+            clave, digito = divmod(clave, 3)
+            tablero[i] = _FICHAS[digito]
+        return tablero
+
+    def hash_zobrist(self, tablero):
+        """Hash Zobrist calculado desde cero (LogicaMNK lo mantiene incrementalmente)."""
+        h = 0
+        for i, ficha in enumerate(tablero):
+            if ficha != " ":
+                h ^= self.zobrist[i][ficha]
+        return h
+
+
+VARIANTE_ESTANDAR = Variante(3, 3, 3)
+
+
+class LogicaMNK:
+
+    def __init__(self, variante=VARIANTE_ESTANDAR):
+        self.variante = variante
+        self.num_casillas = variante.num_casillas
+        self.reiniciar()
+
+    @classmethod
+    def desde_tablero(cls, variante, tablero):
+        """Crea el juego a partir de una lista de casillas (el orden del historial se pierde)."""
+        juego = cls(variante)
+        for i, ficha in enumerate(tablero):
+            if ficha != " ":
+                juego.tablero[i] = ficha
+                juego.hash ^= variante.zobrist[i][ficha]
+                juego.historial.append(i)
+        juego.verificar_ganador()
+        juego._ply_ganador = len(juego.historial) if juego.ganador else None
+        return juego
+
+    def reiniciar(self):
+        self.tablero = [" "] * self.num_casillas
+        self.historial = []
+        self.ganador = None
+        self.combo_ganador = None
+        self.hash = 0
+        self._ply_ganador = None
+
+    def existe_espacio_libre(self):
+        return len(self.historial) < self.num_casillas
+
+    def es_movimiento_valido(self, indice):
+        if indice < 0 or indice >= self.num_casillas:
+            return False
+        return self.tablero[indice] == " "
+
+    def _colocar(self, indice, jugador):
+        self.tablero[indice] = jugador
+        self.hash ^= self.variante.zobrist[indice][jugador]
+        self.historial.append(indice)
+        if self._ply_ganador is None:
+            tablero = self.tablero
+            for linea in self.variante.lineas_por_casilla[indice]:
+                if all(tablero[i] == jugador for i in linea):
+                    self.ganador = jugador
+                    self.combo_ganador = list(linea)
+                    self._ply_ganador = len(self.historial)
+                    break
+
+    def realizar_movimiento(self, indice, jugador):
+        if self.es_movimiento_valido(indice):
+            self._colocar(indice, jugador)
+            return True
+        return False
+
+    def verificar_ganador(self):
+        for linea in self.variante.lineas:
+            a = self.tablero[linea[0]]
+            if a != " " and all(self.tablero[i] == a for i in linea):
+                self.ganador = a
+                self.combo_ganador = list(linea)
+                return a
+        return None
+
+    def juego_terminado(self):
+        return self._ply_ganador is not None or not self.existe_espacio_libre()
+
+    def obtener_movimientos_posibles(self):
+        return [i for i in range(self.num_casillas) if self.tablero[i] == " "]
+
+    # --------------------
+    # Interfaz de búsqueda (game/busqueda.py)
+    # --------------------
+    def mover(self, indice):
+        self._colocar(indice, "O" if len(self.historial) & 1 else "X")
+
+    def deshacer_movimiento(self):
+        if self._ply_ganador == len(self.historial):
+            self._ply_ganador = None
+            self.ganador = None
+            self.combo_ganador = None
+        indice = self.historial.pop()
+        self.hash ^= self.variante.zobrist[indice][self.tablero[indice]]
+        self.tablero[indice] = " "
+        return indice
+
+    def hay_ganador(self):
+        return self._ply_ganador is not None
+
+    def clave(self):
+        return self.hash
+
+
+class QAgentMNK(QAgent):
+    """QAgent para una variante m,n,k: la clave de estado es el código base 3 del tablero."""
+
+    def __init__(self, variante, alpha=0.5, gamma=0.9, epsilon=1.0, cargar=False, archivo=None, **kwargs):
+        self.variante = variante
+        if archivo is None:
+            archivo = f"conocimiento_{variante.filas}x{variante.columnas}_k{variante.k}.json"
+        super().__init__(alpha=alpha, gamma=gamma, epsilon=epsilon, cargar=cargar, archivo=archivo, **kwargs)
+
+    def obtener_estado(self, tablero):
+        return self.variante.clave_estado(tablero)
+
+    def guardar_conocimiento(self):
+        """Solo JSON: el formato binario .qtb está pensado para los índices densos del 3x3."""
+        try:
+            escribir_json(self.q_table, self.archivo, a_tablero=self.variante.tablero_de_clave)
+            print(f" Cerebro guardado en {self.archivo} ({len(self.q_table)} estados).")
+        except Exception as e:
+            print(f" Error guardando cerebro: {e}")
+
+    def cargar_conocimiento(self):
+        try:
+            self.q_table = leer_json(self.archivo, a_estado=self.variante.clave_estado)
+            print(f"Cerebro cargado: {len(self.q_table)} estados aprendidos.")
+            self.epsilon = 0.0
+        except FileNotFoundError:
+            print("No hay cerebro guardado.")
+        except Exception as e:
+            print(f" Error cargando cerebro {self.archivo}: {e}")
+            self.q_table = {}
+
+
+def mejor_movimiento_mnk(variante, tablero, tiempo_limite=1.0, profundidad_max=None):
+    """Jugada y puntaje (para quien mueve) del motor Negamax sobre una variante."""
+    juego = LogicaMNK.desde_tablero(variante, tablero)
+    return MotorNegamax().buscar(juego, profundidad_max=profundidad_max, tiempo_limite=tiempo_limite)
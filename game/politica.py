@@ -0,0 +1,202 @@
+# POLITICA.PY: Política greedy compilada (una casilla por tablero) para jugar sin la Tabla Q
+
+import argparse
+import os
+import struct
+import time
+
+from game.ai import ARCHIVO_Q_TABLE, QAgent, TIEMPOS_ARRANQUE, archivo_cerebro, obtener_agente, tabla_q
+from game.diario import rutas_diarios
+from game.estados import CODIGOS, codificar, decodificar
+from game.logic import COMBINACIONES_GANADORAS
+
+# =============================================================================
+#  POLÍTICA COMPILADA
+# =============================================================================
+#  Para jugar (en_entrenamiento=False) QAgent arma un diccionario de valores,
+#  busca el máximo y rompe empates al azar; además, si el estado no existe lo
+#  inserta con ceros, así que cada partida modifica la Tabla Q.
+#  Compilar la tabla resuelve todo eso una sola vez:
+#     JUGADAS[codigo]  -> mejor casilla (0-8) del tablero con ese código en base 3
+#                         (game/estados.py), o SIN_JUGADA si la partida terminó
+#                         o el tablero no es alcanzable.
+#  Son 3^9 = 19,683 bytes inmutables (bytes, no bytearray): jugar es codificar
+#  el tablero y leer un byte, sin tocar la Tabla Q.
+#
+#  Diferencias con QAgent.obtener_accion:
+#     - Los empates en el Q máximo se rompen por la casilla de menor índice
+#       (determinista) en vez de al azar.
+#     - Un estado que la Tabla Q no tiene vale 0.0 en todas sus casillas, igual
+#       que en QAgent, así que juega su primera casilla libre.
+#  La Tabla Q debe usar los índices densos de game/estados.py (QAgent,
+#  QAgentNumpy); no sirve para la de simetrías ni para las variantes m,n,k.
+#
+#  `python -m game.politica` guarda la política junto al cerebro (mismo nombre,
+#  extensión .pol). obtener_politica la lee de ahí si no es más vieja que el
+#  cerebro, sin cargar la Tabla Q; si no existe, está desactualizada o no se
+#  puede leer, compila el cerebro como antes.
+# =============================================================================
+
+SIN_JUGADA = 255
+NUM_CODIGOS = 3 ** 9
+ARCHIVO_POLITICA = "conocimiento_gato.pol"
+
+MAGIC = b"POLQ"
+VERSION_POLITICA = 1
+_CABECERA = struct.Struct("<4sHxxI")
+
+
+def _hay_linea(tablero):
+    return any(tablero[a] != " " and tablero[a] == tablero[b] == tablero[c] for a, b, c in COMBINACIONES_GANADORAS)
+
+
+def compilar_jugadas(q_table):
+    """
+    Tabla Q ({estado: {casilla: valor}} o la TablaQNumpy de QAgentNumpy)
+    -> bytes de NUM_CODIGOS con la mejor casilla por código.
+    """
+    jugadas = bytearray([SIN_JUGADA]) * NUM_CODIGOS
+    if hasattr(q_table, "primeras_mejores"):
+        estados, mejores = q_table.primeras_mejores()
+        for estado, mov in zip(estados.tolist(), mejores.tolist()):
+            jugadas[CODIGOS[estado]] = mov
+        return bytes(jugadas)
+    for estado, codigo in enumerate(CODIGOS):
+        tablero = decodificar(codigo)
+        libres = [i for i in range(9) if tablero[i] == " "]
+        if not libres or _hay_linea(tablero):
+            continue
+        valores = q_table.get(estado, {})
+        # max() se queda con el primero de los empatados: la casilla de menor índice
+        jugadas[codigo] = max(libres, key=lambda m: valores.get(m, 0.0))
+    return bytes(jugadas)
+
+
+class PoliticaCompilada:
+    """Jugador de solo lectura con la misma firma de obtener_accion que QAgent."""
+
+    __slots__ = ("jugadas",)
+
+    def __init__(self, jugadas):
+        if len(jugadas) != NUM_CODIGOS:
+            raise ValueError(f"Se esperaban {NUM_CODIGOS} jugadas, hay {len(jugadas)}")
+        self.jugadas = bytes(jugadas)
+
+    @classmethod
+    def desde_q_table(cls, q_table):
+        return cls(compilar_jugadas(q_table))
+
+    def obtener_accion(self, tablero, movimientos_posibles, en_entrenamiento=False):
+        """Casilla elegida en O(1). `en_entrenamiento` se ignora: la política no explora ni aprende."""
+        mov = self.jugadas[codificar(tablero)]
+        if mov == SIN_JUGADA:
+            # Tablero fuera del espacio alcanzable: cualquier casilla libre es válida
+            return movimientos_posibles[0] if movimientos_posibles else None
+        return mov
+
+    # --------------------
+    # PERSISTENCIA
+    # --------------------
+    def guardar(self, ruta):
+        with open(ruta, "wb") as f:
+            f.write(_CABECERA.pack(MAGIC, VERSION_POLITICA, NUM_CODIGOS))
+            f.write(self.jugadas)
+
+    @classmethod
+    def cargar(cls, ruta):
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        magic, version, n = _CABECERA.unpack_from(datos, 0)
+        if magic != MAGIC or version != VERSION_POLITICA or n != NUM_CODIGOS:
+            raise ValueError(f"{ruta} no es una política compatible")
+        return cls(datos[_CABECERA.size:_CABECERA.size + n])
+
+
+def ruta_politica(archivo):
+    """Política compilada que acompaña a un cerebro: el mismo nombre con extensión .pol."""
+    return os.path.splitext(archivo)[0] + ".pol"
+
+
+def politica_al_dia(ruta, archivo):
+    """True si la política `ruta` existe y no es más vieja que el cerebro (JSON, .qtb o sus diarios) del que sale."""
+    if not os.path.exists(ruta):
+        return False
+    binario = os.path.splitext(archivo)[0] + ".qtb"
+    fuentes = [archivo, binario] + rutas_diarios(binario)
+    return all(os.path.getmtime(ruta) >= os.path.getmtime(f) for f in fuentes if os.path.exists(f))
+
+
+_POLITICAS = {}
+
+def obtener_politica(nombre="principal"):
+    """
+    Política compilada del cerebro registrado con ese nombre (game/ai.py).
+    La primera vez que se pide se lee su .pol si está al día o, si no, se
+    compila el cerebro; después queda cacheada.
+    """
+    if nombre not in _POLITICAS:
+        archivo = archivo_cerebro(nombre)
+        ruta = ruta_politica(archivo)
+        if politica_al_dia(ruta, archivo):
+            inicio = time.perf_counter()
+            try:
+                _POLITICAS[nombre] = PoliticaCompilada.cargar(ruta)
+                TIEMPOS_ARRANQUE[f"cargar_politica_{nombre}"] = time.perf_counter() - inicio
+            except (OSError, ValueError, struct.error) as e:
+                print(f" Error cargando política {ruta}: {e}")
+
+    if nombre not in _POLITICAS:
+        agente = obtener_agente(nombre)
+        inicio = time.perf_counter()
+        _POLITICAS[nombre] = PoliticaCompilada.desde_q_table(tabla_q(agente))
+        TIEMPOS_ARRANQUE[f"compilar_{nombre}"] = time.perf_counter() - inicio
+    return _POLITICAS[nombre]
+
+
+# =============================================================================
+#  COMPILACIÓN Y MEDICIÓN (python -m game.politica)
+# =============================================================================
+
+def comparar_con_agente(politica, agente, repeticiones=20):
+    """µs por jugada de QAgent.obtener_accion (modo experto) y de la política compilada."""
+    from game.estados import NUM_ESTADOS
+    from game.tablebase import obtener_tablebase
+
+    tablebase = obtener_tablebase()
+    posiciones = []
+    for s in range(NUM_ESTADOS):
+        if tablebase.mejor_movimiento(s) is not None:
+            tablero = decodificar(CODIGOS[s])
+            posiciones.append((tablero, [i for i in range(9) if tablero[i] == " "]))
+
+    tiempos = {}
+    for nombre, jugador in (("QAgent", agente), ("compilada", politica)):
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            for tablero, movimientos in posiciones:
+                jugador.obtener_accion(tablero, movimientos, en_entrenamiento=False)
+        tiempos[nombre] = (time.perf_counter() - inicio) / (repeticiones * len(posiciones)) * 1e6
+    return tiempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compila la Tabla Q en una política greedy de 19,683 bytes.")
+    parser.add_argument("--archivo", default=ARCHIVO_Q_TABLE, help="cerebro a compilar (JSON o su .qtb)")
+    parser.add_argument("--salida", help=f"por defecto, junto al cerebro con extensión .pol ({ARCHIVO_POLITICA})")
+    args = parser.parse_args()
+    salida = args.salida or ruta_politica(args.archivo)
+
+    agente = QAgent(archivo=args.archivo)
+    inicio = time.perf_counter()
+    politica = PoliticaCompilada.desde_q_table(agente.q_table)
+    duracion = time.perf_counter() - inicio
+    politica.guardar(salida)
+    print(f"Política compilada en {duracion * 1000:.1f} ms y guardada en {salida} "
+          f"({os.path.getsize(salida)} bytes).")
+
+    tiempos = comparar_con_agente(politica, agente)
+    print(f"obtener_accion: QAgent {tiempos['QAgent']:.2f} us/jugada | compilada {tiempos['compilada']:.2f} us/jugada")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+# QTABLA.PY: Tabla Q respaldada por arreglos de NumPy
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from game.ai import ARCHIVO_Q_TABLE, QAgent
+from game.bitboard import TABLA_GANADOR
+from game.estados import CODIGOS, INDICE_POR_CODIGO, NUM_ESTADOS
+
+# =============================================================================
+#  ALMACENAMIENTO MATRICIAL DE LA TABLA Q
+# =============================================================================
+#  Alternativa al diccionario de diccionarios de QAgent:
+#  - `valores`: matriz (NUM_ESTADOS, 9) float32, una fila por posición alcanzable
+#    (índice denso de game/estados.py) y una columna por casilla.
+#  - MASCARA_LEGAL: qué casillas son jugables en cada estado (todo False en
+#    los estados terminales, que no tienen futuro).
+#  - `visitado`: qué estados existen "en la memoria" (equivale a las claves
+#    del diccionario), para poder convertir en ambos sentidos.
+# =============================================================================
+
+_COMBINACIONES_GANADORAS = np.array([
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6)
+])
+
+
+def _digitos_de_codigos(codigos):
+    """Matriz (n, 9) int8 con las casillas de cada código (0 = vacío, 1 = X, 2 = O)."""
+    digitos = np.zeros((len(codigos), 9), dtype=np.int8)
+    resto = np.asarray(codigos, dtype=np.int64)
+    for i in range(8, -1, -1):
+        resto, digitos[:, i] = np.divmod(resto, 3)
+    return digitos
+
+
+# --------------------
+# TABLAS DERIVADAS DEL ESPACIO DE ESTADOS
+# TABLEROS[s]: casillas de cada estado; TERMINAL[s]: si la partida ya acabó;
+# MASCARA_LEGAL[s]: casillas jugables; LEGALES[s]: las mismas como arreglo de índices
+# --------------------
+TABLEROS = _digitos_de_codigos(CODIGOS)
+_lineas = TABLEROS[:, _COMBINACIONES_GANADORAS]
+TERMINAL = ((_lineas[:, :, 0] != 0) & (_lineas[:, :, 0] == _lineas[:, :, 1]) & (_lineas[:, :, 1] == _lineas[:, :, 2])).any(axis=1)
+TERMINAL |= (TABLEROS != 0).all(axis=1)
+MASCARA_LEGAL = (TABLEROS == 0) & ~TERMINAL[:, None]
+LEGALES = [np.flatnonzero(fila) for fila in MASCARA_LEGAL]
+
+# --------------------
+# PUENTE CON LOS BITBOARDS (512 entradas por máscara de 9 bits)
+# CODIGO_BITS[m]: aporte en base 3 de las casillas encendidas en m (X suma 1x, O suma 2x)
+# GANA_BITS[m]: si la máscara contiene una línea ganadora
+# --------------------
+CODIGO_BITS = np.array([sum(3 ** (8 - i) for i in range(9) if m & (1 << i)) for m in range(512)], dtype=np.int64)
+GANA_BITS = np.array(TABLA_GANADOR) >= 0
+_INDICE_POR_CODIGO = np.array(INDICE_POR_CODIGO, dtype=np.int64)
+_BITS_CASILLA = 1 << np.arange(9)
+
+
+def estados_de_bitboards(bits_x, bits_o):
+    """Índices densos de un lote de posiciones dadas como bitboards."""
+    return _INDICE_POR_CODIGO[CODIGO_BITS[bits_x] + 2 * CODIGO_BITS[bits_o]]
+
+
+def acciones_aleatorias(bits_x, bits_o, rng):
+    """Una casilla libre elegida uniformemente al azar para cada posición del lote."""
+    libres = ((bits_x | bits_o)[:, None] & _BITS_CASILLA) == 0
+    azar = rng.random(libres.shape)
+    azar[~libres] = -1.0
+    return azar.argmax(axis=1)
+
+
+class TablaQNumpy:
+    """Tabla Q densa: una fila float32 por estado alcanzable."""
+
+    def __init__(self):
+        self.valores = np.zeros((NUM_ESTADOS, 9), dtype=np.float32)
+        self.visitado = np.zeros(NUM_ESTADOS, dtype=bool)
+
+    def __len__(self):
+        return int(self.visitado.sum())
+
+    @property
+    def nbytes(self):
+        return self.valores.nbytes + self.visitado.nbytes
+
+    def mejores_acciones(self, estado):
+        """Argmax de la fila restringido a las casillas legales (puede haber empates)."""
+        legales = LEGALES[estado]
+        valores = self.valores[estado, legales]
+        return legales[valores == valores.max()]
+
+    def max_q(self, estado):
+        legales = LEGALES[estado]
+        if len(legales) == 0:
+            return 0.0
+        return float(self.valores[estado, legales].max())
+
+    # --------------------
+    # OPERACIONES POR LOTES (entrenamiento vectorizado)
+    # --------------------
+    def acciones_greedy(self, estados, rng):
+        """Argmax por fila sobre las casillas legales; los empates se rompen al azar con `rng`."""
+        valores = np.where(MASCARA_LEGAL[estados], self.valores[estados], -np.inf)
+        empates = valores == valores.max(axis=1, keepdims=True)
+        azar = rng.random(valores.shape)
+        azar[~empates] = -1.0
+        return azar.argmax(axis=1)
+
+    def jugadas_greedy(self, estados):
+        """
+        {estado: tupla de casillas empatadas en el Q máximo} para estados con casillas
+        legales, leyendo la matriz directamente (sin pasar por el diccionario).
+        """
+        estados = np.asarray(estados, dtype=np.int64)
+        valores = np.where(MASCARA_LEGAL[estados], self.valores[estados], -np.inf)
+        empates = valores == valores.max(axis=1, keepdims=True)
+        return {s: tuple(np.flatnonzero(fila).tolist()) for s, fila in zip(estados.tolist(), empates)}
+
+    def primeras_mejores(self):
+        """(estados no terminales, su casilla de Q máximo) con los empates rotos por el menor índice."""
+        estados = np.flatnonzero(~TERMINAL)
+        valores = np.where(MASCARA_LEGAL[estados], self.valores[estados], -np.inf)
+        return estados, valores.argmax(axis=1)
+
+    def max_q_lote(self, estados):
+        """max Q(s', a') de cada estado (0.0 si no tiene casillas legales)."""
+        valores = np.where(MASCARA_LEGAL[estados], self.valores[estados], -np.inf).max(axis=1)
+        return np.where(np.isfinite(valores), valores, 0.0)
+
+    def actualizar_lote(self, estados, acciones, objetivos, alpha):
+        """
+        Aplica Q(s,a) += alpha * (objetivo - Q(s,a)) para cada fila del lote.
+        Si varias filas chocan en la misma celda (s, a) el resultado es el mismo que
+        aplicarlas una a una en el orden del lote. Para n choques con objetivos t_1..t_n:
+            Q_n = (1 - alpha)^n * Q_0 + sum_i alpha * (1 - alpha)^(n - i) * t_i
+        """
+        claves = estados * 9 + acciones
+        orden = np.argsort(claves, kind="stable")
+        claves_ordenadas = claves[orden]
+        inicio_grupo = np.ones(claves_ordenadas.size, dtype=bool)
+        inicio_grupo[1:] = claves_ordenadas[1:] != claves_ordenadas[:-1]
+        grupo = np.cumsum(inicio_grupo) - 1
+        primeras = np.flatnonzero(inicio_grupo)
+        tamanos = np.diff(np.append(primeras, claves_ordenadas.size))
+
+        # Posición de cada actualización contando desde el final de su grupo (0 = la última)
+        desde_el_final = tamanos[grupo] - 1 - (np.arange(claves_ordenadas.size) - primeras[grupo])
+        retencion = 1.0 - alpha
+        pesos = alpha * retencion ** desde_el_final
+        aporte = np.bincount(grupo, weights=pesos * objetivos[orden], minlength=primeras.size)
+
+        s = estados[orden[primeras]]
+        a = acciones[orden[primeras]]
+        self.valores[s, a] = retencion ** tamanos * self.valores[s, a] + aporte
+
+    @classmethod
+    def desde_diccionario(cls, q_table):
+        """Construye la matriz a partir de la Tabla Q en formato {estado: {casilla: valor}}."""
+        tabla = cls()
+        for estado, acciones in q_table.items():
+            tabla.visitado[estado] = True
+            for mov, valor in acciones.items():
+                tabla.valores[estado, mov] = valor
+        return tabla
+
+    def get(self, estado, defecto=None):
+        """Como dict.get sobre a_diccionario(), pero armando solo la fila pedida (lo usa game/diario.py)."""
+        if not self.visitado[estado]:
+            return defecto
+        legales = LEGALES[estado].tolist()
+        return dict(zip(legales, self.valores[estado, legales].tolist()))
+
+    def a_diccionario(self):
+        """
+        Devuelve la Tabla Q en el formato de QAgent. Cada estado visitado trae todas sus
+        casillas legales: las que el diccionario no tenía valen 0.0, igual que su `.get(m, 0.0)`.
+        """
+        q_table = {}
+        for estado in np.flatnonzero(self.visitado).tolist():
+            legales = LEGALES[estado].tolist()
+            valores = self.valores[estado, legales].tolist()
+            q_table[estado] = dict(zip(legales, valores))
+        return q_table
+
+
+class QAgentNumpy(QAgent):
+    """
+    QAgent con la Tabla Q en una matriz de NumPy. Expone la misma API
+    (obtener_accion / aprender / guardar / cargar) y los mismos parámetros
+    (epsilon_min, epsilon_decay, ...). `q_table` arma una copia en formato de
+    diccionario cada vez que se lee: para consultas frecuentes (evaluación,
+    compilar la política) se usa `tabla_q(agente)`, que devuelve la matriz.
+    """
+
+    def __init__(self, alpha=0.5, gamma=0.9, epsilon=1.0, cargar=True, archivo=ARCHIVO_Q_TABLE, **kwargs):
+        self.tabla = TablaQNumpy()
+        super().__init__(alpha=alpha, gamma=gamma, epsilon=epsilon, cargar=cargar, archivo=archivo, **kwargs)
+
+    @property
+    def q_table(self):
+        return self.tabla.a_diccionario()
+
+    @q_table.setter
+    def q_table(self, q_table):
+        self.tabla = TablaQNumpy.desde_diccionario(q_table)
+
+    def obtener_accion(self, tablero, movimientos_posibles, en_entrenamiento=True):
+        estado = self.obtener_estado(tablero)
+
+        # 1. Exploración: mismas llamadas a `random` que la versión de diccionario
+        if en_entrenamiento and random.uniform(0, 1) < self.epsilon:
+            return random.choice(movimientos_posibles)
+
+        # 2. Explotación: argmax sobre la fila, limitado a las casillas legales
+        if self.cambios is not None and not self.tabla.visitado[estado]:
+            self.cambios.add(estado)
+        self.tabla.visitado[estado] = True
+        return int(random.choice(self.tabla.mejores_acciones(estado)))
+
+    def aprender(self, estado_actual, accion, recompensa, estado_siguiente, movimientos_siguientes, termino_juego):
+        estado_t = self.obtener_estado(estado_actual)
+        estado_t1 = self.obtener_estado(estado_siguiente)
+        tabla = self.tabla
+        if self.cambios is not None:
+            # Igual que QAgent: el estado actualizado y el siguiente si es nuevo
+            self.cambios.add(estado_t)
+            if not tabla.visitado[estado_t1]:
+                self.cambios.add(estado_t1)
+        tabla.visitado[estado_t] = True
+        tabla.visitado[estado_t1] = True
+
+        q_actual = float(tabla.valores[estado_t, accion])
+        max_q_futuro = 0.0 if termino_juego else tabla.max_q(estado_t1)
+
+        # Ecuación de Bellman sobre la celda (s, a) de la matriz
+        tabla.valores[estado_t, accion] = q_actual + self.alpha * (recompensa + (self.gamma * max_q_futuro) - q_actual)
+
+        if self.telemetria is not None:
+            # La matriz ya tiene fila para todo estado: no hay fallos ni inserciones
+            self.telemetria.actualizaciones += 1
+            self.telemetria.consultas += 2
+
+
+# =============================================================================
+#  COMPARACIÓN DE MEMORIA Y VELOCIDAD (python -m game.qtabla)
+# =============================================================================
+
+def tamano_diccionario(q_table):
+    """Bytes aproximados de un diccionario de diccionarios (contenedores, claves y floats)."""
+    total = sys.getsizeof(q_table)
+    for estado, acciones in q_table.items():
+        total += sys.getsizeof(estado) + sys.getsizeof(acciones)
+        for mov, valor in acciones.items():
+            total += sys.getsizeof(mov) + sys.getsizeof(valor)
+    return total
+
+
+def comparar_con_diccionario(n_episodios=20000, semilla=0):
+    """Entrena ambos backends con la misma semilla y compara episodios/segundo y memoria."""
+    from game.trainer import jugar_episodio_entrenamiento
+
+    resultados = {}
+    for nombre, clase in (("dict", QAgent), ("numpy", QAgentNumpy)):
+        agente = clase(cargar=False)
+        random.seed(semilla)
+        inicio = time.perf_counter()
+        for i in range(1, n_episodios + 1):
+            jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+            agente.reducir_epsilon()
+        duracion = time.perf_counter() - inicio
+
+        if nombre == "dict":
+            memoria = tamano_diccionario(agente.q_table)
+        else:
+            memoria = agente.tabla.nbytes
+        resultados[nombre] = {
+            "episodios_por_segundo": n_episodios / duracion,
+            "estados": len(agente.q_table),
+            "bytes": memoria,
+        }
+
+    print(f"{'Backend':<8} {'Episodios/s':>12} {'Estados':>8} {'Memoria (KB)':>13}")
+    for nombre, r in resultados.items():
+        print(f"{nombre:<8} {r['episodios_por_segundo']:>12.0f} {r['estados']:>8} {r['bytes'] / 1024:>13.1f}")
+    return resultados
+
+
+if __name__ == "__main__":
+    comparar_con_diccionario()
@@ -0,0 +1,178 @@
+# REPLAY.PY: Memoria de experiencias (experience replay) sobre arreglos de NumPy
+
+import random
+import time
+
+import numpy as np
+
+from game.ai import ARCHIVO_Q_TABLE
+from game.qtabla import QAgentNumpy
+
+# =============================================================================
+#  EXPERIENCE REPLAY
+# =============================================================================
+#  En el entrenamiento de referencia cada transición (s, a, r, s') se usa una
+#  sola vez en `aprender` y se descarta. Aquí se guarda además en un buffer
+#  circular de capacidad fija y, cada `cada` transiciones, se repasa un
+#  minilote de transiciones viejas con una actualización de Bellman vectorizada
+#  (TablaQNumpy.actualizar_lote). Así cada partida simulada enseña más.
+#
+#  Arreglos preasignados (una fila por transición):
+#     estados, acciones, recompensas, siguientes, mascara_siguiente (9 bool), terminado
+#  Muestreo:
+#     uniforme     -> todas las transiciones guardadas con igual probabilidad
+#     prioritario  -> proporcional a (|error TD| + eps)^alpha_prioridad; las
+#                     transiciones nuevas entran con la prioridad máxima vista,
+#                     y tras repasarlas se les asigna su nuevo error TD.
+#  (No se usan pesos de importancia: actualizar_lote aplica el mismo alpha a
+#  todo el lote, y en una tabla exacta el sesgo solo cambia el orden de repaso.)
+# =============================================================================
+
+class BufferReplay:
+    def __init__(self, capacidad=50000, prioritario=False, alpha_prioridad=0.6, eps_prioridad=1e-3, semilla=None):
+        self.capacidad = capacidad
+        self.prioritario = prioritario
+        self.alpha_prioridad = alpha_prioridad
+        self.eps_prioridad = eps_prioridad
+        self.rng = np.random.default_rng(semilla)
+
+        self.estados = np.zeros(capacidad, dtype=np.int32)
+        self.acciones = np.zeros(capacidad, dtype=np.int8)
+        self.recompensas = np.zeros(capacidad, dtype=np.float32)
+        self.siguientes = np.zeros(capacidad, dtype=np.int32)
+        self.mascara_siguiente = np.zeros((capacidad, 9), dtype=bool)
+        self.terminado = np.zeros(capacidad, dtype=bool)
+        self.prioridades = np.zeros(capacidad, dtype=np.float64)
+
+        self.posicion = 0   # próxima fila a escribir
+        self.tamano = 0     # filas válidas
+        self._prioridad_maxima = 1.0
+
+    def __len__(self):
+        return self.tamano
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.estados, self.acciones, self.recompensas, self.siguientes,
+                                      self.mascara_siguiente, self.terminado, self.prioridades))
+
+    def agregar(self, estado, accion, recompensa, siguiente, movimientos_siguientes, terminado):
+        i = self.posicion
+        self.estados[i] = estado
+        self.acciones[i] = accion
+        self.recompensas[i] = recompensa
+        self.siguientes[i] = siguiente
+        fila = self.mascara_siguiente[i]
+        fila[:] = False
+        if not terminado:
+            fila[movimientos_siguientes] = True
+        self.terminado[i] = terminado
+        self.prioridades[i] = self._prioridad_maxima ** self.alpha_prioridad
+
+        self.posicion = (i + 1) % self.capacidad
+        self.tamano = min(self.tamano + 1, self.capacidad)
+
+    def muestrear(self, n):
+        """Índices de `n` transiciones guardadas (con reemplazo)."""
+        if not self.prioritario:
+            return self.rng.integers(0, self.tamano, size=n)
+        # Muestreo proporcional invirtiendo la suma acumulada (prioridades ya elevadas a alpha_prioridad)
+        acumulada = np.cumsum(self.prioridades[:self.tamano])
+        indices = np.searchsorted(acumulada, self.rng.random(n) * acumulada[-1], side="right")
+        return np.minimum(indices, self.tamano - 1)
+
+    def repasar(self, tabla, alpha, gamma, n, cambios=None):
+        """
+        Una actualización de Bellman vectorizada sobre un minilote. Retorna el error TD medio absoluto.
+        :param cambios: set donde anotar los estados actualizados (diario del agente), o None.
+        """
+        indices = self.muestrear(n)
+        estados = self.estados[indices]
+        acciones = self.acciones[indices].astype(np.int64)
+        siguientes = self.siguientes[indices]
+
+        valores_siguientes = np.where(self.mascara_siguiente[indices], tabla.valores[siguientes], -np.inf).max(axis=1)
+        max_q = np.where(self.terminado[indices] | ~np.isfinite(valores_siguientes), 0.0, valores_siguientes)
+        objetivos = self.recompensas[indices] + gamma * max_q
+
+        errores = objetivos - tabla.valores[estados, acciones]
+        tabla.actualizar_lote(estados, acciones, objetivos, alpha)
+        if cambios is not None:
+            cambios.update(estados.tolist())
+        if self.prioritario:
+            nuevas = np.abs(errores) + self.eps_prioridad
+            self.prioridades[indices] = nuevas ** self.alpha_prioridad
+            self._prioridad_maxima = max(self._prioridad_maxima, float(nuevas.max()))
+        return float(np.abs(errores).mean())
+
+
+class QAgentReplay(QAgentNumpy):
+    """
+    QAgentNumpy que además guarda cada transición en un BufferReplay y, cada
+    `cada` llamadas a `aprender`, repasa un minilote de `tamano_lote` transiciones.
+    """
+
+    def __init__(self, alpha=0.5, gamma=0.9, epsilon=1.0, cargar=True, archivo=ARCHIVO_Q_TABLE,
+                 capacidad=50000, tamano_lote=128, cada=16, prioritario=False, semilla=None, **kwargs):
+        self.buffer = BufferReplay(capacidad, prioritario=prioritario, semilla=semilla)
+        self.tamano_lote = tamano_lote
+        self.cada = cada
+        self._pasos = 0
+        super().__init__(alpha=alpha, gamma=gamma, epsilon=epsilon, cargar=cargar, archivo=archivo, **kwargs)
+
+    def aprender(self, estado_actual, accion, recompensa, estado_siguiente, movimientos_siguientes, termino_juego):
+        super().aprender(estado_actual, accion, recompensa, estado_siguiente, movimientos_siguientes, termino_juego)
+        self.buffer.agregar(self.obtener_estado(estado_actual), accion, recompensa,
+                            self.obtener_estado(estado_siguiente), movimientos_siguientes, termino_juego)
+
+        self._pasos += 1
+        if self._pasos % self.cada == 0 and len(self.buffer) >= self.tamano_lote:
+            self.buffer.repasar(self.tabla, self.alpha, self.gamma, self.tamano_lote, self.cambios)
+
+
+# =============================================================================
+#  MEDICIÓN CONTRA LA ACTUALIZACIÓN EN LÍNEA (python -m game.replay)
+# =============================================================================
+
+def comparar_con_online(n_episodios=40000, puntos=8, semilla=0, objetivo=0.95):
+    """
+    Entrena con la misma semilla el agente en línea (QAgentNumpy) y las dos variantes de replay,
+    midiendo cada n_episodios/puntos la fracción de posiciones de X jugadas de forma óptima.
+    """
+    from game.evaluacion import fraccion_optima
+    from game.trainer import jugar_episodio_entrenamiento
+
+    configuraciones = (
+        ("en línea", lambda: QAgentNumpy(cargar=False)),
+        ("replay uniforme", lambda: QAgentReplay(cargar=False, semilla=semilla)),
+        ("replay prioritario", lambda: QAgentReplay(cargar=False, prioritario=True, semilla=semilla)),
+    )
+    tramo = n_episodios // puntos
+    resultados = {}
+    for nombre, crear in configuraciones:
+        agente = crear()
+        random.seed(semilla)
+        curva = []
+        alcanzado = None
+        inicio = time.perf_counter()
+        for i in range(1, n_episodios + 1):
+            jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+            agente.reducir_epsilon()
+            if i % tramo == 0:
+                fraccion = fraccion_optima(agente.tabla)
+                curva.append(fraccion)
+                if alcanzado is None and fraccion >= objetivo:
+                    alcanzado = i
+        resultados[nombre] = {"curva": curva, "episodios_objetivo": alcanzado,
+                              "segundos": time.perf_counter() - inicio}
+
+    print(f"Fracción de posiciones de X con jugada óptima cada {tramo} episodios:")
+    for nombre, r in resultados.items():
+        curva = " ".join(f"{f:.2f}" for f in r["curva"])
+        objetivo_txt = r["episodios_objetivo"] if r["episodios_objetivo"] else f">{n_episodios}"
+        print(f"{nombre:<20} {curva} | {objetivo * 100:.0f}% en {objetivo_txt} episodios | {r['segundos']:.1f} s")
+    return resultados
+
+
+if __name__ == "__main__":
+    comparar_con_online()
@@ -0,0 +1,214 @@
+# SIMETRIA.PY: Almacenamiento canónico por simetrías del tablero (grupo D4)
+
+import random
+import time
+from array import array
+
+from game.ai import QAgent
+from game.estados import CODIGOS, NUM_ESTADOS, codificar, decodificar, indice_de_codigo, indice_estado
+
+# =============================================================================
+#  SIMETRÍAS DEL TRES EN RAYA
+# =============================================================================
+#  El tablero tiene 8 simetrías (4 rotaciones y 4 reflexiones). Dos posiciones
+#  que son rotación o reflejo una de otra valen lo mismo, así que el agente
+#  simétrico guarda y aprende una sola: el "representante canónico" (la
+#  imagen con el código base 3 más pequeño).
+#
+#  PERMUTACIONES[k][i] = casilla del tablero original que cae en la casilla i
+#  de la imagen k, es decir imagen[i] = tablero[PERMUTACIONES[k][i]].
+#  Para llevar una jugada del tablero original a la imagen se usa la inversa.
+#
+#  Su cerebro va en un archivo propio (ARCHIVO_Q_TABLE_SIMETRICO): la tabla del
+#  QAgent normal está indexada por estado denso y en el marco de cada tablero.
+#  Si se le da igualmente un cerebro normal, al cargarlo se pasa a canónicos
+#  (canonizar_q_table) promediando las jugadas equivalentes.
+# =============================================================================
+
+ARCHIVO_Q_TABLE_SIMETRICO = "conocimiento_gato_simetrico.json"
+
+def _rotar(p):
+    # Giro de 90° en sentido horario: la fila r de la imagen es la columna r leída de abajo arriba
+    return tuple(p[3 * (2 - c) + r] for r in range(3) for c in range(3))
+
+def _reflejar(p):
+    # Espejo horizontal (izquierda <-> derecha)
+    return tuple(p[3 * r + (2 - c)] for r in range(3) for c in range(3))
+
+_identidad = tuple(range(9))
+_rotaciones = [_identidad]
+for _ in range(3):
+    _rotaciones.append(_rotar(_rotaciones[-1]))
+
+PERMUTACIONES = tuple(_rotaciones + [_reflejar(p) for p in _rotaciones])
+INVERSAS = tuple(tuple(p.index(i) for i in range(9)) for p in PERMUTACIONES)
+
+
+def transformar(tablero, k):
+    """Imagen k del tablero."""
+    permutacion = PERMUTACIONES[k]
+    return [tablero[permutacion[i]] for i in range(9)]
+
+
+# --------------------
+# TABLAS PRECALCULADAS (por índice denso de game/estados.py)
+# CANONICO[s]: índice del representante canónico de s
+# TRANSFORMACION[s]: k tal que transformar(s, k) es el canónico
+# REPRESENTANTE[c][a]: en un canónico con simetrías propias (p. ej. el tablero
+#   vacío) varias jugadas son equivalentes; todas se guardan bajo la menor.
+# --------------------
+CANONICO = array("h", [0]) * NUM_ESTADOS
+TRANSFORMACION = array("b", [0]) * NUM_ESTADOS
+REPRESENTANTE = {}
+
+for _s in range(NUM_ESTADOS):
+    _tablero = decodificar(CODIGOS[_s])
+    _imagenes = [codificar(transformar(_tablero, k)) for k in range(8)]
+    _k = min(range(8), key=_imagenes.__getitem__)
+    CANONICO[_s] = indice_de_codigo(_imagenes[_k])
+    TRANSFORMACION[_s] = _k
+    if _k == 0:
+        _estabilizador = [k for k in range(8) if _imagenes[k] == _imagenes[0]]
+        REPRESENTANTE[_s] = tuple(min(PERMUTACIONES[k][a] for k in _estabilizador) for a in range(9))
+
+NUM_CANONICOS = len(REPRESENTANTE)
+
+
+def canonizar_q_table(q_table):
+    """
+    Tabla Q por estado denso (la de QAgent) -> tabla por canónico, con cada jugada
+    traducida al marco del canónico y promediada con sus equivalentes.
+    Una tabla que ya es canónica queda igual.
+    """
+    sumas = {}
+    for s, acciones in q_table.items():
+        c = CANONICO[s]
+        inversa = INVERSAS[TRANSFORMACION[s]]
+        representante = REPRESENTANTE[c]
+        destino = sumas.setdefault(c, {})
+        for m, valor in acciones.items():
+            acumulado = destino.setdefault(representante[inversa[m]], [0.0, 0])
+            acumulado[0] += valor
+            acumulado[1] += 1
+    return {c: {m: total / n for m, (total, n) in acciones.items()} for c, acciones in sumas.items()}
+
+
+class QAgentSimetrico(QAgent):
+    """
+    QAgent que guarda un único estado por clase de simetría. Las jugadas se
+    traducen al marco del canónico al consultar/aprender y de vuelta al
+    tablero real al responder; la API es la misma que la de QAgent.
+    """
+
+    def __init__(self, alpha=0.5, gamma=0.9, epsilon=1.0, cargar=True, archivo=ARCHIVO_Q_TABLE_SIMETRICO, **kwargs):
+        super().__init__(alpha=alpha, gamma=gamma, epsilon=epsilon, cargar=cargar, archivo=archivo, **kwargs)
+
+    def cargar_conocimiento(self):
+        super().cargar_conocimiento()
+        self.q_table = canonizar_q_table(self.q_table)
+
+    def obtener_estado(self, tablero):
+        return CANONICO[indice_estado(tablero)]
+
+    def _a_canonico(self, tablero):
+        """(índice canónico, jugada real -> jugada canónica representativa)."""
+        s = indice_estado(tablero)
+        c = CANONICO[s]
+        inversa = INVERSAS[TRANSFORMACION[s]]
+        representante = REPRESENTANTE[c]
+        return s, lambda m: representante[inversa[m]]
+
+    def obtener_accion(self, tablero, movimientos_posibles, en_entrenamiento=True):
+        s, traducir = self._a_canonico(tablero)
+        equivalentes = {}
+        for m in movimientos_posibles:
+            equivalentes.setdefault(traducir(m), []).append(m)
+
+        accion = super().obtener_accion(tablero, list(equivalentes), en_entrenamiento)
+        # Entre jugadas equivalentes por simetría se elige una al azar
+        return random.choice(equivalentes[accion])
+
+    def aprender(self, estado_actual, accion, recompensa, estado_siguiente, movimientos_siguientes, termino_juego):
+        _, traducir = self._a_canonico(estado_actual)
+        _, traducir_siguiente = self._a_canonico(estado_siguiente)
+        super().aprender(
+            estado_actual, traducir(accion), recompensa, estado_siguiente,
+            [traducir_siguiente(m) for m in movimientos_siguientes], termino_juego
+        )
+
+    def mejores_acciones(self, tablero):
+        """Conjunto de jugadas reales con el Q máximo (las que la política greedy puede elegir)."""
+        _, traducir = self._a_canonico(tablero)
+        libres = [i for i in range(9) if tablero[i] == " "]
+        valores = self.q_table.get(self.obtener_estado(tablero), {})
+        q = {m: valores.get(traducir(m), 0.0) for m in libres}
+        mejor = max(q.values())
+        return {m for m, v in q.items() if v == mejor}
+
+
+def verificar_politica_simetrica(agente):
+    """
+    Comprueba que para toda posición alcanzable no terminal y toda simetría k,
+    las jugadas greedy de la imagen son exactamente las imágenes de las jugadas greedy.
+    Retorna la lista de posiciones que incumplen (vacía si la política es simétrica).
+    """
+    fallos = []
+    for s, c in enumerate(CANONICO):
+        if c not in agente.q_table:
+            continue
+        tablero = decodificar(CODIGOS[s])
+        if " " not in tablero:
+            continue
+        mejores = agente.mejores_acciones(tablero)
+        for k in range(8):
+            esperadas = {INVERSAS[k][m] for m in mejores}
+            if agente.mejores_acciones(transformar(tablero, k)) != esperadas:
+                fallos.append((s, k))
+    return fallos
+
+
+# =============================================================================
+#  COMPARACIÓN CONTRA QAGENT (python -m game.simetria)
+# =============================================================================
+
+def politica_de_simetrico(agente):
+    """Política greedy del agente simétrico sobre las posiciones de X (formato de game/evaluacion.py)."""
+    from game.evaluacion import jugadas_optimas
+
+    return {s: tuple(sorted(agente.mejores_acciones(decodificar(CODIGOS[s])))) for s in jugadas_optimas()}
+
+
+def comparar_con_qagent(n_episodios=20000, puntos=10, semilla=0):
+    """
+    Entrena QAgent y QAgentSimetrico con la misma semilla y mide cada n_episodios/puntos
+    el tamaño de la tabla y la fracción de posiciones de X jugadas de forma óptima.
+    """
+    from game.evaluacion import fraccion_optima
+    from game.trainer import jugar_episodio_entrenamiento
+
+    tramo = n_episodios // puntos
+    resultados = {}
+    for nombre, clase in (("QAgent", QAgent), ("QAgentSimetrico", QAgentSimetrico)):
+        agente = clase(cargar=False)
+        random.seed(semilla)
+        curva = []
+        inicio = time.perf_counter()
+        for i in range(1, n_episodios + 1):
+            jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+            agente.reducir_epsilon()
+            if i % tramo == 0:
+                politica = politica_de_simetrico(agente) if clase is QAgentSimetrico else None
+                curva.append((i, len(agente.q_table), fraccion_optima(agente.q_table, politica)))
+        resultados[nombre] = {"curva": curva, "segundos": time.perf_counter() - inicio}
+
+    print(f"{'Episodios':>9} | {'QAgent: estados':>15} {'óptimas':>8} | {'Simétrico: estados':>18} {'óptimas':>8}")
+    for (i, n_q, f_q), (_, n_s, f_s) in zip(resultados["QAgent"]["curva"], resultados["QAgentSimetrico"]["curva"]):
+        print(f"{i:>9} | {n_q:>15} {f_q * 100:>7.1f}% | {n_s:>18} {f_s * 100:>7.1f}%")
+    print(f"Tiempo: QAgent {resultados['QAgent']['segundos']:.1f} s | "
+          f"simétrico {resultados['QAgentSimetrico']['segundos']:.1f} s "
+          f"(canónicos posibles: {NUM_CANONICOS} de {NUM_ESTADOS} estados)")
+    return resultados
+
+
+if __name__ == "__main__":
+    comparar_con_qagent()
@@ -0,0 +1,162 @@
+# TABLEBASE.PY: Solución exacta de todas las posiciones alcanzables (análisis retrógrado)
+
+import os
+import struct
+from array import array
+
+from game.estados import CODIGOS, INDICE_POR_CODIGO, NUM_ESTADOS, codificar
+
+# =============================================================================
+#  TABLEBASE DEL TRES EN RAYA
+# =============================================================================
+#  Se resuelven una sola vez las 5,478 posiciones alcanzables, de atrás hacia
+#  adelante: primero las de 9 fichas, luego las de 8, ... hasta el tablero
+#  vacío. Así, cuando se resuelve una posición, todas sus hijas ya lo están.
+#
+#  Por posición (índice denso de game/estados.py) se guarda:
+#     VALOR[s]:      +1 gana X, -1 gana O, 0 empate (con juego perfecto)
+#     DISTANCIA[s]:  jugadas hasta el final con juego perfecto
+#                    (ganar rápido, perder lento, igual que el Minimax)
+#     MEJOR[s]:      mejor casilla para quien mueve (-1 si la partida terminó)
+#
+#  El puntaje que devolvería minimax(tablero, profundidad, turno) es:
+#     VALOR * (10 - profundidad - DISTANCIA)
+#  es decir, la misma utilidad ponderada por profundidad, pero exacta para
+#  cualquier profundidad (el caché del Minimax recursivo ignoraba ese dato).
+# =============================================================================
+
+MAGIC = b"TBTR"
+VERSION_TABLEBASE = 1
+_CABECERA = struct.Struct("<4sHxxI")
+
+_COMBINACIONES_GANADORAS = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6)
+)
+_POTENCIAS = tuple(3 ** (8 - i) for i in range(9))
+
+
+def _digitos(codigo):
+    digitos = [0] * 9
+    for i in range(8, -1, -1):
+        codigo, digitos[i] = divmod(codigo, 3)
+    return digitos
+
+
+class Tablebase:
+    def __init__(self, valor, distancia, mejor):
+        self.valor = valor
+        self.distancia = distancia
+        self.mejor = mejor
+
+    @classmethod
+    def resolver(cls):
+        """Análisis retrógrado por capas de número de fichas."""
+        valor = array("b", [0]) * NUM_ESTADOS
+        distancia = array("b", [0]) * NUM_ESTADOS
+        mejor = array("b", [-1]) * NUM_ESTADOS
+        # Puntaje a profundidad 0 de cada posición: VALOR * (10 - DISTANCIA)
+        puntaje = array("b", [0]) * NUM_ESTADOS
+
+        digitos = [_digitos(c) for c in CODIGOS]
+        orden = sorted(range(NUM_ESTADOS), key=lambda s: -sum(d != 0 for d in digitos[s]))
+
+        for s in orden:
+            casillas = digitos[s]
+            ganador = 0
+            for a, b, c in _COMBINACIONES_GANADORAS:
+                if casillas[a] != 0 and casillas[a] == casillas[b] == casillas[c]:
+                    ganador = casillas[a]
+                    break
+            if ganador:
+                valor[s] = 1 if ganador == 1 else -1
+                puntaje[s] = 10 * valor[s]
+                continue
+            libres = [i for i in range(9) if casillas[i] == 0]
+            if not libres:
+                continue
+
+            turno_x = casillas.count(1) == casillas.count(2)
+            ficha = 1 if turno_x else 2
+            codigo = CODIGOS[s]
+            mejor_puntaje = None
+            for i in libres:
+                hija = INDICE_POR_CODIGO[codigo + ficha * _POTENCIAS[i]]
+                p = puntaje[hija]
+                # La hija está una jugada más lejos: su utilidad se acerca un punto a 0
+                p -= (p > 0) - (p < 0)
+                if mejor_puntaje is None or (p > mejor_puntaje if turno_x else p < mejor_puntaje):
+                    mejor_puntaje = p
+                    mejor[s] = i
+
+            puntaje[s] = mejor_puntaje
+            if mejor_puntaje:
+                valor[s] = 1 if mejor_puntaje > 0 else -1
+                distancia[s] = 10 - abs(mejor_puntaje)
+            else:
+                distancia[s] = len(libres)
+
+        return cls(valor, distancia, mejor)
+
+    # --------------------
+    # CONSULTAS O(1)
+    # --------------------
+    def puntaje(self, indice, profundidad=0):
+        v = self.valor[indice]
+        return v * (10 - profundidad - self.distancia[indice]) if v else 0
+
+    def mejor_movimiento(self, indice):
+        m = self.mejor[indice]
+        return None if m < 0 else m
+
+    # --------------------
+    # PERSISTENCIA OPCIONAL
+    # --------------------
+    def guardar(self, ruta):
+        with open(ruta, "wb") as f:
+            f.write(_CABECERA.pack(MAGIC, VERSION_TABLEBASE, NUM_ESTADOS))
+            f.write(self.valor.tobytes())
+            f.write(self.distancia.tobytes())
+            f.write(self.mejor.tobytes())
+
+    @classmethod
+    def cargar(cls, ruta):
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        magic, version, n = _CABECERA.unpack_from(datos, 0)
+        if magic != MAGIC or version != VERSION_TABLEBASE or n != NUM_ESTADOS:
+            raise ValueError(f"{ruta} no es una tablebase compatible")
+        arreglos = []
+        inicio = _CABECERA.size
+        for _ in range(3):
+            arreglos.append(array("b", datos[inicio:inicio + n]))
+            inicio += n
+        return cls(*arreglos)
+
+
+_TABLEBASE = None
+
+def obtener_tablebase(ruta=None):
+    """
+    Devuelve la tablebase en memoria, resolviéndola la primera vez que se pide.
+    Si se da `ruta`, se lee de ahí cuando existe y se guarda ahí cuando no.
+    """
+    global _TABLEBASE
+    if _TABLEBASE is None:
+        if ruta and os.path.exists(ruta):
+            _TABLEBASE = Tablebase.cargar(ruta)
+        else:
+            _TABLEBASE = Tablebase.resolver()
+            if ruta:
+                _TABLEBASE.guardar(ruta)
+    return _TABLEBASE
+
+
+def indice_si_alcanzable(tablero, es_turno_max):
+    """Índice denso si la posición es alcanzable y le toca mover al bando indicado; si no, None."""
+    indice = INDICE_POR_CODIGO[codificar(tablero)]
+    if indice < 0:
+        return None
+    turno_x = tablero.count("X") == tablero.count("O")
+    return indice if turno_x == bool(es_turno_max) else None
@@ -0,0 +1,138 @@
+# TELEMETRIA.PY: Métricas del entrenamiento en vivo (JSONL o archivo de texto para Prometheus)
+
+import json
+import os
+import sys
+import time
+from collections import deque
+
+# =============================================================================
+#  TELEMETRÍA DEL ENTRENAMIENTO
+# =============================================================================
+#  Un objeto Telemetria se engancha al agente (agente.telemetria) y al
+#  entrenamiento (ejecutar_entrenamiento(..., telemetria=t)), que al terminar
+#  deja en el agente la telemetría que tenía antes. El agente solo
+#  incrementa contadores enteros; con agente.telemetria = None (el valor por
+#  defecto) el costo es una comparación con None en aprender/obtener_accion.
+#
+#  Cada `intervalo` segundos se emite una instantánea con:
+#     episodios/s, actualizaciones de Bellman/s, estados nuevos,
+#     consultas a la Tabla Q (aciertos / fallos), tamaño y bytes estimados
+#     de la tabla, epsilon y tasas de victoria / empate / derrota de los
+#     últimos `ventana` episodios (desde el punto de vista de X).
+#
+#  Formatos:
+#     "jsonl"      -> una línea JSON por instantánea, añadida al final del archivo
+#     "prometheus" -> archivo de texto para el textfile collector de node_exporter,
+#                     reescrito de forma atómica en cada instantánea
+# =============================================================================
+
+FORMATOS = ("jsonl", "prometheus")
+
+
+def estimar_bytes(agente):
+    """Bytes aproximados de la Tabla Q: exactos para la matriz de NumPy, estimados para el diccionario."""
+    tabla = getattr(agente, "tabla", None)
+    if tabla is not None and hasattr(tabla, "nbytes"):
+        return tabla.nbytes
+    q_table = agente.q_table
+    total = sys.getsizeof(q_table)
+    entradas = 0
+    for acciones in q_table.values():
+        total += sys.getsizeof(acciones)
+        entradas += len(acciones)
+    # Clave entera del estado (28 B) + clave entera de la jugada (pequeña, cacheada) y un float (24 B)
+    return total + 28 * len(q_table) + 24 * entradas
+
+
+def tamano_tabla(agente):
+    tabla = getattr(agente, "tabla", None)
+    return len(tabla) if tabla is not None else len(agente.q_table)
+
+
+class Telemetria:
+    def __init__(self, ruta, formato="jsonl", intervalo=1.0, ventana=1000, prefijo="gato_entrenamiento"):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de telemetría desconocido: {formato!r} (use {' o '.join(FORMATOS)})")
+        self.ruta = ruta
+        self.formato = formato
+        self.intervalo = intervalo
+        self.prefijo = prefijo
+
+        # Contadores acumulados (los incrementa el agente en su camino caliente)
+        self.actualizaciones = 0
+        self.consultas = 0
+        self.fallos = 0
+        self.nuevos_estados = 0
+        self.episodios = 0
+        self.resultados = deque(maxlen=ventana)
+
+        self._inicio = time.perf_counter()
+        self._ultima_emision = self._inicio
+        self._previos = (0, 0)  # (episodios, actualizaciones) en la última emisión
+        self.instantaneas = 0
+
+    # --------------------
+    # Llamado por el trainer al final de cada episodio
+    # --------------------
+    def registrar_episodio(self, resultado, agente):
+        self.episodios += 1
+        self.resultados.append(resultado)
+        if time.perf_counter() - self._ultima_emision >= self.intervalo:
+            self.emitir(agente)
+
+    def instantanea(self, agente):
+        ahora = time.perf_counter()
+        transcurrido = max(ahora - self._ultima_emision, 1e-9)
+        episodios_previos, actualizaciones_previas = self._previos
+        n = len(self.resultados)
+        return {
+            "tiempo": time.time(),
+            "segundos": ahora - self._inicio,
+            "episodios": self.episodios,
+            "episodios_por_segundo": (self.episodios - episodios_previos) / transcurrido,
+            "actualizaciones": self.actualizaciones,
+            "actualizaciones_por_segundo": (self.actualizaciones - actualizaciones_previas) / transcurrido,
+            "nuevos_estados": self.nuevos_estados,
+            "consultas": self.consultas,
+            "aciertos": self.consultas - self.fallos,
+            "fallos": self.fallos,
+            "estados_tabla": tamano_tabla(agente),
+            "bytes_tabla": estimar_bytes(agente),
+            "epsilon": agente.epsilon,
+            "tasa_victoria": self.resultados.count("X") / n if n else 0.0,
+            "tasa_empate": self.resultados.count("Empate") / n if n else 0.0,
+            "tasa_derrota": self.resultados.count("O") / n if n else 0.0,
+        }
+
+    def emitir(self, agente):
+        datos = self.instantanea(agente)
+        if self.formato == "jsonl":
+            with open(self.ruta, "a") as f:
+                f.write(json.dumps(datos) + "\n")
+        else:
+            self._escribir_prometheus(datos)
+        self._ultima_emision = time.perf_counter()
+        self._previos = (self.episodios, self.actualizaciones)
+        self.instantaneas += 1
+        return datos
+
+    def cerrar(self, agente):
+        """Emite la instantánea final (el trainer la llama al terminar)."""
+        return self.emitir(agente)
+
+    def _escribir_prometheus(self, datos):
+        lineas = []
+        contadores = ("episodios", "actualizaciones", "nuevos_estados", "consultas", "aciertos", "fallos")
+        for nombre, valor in datos.items():
+            if nombre == "tiempo":
+                continue
+            tipo = "counter" if nombre in contadores else "gauge"
+            metrica = f"{self.prefijo}_{nombre}" + ("_total" if tipo == "counter" else "")
+            lineas.append(f"# TYPE {metrica} {tipo}")
+            lineas.append(f"{metrica} {valor}")
+        # Escritura atómica: el recolector nunca lee un archivo a medias
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w") as f:
+            f.write("\n".join(lineas) + "\n")
+        os.replace(temporal, self.ruta)
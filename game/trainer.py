@@ -1,7 +1,12 @@
+import argparse
+import os
 import random
 import time
+from multiprocessing import Pool
 from game.logic import LogicaTresRayas
-from game.ai import agente_global
+from game.ai import QAgent, obtener_agente, tabla_q
+from game.checkpoint import cargar_checkpoint, guardar_checkpoint
+from game.evaluacion import fraccion_optima, politica_greedy, recorrido_de_politica
 
 # =============================================================================
 #  MÓDULO DE ENTRENAMIENTO (EL GIMNASIO)
@@ -14,14 +19,28 @@ from game.ai import agente_global
 #  2. Recompensa (r): Feedback positivo o negativo según el resultado.
 # =============================================================================
 
-def jugar_episodio_entrenamiento(jugar_vs_si_mismo=False):
+# Recompensas por defecto del agente (X). El PDF sugiere +1/-1; usamos una
+# escala mayor para acelerar la convergencia y premiamos el empate para
+# fomentar la defensa sólida. Se pueden sustituir por entrenamiento.
+RECOMPENSAS = {"victoria": 10, "empate": 5, "derrota": -10}
+
+def jugar_episodio_entrenamiento(jugar_vs_si_mismo=False, agente=None, variante=None, recompensas=None):
     """
     Simula UN Episodio completo (una partida de principio a fin).
     [cite_start]Ref PDF 'Agente de ML' (Pág. 11): "Episodios (Partidas jugadas)". [cite: 131]
     
+    :param agente: Agente que aprende en el episodio (por defecto el cerebro principal).
+    :param variante: Variante m,n,k de game/mnk.py (None = Tres en Raya clásico).
+    :param recompensas: {'victoria', 'empate', 'derrota'} (None = RECOMPENSAS).
+    
     Retorna: El resultado ('X', 'O', 'Empate')
     """
-    juego = LogicaTresRayas()
+    if agente is None:
+        agente = obtener_agente()
+    if recompensas is None:
+        recompensas = RECOMPENSAS
+
+    juego = LogicaTresRayas() if variante is None else variante.crear_juego()
     turno = "X" # El agente siempre será X en este entrenamiento
     
     # --- MEMORIA DE CORTO PLAZO PARA RECOMPENSA DIFERIDA ---
@@ -43,25 +62,24 @@ def jugar_episodio_entrenamiento(jugar_vs_si_mismo=False):
             
             # [cite_start]2. Elegir Acción (A) [cite: 11]
             # Aquí ocurre la Exploración vs Explotación interna del agente.
-            accion = agente_global.obtener_accion(estado_actual, movimientos_validos, en_entrenamiento=True)
+            accion = agente.obtener_accion(estado_actual, movimientos_validos, en_entrenamiento=True)
             
             # 3. Ejecutar Acción en el Entorno
+            # realizar_movimiento ya deja calculados el ganador y si el tablero quedó lleno
             juego.realizar_movimiento(accion, "X")
             
-            ganador = juego.verificar_ganador()
-            
             # --- EVALUACIÓN INMEDIATA ---
-            if ganador == "X":
+            if juego.ganador == "X":
                 # [cite_start]Recompensa Directa: Ganar [cite: 112]
                 # El PDF sugiere +1, nosotros usamos +10 para acelerar la convergencia.
-                recompensa = 10
-                agente_global.aprender(estado_actual, accion, recompensa, juego.tablero, [], True)
+                recompensa = recompensas["victoria"]
+                agente.aprender(estado_actual, accion, recompensa, juego.tablero, [], True)
                 return "X"
-            elif not juego.existe_espacio_libre():
+            elif juego.juego_terminado():
                 # [cite_start]Recompensa por Empate [cite: 114]
                 # Premiamos el empate (+5) para fomentar la defensa sólida.
-                recompensa = 5 
-                agente_global.aprender(estado_actual, accion, recompensa, juego.tablero, [], True)
+                recompensa = recompensas["empate"]
+                agente.aprender(estado_actual, accion, recompensa, juego.tablero, [], True)
                 return "Empate"
             
             # Si el juego no termina, NO aprendemos todavía.
@@ -79,30 +97,28 @@ def jugar_episodio_entrenamiento(jugar_vs_si_mismo=False):
             
             # El rival puede ser Random (Ruido) o el propio Agente (Self-Play)
             if jugar_vs_si_mismo:
-                accion_rival = agente_global.obtener_accion(juego.tablero, movimientos_validos, en_entrenamiento=True)
+                accion_rival = agente.obtener_accion(juego.tablero, movimientos_validos, en_entrenamiento=True)
             else:
                 accion_rival = random.choice(movimientos_validos)
             
             juego.realizar_movimiento(accion_rival, "O")
-            
-            ganador = juego.verificar_ganador()
             movimientos_futuros = juego.obtener_movimientos_posibles() 
             
             # --- FASE DE APRENDIZAJE RETROACTIVO (DELAYED REWARD) ---
             # Aquí evaluamos la jugada que hizo el Agente en el turno anterior basedado en la respuesta del rival.
             
-            if ganador == "O":
+            if juego.ganador == "O":
                 # EL RIVAL GANÓ -> La jugada anterior del Agente fue MALA (no bloqueó).
                 # [cite_start]Castigo[cite: 113]. PDF sugiere -1, usamos -10.
                 if estado_previo_agente is not None:
-                    castigo = -10
-                    agente_global.aprender(estado_previo_agente, accion_previa_agente, castigo, juego.tablero, [], True)
+                    castigo = recompensas["derrota"]
+                    agente.aprender(estado_previo_agente, accion_previa_agente, castigo, juego.tablero, [], True)
                 return "O"
             
-            elif not juego.existe_espacio_libre():
+            elif juego.juego_terminado():
                 # EMPATE -> La jugada anterior fue BUENA (sobrevivió).
                 if estado_previo_agente is not None:
-                    agente_global.aprender(estado_previo_agente, accion_previa_agente, 5, juego.tablero, [], True)
+                    agente.aprender(estado_previo_agente, accion_previa_agente, recompensas["empate"], juego.tablero, [], True)
                 return "Empate"
             
             else:
@@ -110,46 +126,131 @@ def jugar_episodio_entrenamiento(jugar_vs_si_mismo=False):
                 # [cite_start]Ref PDF (Pág. 10): "La promesa de ganar en el futuro"[cite: 123, 176].
                 # Actualizamos el valor Q usando el maxQ del estado futuro resultante.
                 if estado_previo_agente is not None:
-                    agente_global.aprender(estado_previo_agente, accion_previa_agente, 0, juego.tablero, movimientos_futuros, False)
+                    agente.aprender(estado_previo_agente, accion_previa_agente, 0, juego.tablero, movimientos_futuros, False)
             
             turno = "X"
 
-def ejecutar_entrenamiento(n_episodios=10000):
+def ejecutar_entrenamiento(n_episodios=10000, agente=None, guardar=True, variante=None, telemetria=None,
+                           checkpoint=None, intervalo_checkpoint=5000, reanudar=False, recompensas=None,
+                           evaluar_cada=None):
     """
     Ejecuta el ciclo de vida del aprendizaje.
     [cite_start]Ref PDF 'Q-Learning' (Pág. 11): "Curva de Aprendizaje - Convergencia"[cite: 125].
+    
+    Es la implementación de referencia (una partida a la vez). Con `variante`
+    (game/mnk.py) entrena sobre un tablero m x n; el agente debe ser un QAgentMNK.
+    Con `telemetria` (game/telemetria.py) emite métricas periódicas mientras entrena.
+    Con `checkpoint` guarda el estado completo cada `intervalo_checkpoint` episodios
+    (game/checkpoint.py); con `reanudar=True` continúa desde ese archivo si existe.
+    Con `recompensas` sustituye a RECOMPENSAS (barridos de hiperparámetros).
+    Con `evaluar_cada` revisa la política greedy cada tantos episodios contra la
+    tablebase (game/evaluacion.py) y se detiene antes si ya convergió.
+    Retorna: {'X': victorias, 'O': derrotas, 'Empate': empates}
     """
+    if agente is None:
+        agente = obtener_agente()
+    # La telemetría solo se engancha durante este entrenamiento: después se
+    # deja la que tuviera el agente para no seguir contando sus consultas
+    telemetria_anterior = agente.telemetria
+    if telemetria is not None:
+        agente.telemetria = telemetria
+    try:
+        return _entrenar(agente, n_episodios, guardar, variante, telemetria, checkpoint,
+                         intervalo_checkpoint, reanudar, recompensas, evaluar_cada)
+    finally:
+        agente.telemetria = telemetria_anterior
+
+def _entrenar(agente, n_episodios, guardar, variante, telemetria, checkpoint, intervalo_checkpoint,
+              reanudar, recompensas, evaluar_cada):
+    """Cuerpo de ejecutar_entrenamiento, con el agente y su telemetría ya preparados."""
+    episodio_inicial = 0
+    victorias_x = 0
+    victorias_o = 0
+    empates = 0
+    # Política greedy de la evaluación anterior (parada temprana); viaja en el checkpoint
+    # para que un entrenamiento reanudado se detenga en el mismo episodio
+    politica_anterior = None
+    if reanudar and checkpoint and os.path.exists(checkpoint):
+        episodio_inicial, contadores, politica_anterior = cargar_checkpoint(checkpoint, agente)
+        victorias_x, victorias_o, empates = contadores["X"], contadores["O"], contadores["Empate"]
+        print(f"\n Reanudando desde {checkpoint}: {episodio_inicial} episodios ya jugados.")
+
     print(f"\n INICIANDO ENTRENAMIENTO ({n_episodios} Partidas)...")
     print("El agente está aprendiendo. Por favor espere.")
     
     tiempo_inicio = time.time()
+    tiempo_checkpoints = 0.0
+    tiempo_evaluacion = 0.0
     
-    victorias_x = 0
-    victorias_o = 0
-    empates = 0
-    
-    for i in range(1, n_episodios + 1):
+    for i in range(episodio_inicial + 1, n_episodios + 1):
         # Cada 500 episodios, activamos Self-Play para mejorar defensa
         vs_self = (i % 500 == 0)
         
-        resultado = jugar_episodio_entrenamiento(jugar_vs_si_mismo=vs_self)
+        resultado = jugar_episodio_entrenamiento(jugar_vs_si_mismo=vs_self, agente=agente, variante=variante,
+                                                 recompensas=recompensas)
         
         # Recolección de estadísticas para la Curva de Aprendizaje
         if resultado == "X": victorias_x += 1
         elif resultado == "O": victorias_o += 1
         else: empates += 1
+
+        if telemetria is not None:
+            telemetria.registrar_episodio(resultado, agente)
         
         # DECAY DE EPSILON:
         # [cite_start]Ref PDF (Pág. 8): "Al principio exploramos mucho (azar), con el tiempo explotamos más"[cite: 94].
-        agente_global.reducir_epsilon()
+        agente.reducir_epsilon()
         
-        if i % (n_episodios // 10) == 0:
+        if i % max(1, n_episodios // 10) == 0:
             porcentaje = (i / n_episodios) * 100
-            print(f"Progreso: {porcentaje:.0f}% | Epsilon: {agente_global.epsilon:.4f} | Gana X: {victorias_x} - Gana O: {victorias_o}")
+            print(f"Progreso: {porcentaje:.0f}% | Epsilon: {agente.epsilon:.4f} | Gana X: {victorias_x} - Gana O: {victorias_o}")
+
+        # PARADA TEMPRANA: la política greedy nunca pierde desde el tablero vacío y no
+        # cambió desde la evaluación anterior en ninguna de las posiciones a las que llega.
+        # (Jugar óptimo en TODAS las posiciones de X implica ambas cosas.)
+        convergio = False
+        if evaluar_cada and i % evaluar_cada == 0:
+            inicio_evaluacion = time.time()
+            q_table = tabla_q(agente)
+            politica = politica_greedy(q_table)
+            alcanzadas, pierde = recorrido_de_politica(politica)
+            if politica_anterior is not None and not pierde:
+                convergio = all(politica[s] == politica_anterior[s] for s in alcanzadas)
+                if convergio:
+                    print(f"Parada temprana en el episodio {i}: la política nunca pierde y no cambió "
+                          f"en {len(alcanzadas)} posiciones alcanzables "
+                          f"({fraccion_optima(q_table, politica) * 100:.1f}% de todas las de X con jugada óptima).")
+            politica_anterior = politica
+            tiempo_evaluacion += time.time() - inicio_evaluacion
+
+        if checkpoint and (i % intervalo_checkpoint == 0 or i == n_episodios or convergio):
+            inicio_guardado = time.time()
+            guardar_checkpoint(checkpoint, agente, i, {"X": victorias_x, "O": victorias_o, "Empate": empates},
+                               politica_anterior)
+            tiempo_checkpoints += time.time() - inicio_guardado
+
+        if convergio:
+            break
 
     tiempo_fin = time.time()
     duracion = tiempo_fin - tiempo_inicio
     
+    _imprimir_resumen(duracion, victorias_x, victorias_o, empates)
+    if checkpoint:
+        print(f"Tiempo en checkpoints: {tiempo_checkpoints:.2f} s ({tiempo_checkpoints / max(duracion, 1e-9) * 100:.1f}% del total)")
+    if evaluar_cada:
+        print(f"Tiempo en evaluaciones: {tiempo_evaluacion:.2f} s ({tiempo_evaluacion / max(duracion, 1e-9) * 100:.1f}% del total)")
+
+    if telemetria is not None:
+        telemetria.cerrar(agente)
+    
+    # Persistencia del conocimiento aprendido
+    if guardar:
+        agente.guardar_conocimiento()
+
+    return {"X": victorias_x, "O": victorias_o, "Empate": empates}
+
+def _imprimir_resumen(duracion, victorias_x, victorias_o, empates):
     print("\n" + "="*40)
     print(" ENTRENAMIENTO FINALIZADO")
     print(f"Tiempo total: {duracion:.2f} segundos")
@@ -157,9 +258,325 @@ def ejecutar_entrenamiento(n_episodios=10000):
     print(f"Derrotas IA (O):  {victorias_o}")
     print(f"Empates:          {empates}")
     print("="*40 + "\n")
+
+# =============================================================================
+#  ENTRENAMIENTO VECTORIZADO (MILES DE PARTIDAS EN PARALELO)
+# =============================================================================
+#  Avanza un lote de partidas "al mismo paso" (lockstep): todas las X mueven,
+#  luego todas las O, y así hasta que termina la última. Tableros, elecciones
+#  epsilon-greedy, recompensas y actualizaciones Q son arreglos de NumPy.
+#
+#  Orden de las actualizaciones: en cada media jugada todas las partidas leen
+#  la Tabla Q tal como estaba al comenzar esa media jugada; después las
+#  actualizaciones se aplican en el orden del lote (TablaQNumpy.actualizar_lote),
+#  de modo que si varias partidas caen en la misma celda (s, a) el resultado es
+#  el mismo que aplicarlas una a una. Como todas las partidas del lote tienen el
+#  mismo número de fichas, el estado s' usado en max Q(s', a') nunca es uno de
+#  los que se actualizan en esa misma media jugada.
+#
+#  Recompensas, self-play cada 500 episodios y decay de epsilon por episodio son
+#  los mismos que en ejecutar_entrenamiento, que sigue siendo la referencia.
+# =============================================================================
+
+def _epsilons_del_lote(agente, n):
+    """Epsilon de cada uno de los próximos n episodios según reducir_epsilon()."""
+    import numpy as np
+
+    epsilons = agente.epsilon * agente.epsilon_decay ** np.arange(n)
+    if agente.epsilon > agente.epsilon_min:
+        # reducir_epsilon deja de multiplicar en cuanto epsilon cae a epsilon_min o menos
+        por_debajo = np.flatnonzero(epsilons <= agente.epsilon_min)
+        if por_debajo.size:
+            epsilons[por_debajo[0]:] = epsilons[por_debajo[0]]
+    else:
+        epsilons[:] = agente.epsilon
+    return epsilons
+
+def jugar_lote_entrenamiento(tabla, agente, episodio_inicial, n, rng, recompensas=None):
+    """
+    Simula `n` episodios en lockstep sobre `tabla` (TablaQNumpy).
+    :param recompensas: {'victoria', 'empate', 'derrota'} (None = RECOMPENSAS).
+    Retorna: (victorias_x, victorias_o, empates) y deja `agente.epsilon` decaído n veces.
+    """
+    import numpy as np
+    from game.qtabla import GANA_BITS, acciones_aleatorias, estados_de_bitboards
+
+    if recompensas is None:
+        recompensas = RECOMPENSAS
+
+    episodios = np.arange(episodio_inicial, episodio_inicial + n)
+    vs_self = episodios % 500 == 0
+    epsilons = _epsilons_del_lote(agente, n)
+    alpha, gamma = agente.alpha, agente.gamma
+
+    bits_x = np.zeros(n, dtype=np.int64)
+    bits_o = np.zeros(n, dtype=np.int64)
+    activas = np.arange(n)
+    estado_previo = np.zeros(n, dtype=np.int64)
+    accion_previa = np.zeros(n, dtype=np.int64)
+    resultados = {"X": 0, "O": 0, "Empate": 0}
+
+    def elegir(partidas, estados):
+        """Política epsilon-greedy del agente para un subconjunto del lote."""
+        explorar = rng.random(partidas.size) < epsilons[partidas]
+        acciones = acciones_aleatorias(bits_x[partidas], bits_o[partidas], rng)
+        explotan = ~explorar
+        if explotan.any():
+            acciones[explotan] = tabla.acciones_greedy(estados[explotan], rng)
+            tabla.visitado[estados[explotan]] = True
+        return acciones
+
+    while activas.size:
+        # ---------------------------------------------------
+        # TURNO DEL AGENTE (X)
+        # ---------------------------------------------------
+        estados = estados_de_bitboards(bits_x[activas], bits_o[activas])
+        acciones = elegir(activas, estados)
+        bits_x[activas] |= 1 << acciones
+
+        gana = GANA_BITS[bits_x[activas]]
+        lleno = (bits_x[activas] | bits_o[activas]) == 0b111111111
+        termina = gana | lleno
+        if termina.any():
+            siguientes = estados_de_bitboards(bits_x[activas[termina]], bits_o[activas[termina]])
+            tabla.visitado[estados[termina]] = True
+            tabla.visitado[siguientes] = True
+            objetivos = np.where(gana[termina], float(recompensas["victoria"]), float(recompensas["empate"]))
+            tabla.actualizar_lote(estados[termina], acciones[termina], objetivos, alpha)
+            resultados["X"] += int(gana.sum())
+            resultados["Empate"] += int((lleno & ~gana).sum())
+
+        estado_previo[activas] = estados
+        accion_previa[activas] = acciones
+        activas = activas[~termina]
+        if not activas.size:
+            break
+
+        # ---------------------------------------------------
+        # TURNO DEL OPONENTE (O): Random o Self-Play
+        # ---------------------------------------------------
+        acciones_o = acciones_aleatorias(bits_x[activas], bits_o[activas], rng)
+        propias = vs_self[activas]
+        if propias.any():
+            partidas = activas[propias]
+            acciones_o[propias] = elegir(partidas, estados_de_bitboards(bits_x[partidas], bits_o[partidas]))
+        bits_o[activas] |= 1 << acciones_o
+
+        gana = GANA_BITS[bits_o[activas]]
+        lleno = (bits_x[activas] | bits_o[activas]) == 0b111111111
+        siguientes = estados_de_bitboards(bits_x[activas], bits_o[activas])
+        tabla.visitado[estado_previo[activas]] = True
+        tabla.visitado[siguientes] = True
+
+        # Recompensa diferida de la jugada anterior de X
+        objetivos = np.where(gana, float(recompensas["derrota"]),
+                             np.where(lleno, float(recompensas["empate"]), gamma * tabla.max_q_lote(siguientes)))
+        tabla.actualizar_lote(estado_previo[activas], accion_previa[activas], objetivos, alpha)
+        resultados["O"] += int(gana.sum())
+        resultados["Empate"] += int((lleno & ~gana).sum())
+
+        activas = activas[~(gana | lleno)]
+
+    agente.epsilon = float(epsilons[-1])
+    agente.reducir_epsilon()
+    return resultados["X"], resultados["O"], resultados["Empate"]
+
+def ejecutar_entrenamiento_vectorizado(n_episodios=10000, tamano_lote=256, agente=None, semilla=None, guardar=True,
+                                       recompensas=None):
+    """
+    Variante por lotes de ejecutar_entrenamiento. Acepta un QAgentNumpy (entrena su
+    matriz directamente) o un QAgent de diccionario (se convierte antes y después).
     
-    # Persistencia del conocimiento aprendido
-    agente_global.guardar_conocimiento()
+    :param tamano_lote: Partidas que avanzan juntas. Lotes más grandes van más rápido,
+                        pero todas las partidas de un lote eligen su primera jugada con
+                        la misma Tabla Q; como epsilon decae por episodio, con lotes de
+                        miles y pocas decenas de miles de episodios la política aprendida
+                        se queda atrás de la de referencia.
+    :param recompensas: Sustituye a RECOMPENSAS, igual que en ejecutar_entrenamiento.
+    Retorna: {'X': victorias, 'O': derrotas, 'Empate': empates}
+    """
+    import numpy as np
+    from game.qtabla import TablaQNumpy
+
+    if agente is None:
+        agente = obtener_agente()
+
+    es_matricial = hasattr(agente, "tabla")
+    tabla = agente.tabla if es_matricial else TablaQNumpy.desde_diccionario(agente.q_table)
+    rng = np.random.default_rng(semilla)
+
+    print(f"\n INICIANDO ENTRENAMIENTO VECTORIZADO ({n_episodios} Partidas, lotes de {tamano_lote})...")
+    tiempo_inicio = time.time()
+
+    victorias_x = victorias_o = empates = 0
+    siguiente_reporte = max(1, n_episodios // 10)
+    hechos = 0
+    while hechos < n_episodios:
+        n = min(tamano_lote, n_episodios - hechos)
+        x, o, e = jugar_lote_entrenamiento(tabla, agente, hechos + 1, n, rng, recompensas)
+        victorias_x += x
+        victorias_o += o
+        empates += e
+        hechos += n
+
+        if hechos >= siguiente_reporte:
+            porcentaje = (hechos / n_episodios) * 100
+            print(f"Progreso: {porcentaje:.0f}% | Epsilon: {agente.epsilon:.4f} | Gana X: {victorias_x} - Gana O: {victorias_o}")
+            while siguiente_reporte <= hechos:
+                siguiente_reporte += max(1, n_episodios // 10)
+
+    duracion = time.time() - tiempo_inicio
+    _imprimir_resumen(duracion, victorias_x, victorias_o, empates)
+
+    if not es_matricial:
+        agente.q_table = tabla.a_diccionario()
+    if agente.cambios is not None:
+        # Los lotes no anotan celda por celda: el diario recibe todos los estados visitados
+        agente.cambios.update(np.flatnonzero(tabla.visitado).tolist())
+    if guardar:
+        agente.guardar_conocimiento()
+
+    return {"X": victorias_x, "O": victorias_o, "Empate": empates}
+
+# =============================================================================
+#  ENTRENAMIENTO PARALELO (VARIOS PROCESOS + FUSIÓN DE TABLAS Q)
+# =============================================================================
+#  Cada proceso entrena un "fragmento" independiente: su propia copia de la
+#  Tabla Q maestra, su propio RNG (sembrado una vez y cuyo estado viaja entre
+#  rondas) y su propio calendario de epsilon. Al final de cada ronda las copias
+#  se fusionan en la tabla maestra promediando cada Q(s, a) ponderado por las
+#  veces que cada fragmento lo actualizó; lo que nadie tocó conserva su valor.
+# =============================================================================
+
+def _entrenar_fragmento(tarea):
+    """Trabajo de un proceso: juega su parte de la ronda y devuelve su tabla y visitas."""
+    agente = QAgent(cargar=False)
+    for nombre, valor in tarea["hiperparametros"].items():
+        setattr(agente, nombre, valor)
+    agente.q_table = tarea["q_table"]
+    agente.epsilon = tarea["epsilon"]
+    agente.visitas = {}
+    random.setstate(tarea["estado_rng"])
+
+    resultados = {"X": 0, "O": 0, "Empate": 0}
+    for i in range(tarea["episodio_inicial"], tarea["episodio_inicial"] + tarea["n_episodios"]):
+        resultados[jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)] += 1
+        agente.reducir_epsilon()
+
+    return {
+        "q_table": agente.q_table,
+        "visitas": agente.visitas,
+        "epsilon": agente.epsilon,
+        "estado_rng": random.getstate(),
+        "resultados": resultados,
+    }
+
+def fusionar_tablas_q(q_maestra, fragmentos):
+    """Promedio ponderado por visitas de las tablas de cada fragmento sobre la maestra."""
+    sumas = {}
+    for fragmento in fragmentos:
+        q_fragmento = fragmento["q_table"]
+        for estado, acciones in q_fragmento.items():
+            destino = q_maestra.setdefault(estado, {})
+            for mov in acciones:
+                destino.setdefault(mov, 0.0)
+        for (estado, accion), n in fragmento["visitas"].items():
+            suma = sumas.setdefault((estado, accion), [0.0, 0])
+            suma[0] += n * q_fragmento[estado][accion]
+            suma[1] += n
+
+    for (estado, accion), (total, n) in sumas.items():
+        q_maestra[estado][accion] = total / n
+    return q_maestra
+
+def ejecutar_entrenamiento_paralelo(n_episodios=10000, workers=4, rondas=10, agente=None, semilla=0, guardar=True):
+    """
+    Reparte n_episodios entre `workers` procesos, fusionando las tablas al final de cada ronda.
+    Retorna: {'X', 'O', 'Empate', 'episodios_por_segundo'}
+    """
+    if agente is None:
+        agente = obtener_agente()
+
+    print(f"\n INICIANDO ENTRENAMIENTO PARALELO ({n_episodios} Partidas, {workers} procesos, {rondas} rondas)...")
+    tiempo_inicio = time.time()
+
+    hiperparametros = {
+        "alpha": agente.alpha, "gamma": agente.gamma,
+        "epsilon_min": agente.epsilon_min, "epsilon_decay": agente.epsilon_decay,
+    }
+    # Estado propio de cada fragmento: epsilon, RNG y cuántos episodios lleva
+    epsilons = [agente.epsilon] * workers
+    estados_rng = [random.Random(semilla * 10007 + w).getstate() for w in range(workers)]
+    por_fragmento = [n_episodios // workers + (1 if w < n_episodios % workers else 0) for w in range(workers)]
+    jugados = [0] * workers
+    totales = {"X": 0, "O": 0, "Empate": 0}
+
+    with Pool(workers) as pool:
+        for ronda in range(rondas):
+            tareas = []
+            for w in range(workers):
+                # Reparto equitativo de los episodios del fragmento entre las rondas restantes
+                n = (por_fragmento[w] - jugados[w]) // (rondas - ronda)
+                tareas.append({
+                    "q_table": agente.q_table, "hiperparametros": hiperparametros,
+                    "epsilon": epsilons[w], "estado_rng": estados_rng[w],
+                    "episodio_inicial": jugados[w] + 1, "n_episodios": n,
+                })
+                jugados[w] += n
+
+            fragmentos = pool.map(_entrenar_fragmento, tareas)
+            agente.q_table = fusionar_tablas_q(agente.q_table, fragmentos)
+
+            for w, fragmento in enumerate(fragmentos):
+                epsilons[w] = fragmento["epsilon"]
+                estados_rng[w] = fragmento["estado_rng"]
+                for resultado, n in fragmento["resultados"].items():
+                    totales[resultado] += n
+            print(f"Ronda {ronda + 1}/{rondas} | Estados: {len(agente.q_table)} | Gana X: {totales['X']} - Gana O: {totales['O']}")
+
+    duracion = time.time() - tiempo_inicio
+    agente.epsilon = min(epsilons)
+    if agente.cambios is not None:
+        # La fusión reemplaza la tabla completa: el diario recibe todos los estados
+        agente.cambios.update(agente.q_table)
+    _imprimir_resumen(duracion, totales["X"], totales["O"], totales["Empate"])
+    print(f"Episodios por segundo: {n_episodios / duracion:.0f}")
+
+    if guardar:
+        agente.guardar_conocimiento()
+
+    totales["episodios_por_segundo"] = n_episodios / duracion
+    return totales
+
+def medir_escalabilidad(n_episodios=100000, lista_workers=(1, 2, 4, 8, 16, 32), rondas=10):
+    """Entrena desde cero con distinto número de procesos y tabula episodios/segundo y speedup."""
+    filas = []
+    for workers in lista_workers:
+        agente = QAgent(cargar=False)
+        r = ejecutar_entrenamiento_paralelo(n_episodios, workers=workers, rondas=rondas, agente=agente, guardar=False)
+        filas.append((workers, r["episodios_por_segundo"], r["X"] / n_episodios))
+
+    base = filas[0][1]
+    print(f"{'Procesos':>8} {'Episodios/s':>12} {'Speedup':>8} {'% Gana X':>9}")
+    for workers, eps, tasa_x in filas:
+        print(f"{workers:>8} {eps:>12.0f} {eps / base:>7.2f}x {tasa_x * 100:>8.1f}%")
+    return filas
 
 if __name__ == "__main__":
-    ejecutar_entrenamiento(10000)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Entrena al agente Q-Learning (implementación de referencia).")
+    parser.add_argument("--episodios", type=int, default=10000)
+    parser.add_argument("--checkpoint", help="archivo de checkpoint (p. ej. entrenamiento.ckpt.json)")
+    parser.add_argument("--cada", type=int, default=5000, help="episodios entre checkpoints")
+    parser.add_argument("--resume", action="store_true", help="continúa desde --checkpoint si existe")
+    parser.add_argument("--evaluar-cada", type=int, help="episodios entre evaluaciones para la parada temprana")
+    parser.add_argument("--json", action="store_true", help="guarda también el JSON indentado del cerebro")
+    args = parser.parse_args()
+
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requiere --checkpoint")
+    # Al reanudar, el checkpoint trae la Tabla Q y epsilon: no se carga el cerebro guardado
+    reanudando = args.resume and os.path.exists(args.checkpoint)
+    agente = QAgent(cargar=False) if reanudando else obtener_agente()
+    agente.guardar_json = args.json
+    ejecutar_entrenamiento(args.episodios, agente=agente, checkpoint=args.checkpoint,
+                           intervalo_checkpoint=args.cada, reanudar=args.resume, evaluar_cada=args.evaluar_cada)
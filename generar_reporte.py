@@ -1,20 +1,26 @@
-import json
 import ast
 import os
 import webbrowser
 
+from game.ai import ARCHIVO_Q_TABLE, ARCHIVO_Q_TABLE_BINARIO, QAgent
+from game.estados import CODIGOS, decodificar
+
 def generar_html_interactivo():
-    archivo_entrada = "conocimiento_gato.json"
     archivo_salida = "REPORTE_CEREBRO_INTERACTIVO.html"
     
-    print(f"Leyendo {archivo_entrada}...")
+    print(f"Leyendo {ARCHIVO_Q_TABLE} / {ARCHIVO_Q_TABLE_BINARIO}...")
     
-    if not os.path.exists(archivo_entrada):
+    # Se carga igual que al jugar: el más nuevo entre el JSON y el .qtb (más sus
+    # diarios, si los hay). El JSON solo se reescribe con guardar_json=True, así que
+    # leerlo siempre mostraría el cerebro de antes del último entrenamiento.
+    agente = QAgent(archivo=ARCHIVO_Q_TABLE)
+    if not agente.q_table:
         print("Error: No se encuentra el archivo de conocimiento. Entrena primero.")
         return
-
-    with open(archivo_entrada, "r") as f:
-        data = json.load(f)
+    data = {
+        str(tuple(decodificar(CODIGOS[estado]))): {str(m): v for m, v in acciones.items()}
+        for estado, acciones in agente.q_table.items()
+    }
 
     estados_ordenados = sorted(data.keys())
 
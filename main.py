@@ -1,22 +1,44 @@
 # MAIN.PY: Ejecutador del juego"
+import argparse
 import time
 import sys
 import pygame 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from game.logic import LogicaTresRayas
-from game.ai import agente_global, obtener_movimiento_minimax_adaptable, generar_arbol_visual, limpiar_cache
+from game.ai import TIEMPOS_ARRANQUE, obtener_movimiento_minimax_adaptable, generar_arbol_visual
+from game.politica import obtener_politica
 from ui.interface import *
 from ui.menu import MenuPrincipal
 from ui.assets import *
 from ui.help import * 
 
+# Pausa visible antes de cada jugada de la IA (antes era un time.sleep que congelaba la ventana)
+RETARDO_IA_MS = 500
+
+# ------------------------------
+# TRABAJO DE LA IA EN SEGUNDO PLANO
+# La jugada de la IA y el árbol visual se calculan en un hilo aparte sobre copias
+# del tablero/historial; el bucle solo revisa si el resultado ya está listo, así
+# que sigue dibujando y atendiendo eventos a 60 FPS mientras la IA "piensa".
+# ------------------------------
+
+def calcular_jugada_ia(tablero, ficha):
+    """Jugada de la IA para `ficha`: Q-Learning (política compilada) con X, Minimax con O."""
+    if ficha == "X":
+        posibles = [i for i in range(9) if tablero[i] == " "]
+        return obtener_politica().obtener_accion(tablero, posibles)
+    return obtener_movimiento_minimax_adaptable(tablero, ficha)
+
 # ------------------------------
 # FUNCIÓN PRINCIPAL
 # Inicia Pygame, muestra el menú y ejecuta el bucle principal del juego en el modo seleccionado.
 # ------------------------------
 
-def main():
+def main(mostrar_tiempos=False):
+    inicio_programa = time.perf_counter()
+
     # INICIALIZAR PYGAME Y SONIDO
     pygame.init()
     pygame.mixer.init()
@@ -36,9 +58,20 @@ def main():
     p_q_vs_m = 0
     p_m_vs_q = 0
     
+    # Un solo hilo: las tareas de la IA se ejecutan en orden y nunca a la vez
+    trabajador = ThreadPoolExecutor(max_workers=1)
+
     # CONFIGURAR VENTANA PRINCIPAL
     pantalla_principal = pygame.display.set_mode((ANCHO_VENTANA, ALTO_VENTANA))
     pygame.display.set_caption("Tres en Raya - Machine Learning")
+    TIEMPOS_ARRANQUE["hasta_ventana_principal"] = time.perf_counter() - inicio_programa
+
+    def salir():
+        trabajador.shutdown(wait=False)
+        if mostrar_tiempos:
+            for nombre, segundos in TIEMPOS_ARRANQUE.items():
+                print(f"{nombre:<28} {segundos * 1000:>9.1f} ms")
+        pygame.quit(); sys.exit()
 
     # BUCLE INFINITO PARA REINICIAR EL JUEGO
     while True:
@@ -55,7 +88,7 @@ def main():
             accion = menu.manejar_eventos()
 
             if accion == "SALIR":
-                pygame.quit(); sys.exit()
+                salir()
             
             elif accion == "JUGAR":
                 modo_juego = "HUMANO" 
@@ -73,8 +106,13 @@ def main():
         mensaje_estado = "Juega la IA (X)"
         juego_corriendo = True
         juego_terminado_flag = False
-        limpiar_cache()
         estructura_arbol = [] 
+        tarea_ia = None        # Future con la jugada en cálculo (None = no hay)
+        ia_lista_en = 0        # pygame.time.get_ticks() a partir del cual se puede aplicar
+        tarea_arbol = None     # Future con el árbol visual en cálculo
+
+        def pedir_arbol():
+            return trabajador.submit(generar_arbol_visual, list(juego.historial))
         
         # BUCLE PRINCIPAL DE LA PARTIDA
         while juego_corriendo:
@@ -90,16 +128,23 @@ def main():
             evento = ui.obtener_evento_usuario()
 
             if evento == 'SALIR':
-                pygame.quit(); sys.exit()
+                salir()
 
             if evento == 'MENU':
                 juego_corriendo = False 
                 break 
             
+            # 3. RECOGER EL ÁRBOL SI YA TERMINÓ DE CALCULARSE
+            if tarea_arbol is not None and tarea_arbol.done():
+                estructura_arbol = tarea_arbol.result()
+                tarea_arbol = None
+
             if evento == 'REINICIAR':
                 juego.reiniciar()
-                juego.historial = []  
                 estructura_arbol = [] 
+                # Lo que estuviera calculándose era de la partida anterior: se descarta
+                tarea_ia = None
+                tarea_arbol = None
                 turno = "X" 
                 mensaje_estado = "IA Pensando"
                 juego_terminado_flag = False
@@ -107,7 +152,7 @@ def main():
             
             if evento == 'ARBOL': 
                 if modo_juego == "MINIMAX":
-                    estructura_arbol = generar_arbol_visual(juego.historial)
+                    tarea_arbol = pedir_arbol()
                     ui.modal_abierto = True
                     ui.modal_scroll_x = 0
                     ui.modal_scroll_y = 0
@@ -148,69 +193,54 @@ def main():
                 if ganador and 'win' in ui.sonidos:
                     ui.sonidos['win'].play()
 
-                estructura_arbol = generar_arbol_visual(juego.historial)       
+                tarea_arbol = pedir_arbol()
                 juego_terminado_flag = True
                 continue
 
-            # TURNO DE LA IA (Q-LEARNING)
-            if turno == "X":
-                if modo_juego == "HUMANO":
-                    mensaje_estado = "IA Pensando..."
-                    ui.dibujar_interfaz_humano(juego.tablero, mensaje_estado, p_human, p_ia_vs_h, empates_h, juego.combo_ganador)
-                else:
-                    ui.dibujar_interfaz_minimax(juego.tablero, mensaje_estado, p_q, p_m, empates_ai, estructura_arbol, juego.combo_ganador)
+            # TURNO DE LA IA (Q-LEARNING CON X, MINIMAX CON O)
+            if turno == "X" or modo_juego == "MINIMAX":
+                if tarea_ia is None:
+                    # Se pide la jugada y se arranca el temporizador; el bucle sigue dibujando
+                    if turno == "X" and modo_juego == "HUMANO":
+                        mensaje_estado = "IA Pensando..."
+                    tarea_ia = trabajador.submit(calcular_jugada_ia, list(juego.tablero), turno)
+                    ia_lista_en = pygame.time.get_ticks() + RETARDO_IA_MS
+                    continue
 
-                pygame.display.flip()
-                time.sleep(0.5) 
+                if not tarea_ia.done() or pygame.time.get_ticks() < ia_lista_en:
+                    continue
 
-                posibles = juego.obtener_movimientos_posibles()
-                
-                accion_ia = agente_global.obtener_accion(juego.tablero, posibles, en_entrenamiento=False)
-                
-                if accion_ia is not None:
-                    juego.realizar_movimiento(accion_ia, "X") 
+                movimiento = tarea_ia.result()
+                tarea_ia = None
+                if movimiento is not None:
+                    juego.realizar_movimiento(movimiento, turno)
 
                     if modo_juego == "MINIMAX": 
-                        estructura_arbol = generar_arbol_visual(juego.historial)
+                        tarea_arbol = pedir_arbol()
 
-                    turno = "O"
                     if 'colocar' in ui.sonidos: 
                         ui.sonidos['colocar'].play()
-                    if modo_juego == "HUMANO":
-                        mensaje_estado = "Tu turno"
+                    if turno == "X":
+                        turno = "O"
+                        mensaje_estado = "Tu turno" if modo_juego == "HUMANO" else "Turno de Minimax"
                     else:
-                        mensaje_estado = "Turno de Minimax"
-                else:
-                    pass 
-
-            # TURNO DEL OPONENTE (HUMANO O MINIMAX)
-            else:
-
-                if modo_juego == "MINIMAX":
-                    ui.dibujar_interfaz_minimax(juego.tablero, mensaje_estado, p_q, p_m, empates_ai, estructura_arbol, juego.combo_ganador)
-                    pygame.display.flip()
-                    time.sleep(0.5)
-                    movimiento = obtener_movimiento_minimax_adaptable(juego.tablero, "O")
-                    if movimiento is not None:
-                        juego.realizar_movimiento(movimiento, "O") 
-
-                        estructura_arbol = generar_arbol_visual(juego.historial) 
-
                         turno = "X"
-                        if 'colocar' in ui.sonidos: 
-                            ui.sonidos['colocar'].play()
                         mensaje_estado = "Q-Learning Pensando..."
-                else: 
-                    # TURNO DEL JUGADOR HUMANO
-                    if isinstance(evento, int): 
-                        movimiento = evento
-                        
-                        if juego.es_movimiento_valido(movimiento):
-                            juego.realizar_movimiento(movimiento, "O")
-                            turno = "X" 
-                            if 'colocar' in ui.sonidos: ui.sonidos['colocar'].play()
-                        else:
-                            if 'error' in ui.sonidos: ui.sonidos['error'].play()
+
+            # TURNO DEL JUGADOR HUMANO (O)
+            else:
+                if isinstance(evento, int): 
+                    movimiento = evento
+                    
+                    if juego.es_movimiento_valido(movimiento):
+                        juego.realizar_movimiento(movimiento, "O")
+                        turno = "X" 
+                        if 'colocar' in ui.sonidos: ui.sonidos['colocar'].play()
+                    else:
+                        if 'error' in ui.sonidos: ui.sonidos['error'].play()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Tres en Raya con agente Q-Learning.")
+    parser.add_argument("--tiempos", action="store_true",
+                        help="al salir, muestra cuánto tardó el arranque (ventana, carga del cerebro, política)")
+    main(mostrar_tiempos=parser.parse_args().tiempos)
\ No newline at end of file
@@ -0,0 +1,18 @@
+# CONFTEST.PY: Configuración común de las pruebas (pytest)
+
+import os
+import random
+import sys
+
+import pytest
+
+# Las pruebas importan `game` y `ui` desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def directorio_temporal(tmp_path, monkeypatch):
+    """Cada prueba corre en su propio directorio: ningún cerebro se escribe en el repositorio."""
+    monkeypatch.chdir(tmp_path)
+    random.seed(0)
+    return tmp_path
@@ -0,0 +1,35 @@
+# TEST_ARENA.PY: Aperturas aleatorias de la arena
+
+import random
+
+import pytest
+
+from game.arena import MAX_APERTURA, ejecutar_serie, generar_apertura, main
+from game.logic import LogicaTresRayas
+
+
+@pytest.mark.parametrize("jugadas", range(MAX_APERTURA + 1))
+def test_apertura_no_termina_la_partida(jugadas):
+    rng = random.Random(jugadas)
+    for _ in range(20):
+        apertura = generar_apertura(rng, jugadas)
+        assert len(apertura) == len(set(apertura)) == jugadas
+        juego = LogicaTresRayas()
+        for i, mov in enumerate(apertura):
+            juego.realizar_movimiento(mov, "XO"[i % 2])
+        assert not juego.juego_terminado()
+
+
+@pytest.mark.parametrize("jugadas", [-1, MAX_APERTURA + 1, 20])
+def test_apertura_fuera_de_rango(jugadas):
+    with pytest.raises(ValueError):
+        generar_apertura(random.Random(0), jugadas)
+    with pytest.raises(ValueError):
+        ejecutar_serie("aleatorio", "aleatorio", partidas=2, aperturas=jugadas, mostrar=False)
+
+
+def test_cli_rechaza_aperturas_invalidas(capsys):
+    with pytest.raises(SystemExit) as salida:
+        main(["aleatorio", "aleatorio", "--aperturas", "9"])
+    assert salida.value.code == 2
+    assert "--aperturas" in capsys.readouterr().err
@@ -0,0 +1,68 @@
+# TEST_BUSQUEDA.PY: Motor Negamax con tabla de transposición
+
+import pytest
+
+from game.bitboard import LogicaBitboard
+from game.busqueda import MotorNegamax
+
+POSICIONES = [[], [4], [0], [4, 0], [0, 4, 8], [4, 0, 8, 2]]
+
+
+def _posicion(historial):
+    juego = LogicaBitboard()
+    for mov in historial:
+        juego.mover(mov)
+    return juego
+
+
+def _logra_puntaje(juego, mov, puntaje):
+    """True si jugar `mov` mantiene `puntaje` (visto desde la hija, un ply más lejos)."""
+    juego.mover(mov)
+    try:
+        if juego.hay_ganador():
+            return puntaje == juego.num_casillas
+        if not juego.existe_espacio_libre():
+            return puntaje == 0
+        hija = -MotorNegamax().buscar(juego)[1]
+        return hija == puntaje + (puntaje > 0) - (puntaje < 0)
+    finally:
+        juego.deshacer_movimiento()
+
+
+@pytest.mark.parametrize("historial", POSICIONES)
+@pytest.mark.parametrize("max_entradas_tt", [0, 1, 10])
+def test_tt_llena_no_pierde_la_jugada_raiz(historial, max_entradas_tt):
+    _, esperado = MotorNegamax().buscar(_posicion(historial))
+    juego = _posicion(historial)
+    mov, puntaje = MotorNegamax(max_entradas_tt=max_entradas_tt).buscar(juego)
+    assert mov in juego.obtener_movimientos_posibles()
+    assert puntaje == esperado
+    assert _logra_puntaje(juego, mov, puntaje)
+
+
+@pytest.mark.parametrize("historial", POSICIONES)
+def test_segunda_busqueda_usa_la_tt_de_la_raiz(historial):
+    motor = MotorNegamax()
+    primera = motor.buscar(_posicion(historial))
+    # La raíz ya está en la TT como EXACTO: la jugada sale de la entrada
+    assert motor.buscar(_posicion(historial)) == primera
+
+
+def test_reiniciar_vacia_el_historial():
+    juego = _posicion([4, 0, 8])
+    juego.reiniciar()
+    # Con el historial viejo `mover` pondría O y deshacer sacaría una casilla ajena
+    juego.mover(2)
+    assert juego.ficha_en(2) == "X"
+    assert juego.deshacer_movimiento() == 2
+    assert juego.historial == []
+    assert juego.tablero == [" "] * 9
+
+
+def test_asignar_tablero_rehace_el_historial():
+    juego = _posicion([4, 0, 8, 2, 6])
+    juego.tablero = ["X", " ", " ", " ", "O", " ", " ", " ", " "]
+    assert juego.historial == [0, 4]
+    assert juego.ganador is None
+    juego.mover(8)
+    assert juego.ficha_en(8) == "X"
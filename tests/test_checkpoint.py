@@ -0,0 +1,47 @@
+# TEST_CHECKPOINT.PY: Reanudar un entrenamiento desde su checkpoint
+
+import contextlib
+import io
+import random
+
+from game.ai import QAgent
+from game.checkpoint import cargar_checkpoint, guardar_checkpoint
+from game.trainer import ejecutar_entrenamiento
+
+# Con la semilla 0 y una evaluación cada 1000 episodios la parada temprana llega en el 13000
+EVALUAR_CADA = 1000
+INTERRUPCION = 12500
+
+
+def _entrenar(n_episodios, agente, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ejecutar_entrenamiento(n_episodios, agente=agente, guardar=False, evaluar_cada=EVALUAR_CADA,
+                                      checkpoint="entrenamiento.ckpt", intervalo_checkpoint=1500, **kwargs)
+
+
+def test_reanudado_se_detiene_en_el_mismo_episodio():
+    random.seed(0)
+    seguido = QAgent(cargar=False)
+    resultados_seguido = _entrenar(60000, seguido)
+    assert INTERRUPCION < sum(resultados_seguido.values()) < 60000
+
+    random.seed(0)
+    _entrenar(INTERRUPCION, QAgent(cargar=False))
+    reanudado = QAgent(cargar=False)
+    resultados_reanudado = _entrenar(60000, reanudado, reanudar=True)
+
+    assert resultados_reanudado == resultados_seguido
+    assert reanudado.q_table == seguido.q_table
+    assert reanudado.epsilon == seguido.epsilon
+
+
+def test_politica_anterior_ida_y_vuelta():
+    agente = QAgent(cargar=False)
+    agente.q_table = {0: {4: 1.5, 0: -0.25}}
+    politica = {0: (4,), 17: (1, 3, 5)}
+    guardar_checkpoint("a.ckpt", agente, 10, {"X": 1, "O": 2, "Empate": 7}, politica)
+    guardar_checkpoint("b.ckpt", agente, 10, {"X": 1, "O": 2, "Empate": 7})
+
+    episodio, contadores, leida = cargar_checkpoint("a.ckpt", QAgent(cargar=False))
+    assert (episodio, contadores, leida) == (10, {"X": 1, "O": 2, "Empate": 7}, politica)
+    assert cargar_checkpoint("b.ckpt", QAgent(cargar=False))[2] is None
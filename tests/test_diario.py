@@ -0,0 +1,180 @@
+# TEST_DIARIO.PY: Tabla Q como base + diario de cambios, y su recuperación ante caídas
+
+import contextlib
+import io
+import os
+
+import pytest
+
+from game import ai, politica
+from game import diario as modulo_diario
+from game.ai import ARCHIVO_Q_TABLE_BINARIO, QAgent
+from game.diario import DiarioQ, _diarios_existentes, _ruta_diario, rutas_diarios
+from game.politica import ARCHIVO_POLITICA, PoliticaCompilada, obtener_politica
+from game.persistencia import leer_generacion
+from game.qtabla import QAgentNumpy
+from game.replay import QAgentReplay
+from game.trainer import ejecutar_entrenamiento_vectorizado, jugar_episodio_entrenamiento
+
+BASE = "cerebro.qtb"
+
+
+def _entrenar_guardando(agente, episodios, cada=200, inicio=1):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(inicio, inicio + episodios):
+            jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+            agente.reducir_epsilon()
+            if i % cada == 0:
+                agente.guardar_conocimiento()
+
+
+def _recargar():
+    diario = DiarioQ(BASE)
+    try:
+        return diario.cargar()
+    finally:
+        diario.cerrar()
+
+
+@pytest.mark.parametrize("clase", [QAgent, QAgentNumpy, QAgentReplay])
+def test_recarga_igual_tras_compactar(clase):
+    agente = clase(cargar=False)
+    diario = DiarioQ(BASE, umbral=0.5)
+    diario.adjuntar(agente)
+    _entrenar_guardando(agente, 4000)
+    diario.cerrar()
+
+    assert diario.compactaciones >= 2
+    assert leer_generacion(BASE) == diario.generacion
+    assert _recargar() == agente.q_table
+
+
+def test_qagent_numpy_anota_sus_cambios():
+    agente = QAgentNumpy(cargar=False)
+    diario = DiarioQ(BASE, umbral=1e9)
+    diario.adjuntar(agente)
+    _entrenar_guardando(agente, 1000, cada=1000)
+    assert diario.registros_diario > 0
+    diario.cerrar()
+    assert _recargar() == agente.q_table
+
+
+def test_entrenamiento_vectorizado_con_diario():
+    agente = QAgentNumpy(cargar=False)
+    diario = DiarioQ(BASE, umbral=1e9)
+    diario.adjuntar(agente)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ejecutar_entrenamiento_vectorizado(2000, agente=agente, semilla=0)
+    diario.cerrar()
+    assert _recargar() == agente.q_table
+
+
+def test_rechaza_agentes_sin_cambios():
+    class SinCambios:
+        q_table = {}
+
+    with pytest.raises(TypeError):
+        DiarioQ(BASE).adjuntar(SinCambios())
+
+
+def test_registro_a_medio_escribir_se_descarta():
+    agente = QAgent(cargar=False)
+    diario = DiarioQ(BASE, umbral=1e9)
+    diario.adjuntar(agente)
+    _entrenar_guardando(agente, 1000)
+    diario.cerrar()
+    guardado = {s: dict(a) for s, a in agente.q_table.items()}
+
+    # Caída a mitad de un registro: quedan 5 de sus 11 bytes al final del diario
+    ruta = _ruta_diario(BASE, diario.generacion)
+    tamano = os.path.getsize(ruta)
+    with open(ruta, "ab") as f:
+        f.write(b"\x01\x02\x03\x04\x05")
+    assert _recargar() == guardado
+
+    # Al reabrir se trunca el sobrante y lo que se anexa después se lee bien
+    agente = QAgent(cargar=False)
+    diario = DiarioQ(BASE, umbral=1e9)
+    diario.adjuntar(agente)
+    assert os.path.getsize(ruta) == tamano
+    _entrenar_guardando(agente, 600, inicio=1001)
+    diario.cerrar()
+    assert _recargar() == agente.q_table
+
+
+def test_caida_entre_abrir_el_diario_nuevo_y_reemplazar_la_base(monkeypatch):
+    agente = QAgent(cargar=False)
+    diario = DiarioQ(BASE, umbral=1e9, en_segundo_plano=False)
+    diario.adjuntar(agente)
+    _entrenar_guardando(agente, 1000)
+    diario.compactar()
+    generacion = diario.generacion
+    _entrenar_guardando(agente, 600, inicio=1001)
+
+    # El diario g+1 ya existe pero el proceso "muere" antes de escribir la base g+1
+    def caida(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as m, pytest.raises(KeyboardInterrupt):
+        m.setattr(modulo_diario, "escribir_binario", caida)
+        diario.compactar()
+    diario._archivo.close()
+
+    assert leer_generacion(BASE) == generacion
+    assert sorted(_diarios_existentes(BASE)) == [generacion, generacion + 1]
+    assert _recargar() == agente.q_table
+
+    # Lo guardado en el diario g+1 tras la caída también se recupera
+    reanudado = QAgent(cargar=False)
+    diario = DiarioQ(BASE, umbral=1e9, en_segundo_plano=False)
+    diario.adjuntar(reanudado)
+    assert diario.generacion == generacion + 1
+    _entrenar_guardando(reanudado, 400, inicio=1601)
+    diario.cerrar()
+    assert _recargar() == reanudado.q_table
+
+
+def test_caida_tras_reemplazar_la_base_antes_de_borrar_diarios(monkeypatch):
+    agente = QAgent(cargar=False)
+    diario = DiarioQ(BASE, umbral=1e9, en_segundo_plano=False)
+    diario.adjuntar(agente)
+    _entrenar_guardando(agente, 1000)
+
+    # La base g+1 queda escrita pero los diarios viejos no se alcanzan a borrar
+    with monkeypatch.context() as m:
+        m.setattr(modulo_diario, "_diarios_existentes", lambda ruta_base: {})
+        diario.compactar()
+    diario.cerrar()
+
+    assert sorted(_diarios_existentes(BASE)) == [diario.generacion - 1, diario.generacion]
+    assert _recargar() == agente.q_table
+    assert sorted(_diarios_existentes(BASE)) == [diario.generacion]
+
+
+def test_arranque_lee_lo_guardado_en_el_diario(monkeypatch):
+    # Cerebro completo + su política compilada, y después más entrenamiento con diario
+    agente = QAgent(cargar=False)
+    _entrenar_guardando(agente, 1000, cada=1000)
+    PoliticaCompilada.desde_q_table(agente.q_table).guardar(ARCHIVO_POLITICA)
+    diario = DiarioQ(ARCHIVO_Q_TABLE_BINARIO, umbral=1e9)
+    diario.adjuntar(agente)
+    _entrenar_guardando(agente, 2000, inicio=1001)
+    diario.cerrar()
+
+    # Los diarios son más nuevos que la política (sin depender de la resolución del reloj)
+    ahora = os.path.getmtime(ARCHIVO_Q_TABLE_BINARIO)
+    os.utime(ARCHIVO_POLITICA, (ahora - 60, ahora - 60))
+    for ruta in rutas_diarios(ARCHIVO_Q_TABLE_BINARIO):
+        os.utime(ruta, (ahora, ahora))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        cargado = QAgent()
+    assert cargado.q_table == agente.q_table
+
+    monkeypatch.setattr(ai, "_AGENTES", {})
+    monkeypatch.setattr(politica, "_POLITICAS", {})
+    monkeypatch.setattr(politica, "TIEMPOS_ARRANQUE", {})
+    with contextlib.redirect_stdout(io.StringIO()):
+        jugadas = obtener_politica().jugadas
+    assert "compilar_principal" in politica.TIEMPOS_ARRANQUE
+    assert jugadas == PoliticaCompilada.desde_q_table(agente.q_table).jugadas
@@ -0,0 +1,118 @@
+# TEST_LOGIC.PY: Estado incremental de LogicaTresRayas (ganador, combo, fin de partida)
+
+import itertools
+
+import pytest
+
+from game.logic import COMBINACIONES_GANADORAS, LogicaTresRayas
+
+
+def _estado(juego):
+    return (juego.tablero, list(juego.historial), juego.verificar_ganador(), juego.combo_ganador,
+            juego.num_movimientos, juego.juego_terminado(), juego.existe_espacio_libre())
+
+
+def _recalculado(juego):
+    """El mismo estado calculado desde cero a partir de las casillas."""
+    nuevo = LogicaTresRayas()
+    nuevo.establecer_tablero(juego.tablero)
+    return nuevo
+
+
+@pytest.mark.parametrize("combo", COMBINACIONES_GANADORAS)
+def test_deshacer_restaura_cada_linea(combo):
+    # X completa `combo` y O juega en casillas que no la estorban ni forman línea
+    libres = [i for i in range(9) if i not in combo]
+    for respuestas in itertools.permutations(libres, 2):
+        juego = LogicaTresRayas()
+        secuencia = [combo[0], respuestas[0], combo[1], respuestas[1], combo[2]]
+        estados = [_estado(juego)]
+        for i, mov in enumerate(secuencia):
+            assert juego.realizar_movimiento(mov, "XO"[i % 2]) is True
+            estados.append(_estado(juego))
+
+        assert juego.verificar_ganador() == "X"
+        assert juego.combo_ganador == list(combo)
+        assert juego.juego_terminado()
+
+        for anterior in reversed(estados[:-1]):
+            juego.deshacer_movimiento()
+            assert _estado(juego) == anterior
+
+
+def test_deshacer_tras_jugar_despues_de_ganar():
+    juego = LogicaTresRayas()
+    for i, mov in enumerate([0, 3, 1, 4, 2, 5]):
+        juego.realizar_movimiento(mov, "XO"[i % 2])
+    # O también completa una fila, pero el ganador sigue siendo el primero
+    assert juego.verificar_ganador() == "X" and juego.combo_ganador == [0, 1, 2]
+    juego.deshacer_movimiento()
+    assert juego.verificar_ganador() == "X" and juego.juego_terminado()
+    juego.deshacer_movimiento()
+    assert juego.verificar_ganador() is None and not juego.juego_terminado()
+    assert juego.num_movimientos == 4
+
+
+def test_partidas_completas_coinciden_con_recalcular():
+    for secuencia in itertools.islice(itertools.permutations(range(9)), 0, 40320, 97):
+        juego = LogicaTresRayas()
+        for i, mov in enumerate(secuencia):
+            juego.realizar_movimiento(mov, "XO"[i % 2])
+            assert _estado(juego)[2:] == _estado(_recalculado(juego))[2:]
+            if juego.juego_terminado():
+                break
+
+
+def test_tablero_es_de_solo_lectura():
+    juego = LogicaTresRayas()
+    with pytest.raises(TypeError):
+        juego.tablero[0] = "X"
+    assert juego.es_movimiento_valido(0)
+
+
+def test_asignar_tablero_recalcula_el_estado():
+    juego = LogicaTresRayas()
+    juego.tablero = ["X", "X", "X", "O", "O", " ", " ", " ", " "]
+    assert juego.verificar_ganador() == "X"
+    assert juego.combo_ganador == [0, 1, 2]
+    assert juego.num_movimientos == 5 and juego.juego_terminado()
+
+    juego.tablero = [" "] * 9
+    assert juego.verificar_ganador() is None and not juego.juego_terminado()
+
+
+def test_movimiento_invalido_devuelve_false():
+    juego = LogicaTresRayas()
+    assert juego.realizar_movimiento(4, "X") is True
+    assert juego.realizar_movimiento(4, "O") is False
+    assert juego.realizar_movimiento(9, "O") is False
+    assert juego.num_movimientos == 1
+
+
+def test_deshacer_tras_establecer_tablero_conserva_la_linea():
+    # El historial queda en orden de casilla: la última ficha (4) no es de la línea ganadora
+    juego = LogicaTresRayas()
+    juego.establecer_tablero(["X", "X", "X", "O", "O", " ", " ", " ", " "])
+    assert juego.deshacer_movimiento() == 4
+    assert juego.verificar_ganador() == "X"
+    assert juego.combo_ganador == [0, 1, 2]
+    assert juego.juego_terminado()
+
+    # Al quitar una ficha de la línea se recalcula: ya no hay ganador
+    assert juego.deshacer_movimiento() == 3
+    assert juego.deshacer_movimiento() == 2
+    assert juego.verificar_ganador() is None and not juego.juego_terminado()
+
+
+@pytest.mark.parametrize("combo", COMBINACIONES_GANADORAS)
+def test_deshacer_tras_establecer_tablero_coincide_con_recalcular(combo):
+    tablero = [" "] * 9
+    for i in combo:
+        tablero[i] = "X"
+    for i in [i for i in range(9) if i not in combo][:2]:
+        tablero[i] = "O"
+    juego = LogicaTresRayas()
+    juego.establecer_tablero(tablero)
+    while juego.historial:
+        juego.deshacer_movimiento()
+        assert _estado(juego)[2:] == _estado(_recalculado(juego))[2:]
@@ -0,0 +1,55 @@
+# TEST_PERSISTENCIA.PY: Formatos del cerebro y guardado atómico
+
+import os
+
+import pytest
+
+from game import persistencia
+from game.ai import QAgent
+from game.persistencia import abrir_binario, escribir_binario, leer_binario, leer_json
+
+Q_TABLE = {0: {4: 1.5, 0: -2.0}, 10: {}, 25: {8: 0.125}}
+
+
+def test_binario_ida_y_vuelta():
+    escribir_binario(Q_TABLE, "cerebro.qtb")
+    assert leer_binario("cerebro.qtb") == Q_TABLE
+    assert not os.path.exists("cerebro.qtb.tmp")
+
+
+def test_abrir_binario_cierra_el_mapa():
+    escribir_binario(Q_TABLE, "cerebro.qtb")
+    with abrir_binario("cerebro.qtb") as (codigos, valores):
+        assert len(codigos) == len(Q_TABLE)
+        assert len(valores) == 9 * len(Q_TABLE)
+    with pytest.raises(ValueError):
+        codigos.tolist()  # la vista ya se liberó
+
+
+def test_caida_al_guardar_conserva_el_cerebro_anterior(monkeypatch):
+    escribir_binario(Q_TABLE, "cerebro.qtb")
+
+    def fallar(*args):
+        raise OSError("disco lleno")
+
+    with monkeypatch.context() as m:
+        m.setattr(persistencia.os, "fsync", fallar)
+        with pytest.raises(OSError):
+            escribir_binario({1: {0: 9.0}}, "cerebro.qtb")
+
+    assert leer_binario("cerebro.qtb") == Q_TABLE
+    assert not os.path.exists("cerebro.qtb.tmp")
+
+
+def test_json_solo_si_se_pide():
+    agente = QAgent(cargar=False)
+    agente.q_table = dict(Q_TABLE)
+    agente.guardar_conocimiento()
+    assert os.path.exists(agente.archivo_binario)
+    assert not os.path.exists(agente.archivo)
+
+    agente = QAgent(cargar=False, guardar_json=True)
+    agente.q_table = dict(Q_TABLE)
+    agente.guardar_conocimiento()
+    assert leer_json(agente.archivo) == Q_TABLE
+    assert QAgent().q_table == Q_TABLE
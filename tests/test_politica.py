@@ -0,0 +1,63 @@
+# TEST_POLITICA.PY: Política compilada leída de su .pol o compilada al vuelo
+
+import contextlib
+import io
+import os
+
+import pytest
+
+from game import ai, politica
+from game.ai import ARCHIVO_Q_TABLE, QAgent
+from game.politica import ARCHIVO_POLITICA, PoliticaCompilada, obtener_politica, ruta_politica
+from game.trainer import jugar_episodio_entrenamiento
+
+
+@pytest.fixture
+def cerebro(monkeypatch):
+    """Cerebro principal recién entrenado en el directorio de la prueba, con cachés vacías."""
+    monkeypatch.setattr(ai, "_AGENTES", {})
+    monkeypatch.setattr(politica, "_POLITICAS", {})
+    monkeypatch.setattr(politica, "TIEMPOS_ARRANQUE", {})
+    agente = QAgent(cargar=False)
+    for i in range(1, 2001):
+        jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+        agente.reducir_epsilon()
+    with contextlib.redirect_stdout(io.StringIO()):
+        agente.guardar_conocimiento()
+    return PoliticaCompilada.desde_q_table(agente.q_table)
+
+
+def _obtener():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return obtener_politica()
+
+
+def test_ruta_junto_al_cerebro():
+    assert ruta_politica(ARCHIVO_Q_TABLE) == ARCHIVO_POLITICA
+
+
+def test_lee_el_pol_sin_cargar_el_cerebro(cerebro):
+    cerebro.guardar(ARCHIVO_POLITICA)
+    assert _obtener().jugadas == cerebro.jugadas
+    assert "cargar_politica_principal" in politica.TIEMPOS_ARRANQUE
+    assert "principal" not in ai.agentes_cargados()
+
+
+def test_sin_pol_compila(cerebro):
+    assert _obtener().jugadas == cerebro.jugadas
+    assert "compilar_principal" in politica.TIEMPOS_ARRANQUE
+
+
+def test_pol_mas_viejo_que_el_cerebro_se_ignora(cerebro):
+    PoliticaCompilada(bytes(len(cerebro.jugadas))).guardar(ARCHIVO_POLITICA)
+    viejo = os.path.getmtime(ai.ARCHIVO_Q_TABLE_BINARIO) - 60
+    os.utime(ARCHIVO_POLITICA, (viejo, viejo))
+    assert _obtener().jugadas == cerebro.jugadas
+    assert "cargar_politica_principal" not in politica.TIEMPOS_ARRANQUE
+
+
+def test_pol_corrupto_compila(cerebro):
+    with open(ARCHIVO_POLITICA, "wb") as f:
+        f.write(b"POLQ basura")
+    assert _obtener().jugadas == cerebro.jugadas
+    assert "compilar_principal" in politica.TIEMPOS_ARRANQUE
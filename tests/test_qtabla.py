@@ -0,0 +1,66 @@
+# TEST_QTABLA.PY: QAgentNumpy y sus lecturas directas sobre la matriz
+
+import random
+
+import pytest
+
+from game.ai import QAgent, tabla_q
+from game.evaluacion import fraccion_optima, politica_greedy
+from game.politica import compilar_jugadas
+from game.qtabla import QAgentNumpy, TablaQNumpy
+from game.replay import QAgentReplay
+from game.trainer import jugar_episodio_entrenamiento
+
+
+def _entrenado(episodios=3000):
+    agente = QAgentNumpy(cargar=False)
+    for i in range(1, episodios + 1):
+        jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+        agente.reducir_epsilon()
+    return agente
+
+
+def test_acepta_los_parametros_de_qagent():
+    agente = QAgentNumpy(cargar=False, epsilon_min=0.2, epsilon_decay=0.5)
+    assert (agente.epsilon_min, agente.epsilon_decay) == (0.2, 0.5)
+    agente.reducir_epsilon()
+    agente.reducir_epsilon()
+    agente.reducir_epsilon()
+    assert agente.epsilon == 0.125
+
+    replay = QAgentReplay(cargar=False, epsilon_decay=0.9)
+    assert replay.epsilon_decay == 0.9
+
+
+def test_tabla_q_no_copia_la_matriz():
+    agente = QAgentNumpy(cargar=False)
+    assert tabla_q(agente) is agente.tabla
+    dicc = QAgent(cargar=False)
+    assert tabla_q(dicc) is dicc.q_table
+
+
+def test_politica_greedy_directa_igual_a_la_del_diccionario():
+    agente = _entrenado()
+    q_table = agente.q_table
+    assert politica_greedy(agente.tabla) == politica_greedy(q_table)
+    assert fraccion_optima(agente.tabla) == fraccion_optima(q_table)
+
+
+def test_compilar_directo_igual_al_del_diccionario():
+    agente = _entrenado()
+    assert compilar_jugadas(agente.tabla) == compilar_jugadas(agente.q_table)
+    assert compilar_jugadas(TablaQNumpy()) == compilar_jugadas({})
+
+
+@pytest.mark.parametrize("clase", [QAgent, QAgentNumpy])
+@pytest.mark.parametrize("tablero", [
+    ["X", "X", " ", " ", " ", " ", " ", " ", " "],  # dos X seguidas
+    ["O", " ", " ", " ", " ", " ", " ", " ", " "],  # empieza O
+    ["X", "X", "X", "O", "O", " ", "O", " ", " "],  # O jugó después de la línea de X
+])
+def test_tablero_inalcanzable_lanza_value_error(clase, tablero):
+    agente = clase(cargar=False)
+    with pytest.raises(ValueError, match="no es una posición alcanzable"):
+        agente.obtener_estado(tablero)
+    with pytest.raises(ValueError):
+        agente.obtener_accion(tablero, [5, 7, 8], en_entrenamiento=False)
@@ -0,0 +1,42 @@
+# TEST_SIMETRIA.PY: Agente canónico por simetrías (QAgentSimetrico)
+
+from game.ai import ARCHIVO_Q_TABLE, QAgent
+from game.persistencia import escribir_binario
+from game.simetria import (ARCHIVO_Q_TABLE_SIMETRICO, CANONICO, NUM_CANONICOS, QAgentSimetrico,
+                           canonizar_q_table, verificar_politica_simetrica)
+from game.trainer import jugar_episodio_entrenamiento
+
+
+def _entrenar(agente, episodios):
+    for i in range(1, episodios + 1):
+        jugar_episodio_entrenamiento(jugar_vs_si_mismo=(i % 500 == 0), agente=agente)
+        agente.reducir_epsilon()
+    return agente
+
+
+def test_politica_greedy_simetrica_tras_entrenar():
+    agente = _entrenar(QAgentSimetrico(cargar=False), 3000)
+    assert agente.q_table
+    assert verificar_politica_simetrica(agente) == []
+
+
+def test_solo_guarda_canonicos():
+    agente = _entrenar(QAgentSimetrico(cargar=False), 3000)
+    assert all(CANONICO[s] == s for s in agente.q_table)
+    assert len(agente.q_table) <= NUM_CANONICOS
+
+
+def test_no_comparte_archivo_con_qagent():
+    assert QAgentSimetrico(cargar=False).archivo == ARCHIVO_Q_TABLE_SIMETRICO != ARCHIVO_Q_TABLE
+
+
+def test_cerebro_normal_se_canoniza_al_cargar():
+    normal = _entrenar(QAgent(cargar=False), 3000)
+    escribir_binario(normal.q_table, "normal.qtb")
+
+    agente = QAgentSimetrico(archivo="normal.json")
+    assert agente.q_table == canonizar_q_table(normal.q_table)
+    assert all(CANONICO[s] == s for s in agente.q_table)
+    assert verificar_politica_simetrica(agente) == []
+    # Ya canónica: canonizar otra vez no cambia nada
+    assert canonizar_q_table(agente.q_table) == agente.q_table
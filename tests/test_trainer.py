@@ -0,0 +1,81 @@
+# TEST_TRAINER.PY: El entrenamiento vectorizado frente a la implementación de referencia
+
+import contextlib
+import io
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from game.ai import QAgent
+from game.qtabla import QAgentNumpy
+from game.telemetria import Telemetria
+from game.trainer import ejecutar_entrenamiento, ejecutar_entrenamiento_vectorizado
+
+EPISODIOS = 10000
+SEMILLAS = (0, 1, 2, 3)
+
+
+def _tasas(resultados):
+    total = sum(resultados.values())
+    return {r: n / total for r, n in resultados.items()}
+
+
+def _entrenar(modo, semilla, recompensas=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        if modo == "referencia":
+            random.seed(semilla)
+            agente = QAgent(cargar=False)
+            resultados = ejecutar_entrenamiento(EPISODIOS, agente=agente, guardar=False, recompensas=recompensas)
+        else:
+            agente = QAgentNumpy(cargar=False)
+            resultados = ejecutar_entrenamiento_vectorizado(EPISODIOS, agente=agente, semilla=semilla,
+                                                            guardar=False, recompensas=recompensas)
+    return agente, _tasas(resultados)
+
+
+def test_referencia_y_vectorizado_tienen_las_mismas_estadisticas():
+    # Con semillas fijas: la diferencia de medias por resultado debe caber en
+    # 4 errores estándar de la variación entre semillas (no se comparan bit a bit,
+    # el vectorizado usa otro generador y otro orden de actualizaciones).
+    tasas = {modo: [_entrenar(modo, s)[1] for s in SEMILLAS] for modo in ("referencia", "vectorizado")}
+    for resultado in ("X", "O", "Empate"):
+        ref = [t[resultado] for t in tasas["referencia"]]
+        vec = [t[resultado] for t in tasas["vectorizado"]]
+        error = ((statistics.variance(ref) + statistics.variance(vec)) / len(SEMILLAS)) ** 0.5
+        diferencia = abs(statistics.mean(ref) - statistics.mean(vec))
+        assert diferencia <= 4 * max(error, 0.005), (resultado, ref, vec)
+
+
+def test_vectorizado_usa_las_recompensas_dadas():
+    ceros = {"victoria": 0, "empate": 0, "derrota": 0}
+    agente, _ = _entrenar("vectorizado", 0, ceros)
+    assert not agente.tabla.valores.any()
+
+    unitarias = {"victoria": 1, "empate": 0.5, "derrota": -1}
+    agente, _ = _entrenar("vectorizado", 0, unitarias)
+    assert np.abs(agente.tabla.valores).max() <= 1.0 + 1e-6
+    assert agente.tabla.valores.min() < -0.5
+
+
+def test_telemetria_se_desengancha_al_terminar():
+    agente = QAgent(cargar=False)
+    telemetria = Telemetria("telemetria.jsonl", intervalo=3600)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ejecutar_entrenamiento(200, agente=agente, guardar=False, telemetria=telemetria)
+    assert agente.telemetria is None
+    consultas = telemetria.consultas
+    agente.obtener_accion([" "] * 9, list(range(9)))
+    assert telemetria.consultas == consultas
+
+
+def test_telemetria_previa_se_restaura_aunque_falle():
+    agente = QAgent(cargar=False)
+    previa = Telemetria("previa.jsonl", intervalo=3600)
+    agente.telemetria = previa
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(KeyError):
+        # Recompensas incompletas: el primer episodio que termina falla
+        ejecutar_entrenamiento(200, agente=agente, guardar=False, recompensas={},
+                               telemetria=Telemetria("nueva.jsonl", intervalo=3600))
+    assert agente.telemetria is previa
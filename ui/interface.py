@@ -80,6 +80,48 @@ class InterfazGrafica:
         # Variables que busca events.py originalmente
         self.rect_boton_salir = self.rect_home    
         self.rect_boton = self.rect_reload    
+
+        # CACHÉ DE RENDERIZADO
+        # Textos ya renderizados por (fuente, texto, color), las fichas X/O una sola vez
+        # y una capa con todo lo que no cambia entre frames (fondo, títulos, marco del
+        # tablero, gatos, badges, marcador y botones), que solo se recompone si cambia
+        # su clave (emociones, turno, puntajes o el botón bajo el mouse).
+        self.cache_textos = {}
+        self.glifos = {
+            "X": self.fuentes['ficha'].render("X", True, pygame.Color(COLOR_X)),
+            "O": self.fuentes['ficha'].render("O", True, pygame.Color(COLOR_O)),
+        }
+        self.capa_estatica = None
+        self.clave_capa = None
+    
+    # ------------------------------
+    # CACHÉ DE TEXTOS Y CAPA ESTÁTICA
+    # ------------------------------
+    LIMITE_CACHE_TEXTOS = 256
+
+    def _texto(self, fuente, texto, color):
+        """Superficie de `texto` con la fuente self.fuentes[fuente]; se renderiza solo la primera vez."""
+        clave = (fuente, texto, tuple(pygame.Color(color)))
+        superficie = self.cache_textos.get(clave)
+        if superficie is None:
+            if len(self.cache_textos) >= self.LIMITE_CACHE_TEXTOS:
+                self.cache_textos.clear()  # mensajes con marcadores distintos: que no crezca sin fin
+            superficie = self.fuentes[fuente].render(texto, True, color)
+            self.cache_textos[clave] = superficie
+        return superficie
+
+    def _capa(self, clave, componer):
+        """Capa estática del tamaño de la ventana; `componer(superficie)` solo corre si cambió la clave."""
+        if clave != self.clave_capa:
+            if self.capa_estatica is None:
+                self.capa_estatica = pygame.Surface((ANCHO_VENTANA, ALTO_VENTANA)).convert()
+            componer(self.capa_estatica)
+            self.clave_capa = clave
+        return self.capa_estatica
+
+    def _dibujar_fondo(self, superficie, color_respaldo):
+        if self.fondo_juego: superficie.blit(self.fondo_juego, (0, 0))
+        else: superficie.fill(pygame.Color(color_respaldo))
     
 
     # ------------------------------
@@ -97,10 +139,10 @@ class InterfazGrafica:
             self.pantalla.fill(pygame.Color(COLOR_FONDO))
 
         # SECCIÓN IZQUIERDA (TABLERO)
-        t_tablero = self.fuentes['titulo'].render("TABLERO DEL JUEGO", True, pygame.Color(COLOR_BOTON))
+        t_tablero = self._texto('titulo', "TABLERO DEL JUEGO", COLOR_BOTON)
         self.pantalla.blit(t_tablero, t_tablero.get_rect(center=(self.centro_izq, 80)))
         
-        t_turno = self.fuentes['subtitulo'].render(mensaje, True, pygame.Color(COLOR_X))
+        t_turno = self._texto('subtitulo', mensaje, COLOR_X)
         self.pantalla.blit(t_turno, t_turno.get_rect(center=(self.centro_izq, 130)))
 
         ancho_fondo = self.ancho_juego + (PADDING_LATERAL * 2)
@@ -140,8 +182,7 @@ class InterfazGrafica:
             pygame.draw.rect(self.pantalla, pygame.Color(COLOR_CASILLA), casilla_rect, border_radius=25)
 
             if tablero[i] != " ":
-                color = pygame.Color(COLOR_X if tablero[i] == "X" else COLOR_O)
-                txt = self.fuentes['ficha'].render(tablero[i], True, color)
+                txt = self.glifos[tablero[i]]
 
                 escala = 1.0
                 if i in self.animaciones_fichas:
@@ -188,30 +229,33 @@ class InterfazGrafica:
     # Muestra la pantalla completa del modo Jugador vs IA: fondo, tablero, títulos y gato animado.
     # ------------------------------       
     def dibujar_interfaz_humano(self, tablero, mensaje, human, ia, empates, combo_ganador=None):
-        if self.fondo_juego: self.pantalla.blit(self.fondo_juego, (0, 0))
-        else: self.pantalla.fill(pygame.Color(COLOR_FONDO))
+        x_tablero, y_tablero = int(ANCHO_VENTANA * 0.20), int(ALTO_VENTANA/2 - 150)
 
-        # Títulos
-        lbl_t = self.fuentes['titulo'].render("TABLERO DEL JUEGO", True, (55, 58, 127))
-        self.pantalla.blit(lbl_t, lbl_t.get_rect(center=(ANCHO_VENTANA // 2, 60)))
-        lbl_m = self.fuentes['subtitulo'].render(mensaje, True, (235, 186, 239))
-        self.pantalla.blit(lbl_m, lbl_m.get_rect(center=(ANCHO_VENTANA // 2, 110)))
-
-        # Tablero a la izquierda
-        self._dibujar_grid_tablero(int(ANCHO_VENTANA * 0.20), int(ALTO_VENTANA/2 - 150), tablero)
-        
         # Emoción del Gato (Q-Learning)
         emocion = "neutro"
         if "Perdiste" in mensaje or "Ganó la IA" in mensaje: emocion = "feliz"
         elif "Ganaste" in mensaje: emocion = "triste"
         elif "IA Pensando" in mensaje: emocion = "pensando"
 
-        # DIBUJAR UN SOLO GATO GRANDE
-        self.dibujar_avatar(self.pantalla, emocion, "derecha", modo_mini=False, ai_set="q")
+        def componer(capa):
+            self._dibujar_fondo(capa, COLOR_FONDO)
+            lbl_t = self._texto('titulo', "TABLERO DEL JUEGO", (55, 58, 127))
+            capa.blit(lbl_t, lbl_t.get_rect(center=(ANCHO_VENTANA // 2, 60)))
+            self._dibujar_marco_tablero(capa, x_tablero, y_tablero)
+            # DIBUJAR UN SOLO GATO GRANDE
+            self.dibujar_avatar(capa, emocion, "derecha", modo_mini=False, ai_set="q")
+            self._dibujar_marcador(capa, human, empates, ia, 'humano_vs_ia')
+            self._dibujar_botones_comunes(capa, hovers)
+
+        hovers = self._gestionar_botones_comunes()
+        self.pantalla.blit(self._capa(("humano", emocion, human, empates, ia, hovers), componer), (0, 0))
+
+        # Lo que cambia cada frame: mensaje, fichas y línea ganadora
+        lbl_m = self._texto('subtitulo', mensaje, (235, 186, 239))
+        self.pantalla.blit(lbl_m, lbl_m.get_rect(center=(ANCHO_VENTANA // 2, 110)))
+        self._dibujar_fichas(x_tablero, y_tablero, tablero)
 
         if combo_ganador: self.dibujar_linea_ganadora(combo_ganador)
-        self._gestionar_botones_comunes()
-        self._dibujar_marcador(human, empates, ia, 'humano_vs_ia')
         pygame.display.flip()
 
     # ------------------------------
@@ -219,36 +263,39 @@ class InterfazGrafica:
     # Muestra la pantalla del modo IA vs Minimax con tablero centrado y dos gatos pequeños enfrentados.
     # ------------------------------
     def dibujar_interfaz_minimax(self, tablero, mensaje, q_learn, minimax, empates, estructura_arbol, combo_ganador=None):
-        if self.fondo_juego: self.pantalla.blit(self.fondo_juego, (0, 0))
-        else: self.pantalla.fill((150, 150, 200))
-
-        # Títulos
-        lbl_t = self.fuentes['titulo'].render("Q-LEARNING VS MINIMAX", True, (55, 58, 127))
-        self.pantalla.blit(lbl_t, lbl_t.get_rect(center=(ANCHO_VENTANA // 2, 60)))
-        lbl_m = self.fuentes['subtitulo'].render(mensaje, True, (235, 186, 239))
-        self.pantalla.blit(lbl_m, lbl_m.get_rect(center=(ANCHO_VENTANA // 2, 110)))
-
-        # Tablero Centrado
-        self._dibujar_grid_tablero(ANCHO_VENTANA // 2 - (self.ancho_juego // 2), int(ALTO_VENTANA/2 - 150), tablero)
+        x_tablero, y_tablero = ANCHO_VENTANA // 2 - (self.ancho_juego // 2), int(ALTO_VENTANA/2 - 150)
 
         # Emociones
         emocion_q = "pensando" if "Q-Learning" in mensaje or "IA Pensando" in mensaje else "neutro"
         emocion_m = "pensando" if "Minimax" in mensaje else "neutro"
         if "Perdiste" in mensaje or "IA" in mensaje and "Ganó" in mensaje: emocion_q, emocion_m = "feliz", "triste"
         elif "Ganaste" in mensaje or "Minimax" in mensaje and "Ganó" in mensaje: emocion_q, emocion_m = "triste", "feliz"
-
-        # Gatos
-        self.dibujar_avatar(self.pantalla, emocion_q, "izquierda", True, ai_set="q")
-        self.dibujar_avatar(self.pantalla, emocion_m, "derecha", True, ai_set="m")
-
-        # Badges 
-        y_badges = 240 
-        self._dibujar_badge_ia(self.pantalla, "MACHINE LEARNING", int(ANCHO_VENTANA * 0.05 + 130), y_badges, "Q-Learning" in mensaje)
-        self._dibujar_badge_ia(self.pantalla, "MINIMAX EXPERT", int(ANCHO_VENTANA * 0.95 - 130), y_badges, "Minimax" in mensaje)
-
-        # Botones y Marcador
-        self._gestionar_botones_comunes(incluir_arbol=True)
-        self._dibujar_marcador(q_learn, empates, minimax, 'ia_vs_ia')
+        activo_q, activo_m = "Q-Learning" in mensaje, "Minimax" in mensaje
+
+        def componer(capa):
+            self._dibujar_fondo(capa, (150, 150, 200))
+            lbl_t = self._texto('titulo', "Q-LEARNING VS MINIMAX", (55, 58, 127))
+            capa.blit(lbl_t, lbl_t.get_rect(center=(ANCHO_VENTANA // 2, 60)))
+            # Tablero Centrado
+            self._dibujar_marco_tablero(capa, x_tablero, y_tablero)
+            # Gatos
+            self.dibujar_avatar(capa, emocion_q, "izquierda", True, ai_set="q")
+            self.dibujar_avatar(capa, emocion_m, "derecha", True, ai_set="m")
+            # Badges 
+            y_badges = 240 
+            self._dibujar_badge_ia(capa, "MACHINE LEARNING", int(ANCHO_VENTANA * 0.05 + 130), y_badges, activo_q)
+            self._dibujar_badge_ia(capa, "MINIMAX EXPERT", int(ANCHO_VENTANA * 0.95 - 130), y_badges, activo_m)
+            self._dibujar_marcador(capa, q_learn, empates, minimax, 'ia_vs_ia')
+            self._dibujar_botones_comunes(capa, hovers, incluir_arbol=True)
+
+        hovers = self._gestionar_botones_comunes(incluir_arbol=True)
+        clave = ("minimax", emocion_q, emocion_m, activo_q, activo_m, q_learn, empates, minimax, hovers)
+        self.pantalla.blit(self._capa(clave, componer), (0, 0))
+
+        # Lo que cambia cada frame: mensaje y fichas
+        lbl_m = self._texto('subtitulo', mensaje, (235, 186, 239))
+        self.pantalla.blit(lbl_m, lbl_m.get_rect(center=(ANCHO_VENTANA // 2, 110)))
+        self._dibujar_fichas(x_tablero, y_tablero, tablero)
 
         # Capas superiores (Línea y Árbol)
         if combo_ganador: self.dibujar_linea_ganadora(combo_ganador)
@@ -261,13 +308,11 @@ class InterfazGrafica:
     # Controla los botones de salir y reiniciar, detectando cuando el mouse pasa por encima.
     # ------------------------------
     def _gestionar_botones_comunes(self, incluir_arbol=False):
-
-        h_home = self._dibujar_boton_con_imagen(self.rect_home, self.img_home)
-        h_reload = self._dibujar_boton_con_imagen(self.rect_reload, self.img_reload)
-        
-        h_tree = False
-        if incluir_arbol:
-            h_tree = self._dibujar_boton_con_imagen(self.rect_boton_arbol, self.img_tree)
+        """Calcula el hover de cada botón (y suena al entrar en uno). Retorna (home, reload, árbol)."""
+        mouse_pos = pygame.mouse.get_pos()
+        h_home = self.rect_home.collidepoint(mouse_pos)
+        h_reload = self.rect_reload.collidepoint(mouse_pos)
+        h_tree = incluir_arbol and self.rect_boton_arbol.collidepoint(mouse_pos)
 
         hover_actual = None
         if h_home:
@@ -282,6 +327,14 @@ class InterfazGrafica:
                 if 'menu_hover' in self.sonidos:
                     self.sonidos['menu_hover'].play()
             self.ultimo_boton_hover = hover_actual
+        return h_home, h_reload, h_tree
+
+    def _dibujar_botones_comunes(self, superficie, hovers, incluir_arbol=False):
+        h_home, h_reload, h_tree = hovers
+        self._dibujar_boton_con_imagen(superficie, self.rect_home, self.img_home, h_home)
+        self._dibujar_boton_con_imagen(superficie, self.rect_reload, self.img_reload, h_reload)
+        if incluir_arbol:
+            self._dibujar_boton_con_imagen(superficie, self.rect_boton_arbol, self.img_tree, h_tree)
 
     # ------------------------------
     # OBTENER EVENTO USUARIO
@@ -415,14 +468,14 @@ class InterfazGrafica:
         pygame.draw.rect(self.pantalla, pygame.Color("#202040"), caja, border_radius=12)
         pygame.draw.rect(self.pantalla, pygame.Color(COLOR_LINEA), caja, width=2, border_radius=12)
 
-        titulo = self.fuentes['subtitulo'].render("Árbol Completo de Decisiones del Agente", True, pygame.Color(COLOR_TEXTO))
+        titulo = self._texto('subtitulo', "Árbol Completo de Decisiones del Agente", COLOR_TEXTO)
         titulo_rect = titulo.get_rect(center=(caja.centerx, caja.y + 25))
         self.pantalla.blit(titulo, titulo_rect)
         
         btn_cerrar = pygame.Rect(caja.right - 160, caja.y + 10, 140, 50)
         color_btn = pygame.Color(COLOR_BOTON_HOVER) if btn_cerrar.collidepoint(pygame.mouse.get_pos()) else pygame.Color(COLOR_BOTON)
         pygame.draw.rect(self.pantalla, color_btn, btn_cerrar, border_radius=12)   
-        txt_cerrar = self.fuentes['ui'].render("Cerrar (Esc)", True, pygame.Color(COLOR_TEXTO))
+        txt_cerrar = self._texto('ui', "Cerrar (Esc)", COLOR_TEXTO)
         rect_txt = txt_cerrar.get_rect(center=btn_cerrar.center) 
         self.pantalla.blit(txt_cerrar, rect_txt)     
 
@@ -448,44 +501,50 @@ class InterfazGrafica:
     # ------------------------------
     # DIBUJAR GRID DEL TABLERO
     # Pinta el fondo del tablero y las 9 casillas con sus fichas (X o O).
+    # Para la capa estática se usan por separado el marco (casillas vacías) y las fichas.
     # ------------------------------
     def _dibujar_grid_tablero(self, x_pos, y_pos, tablero):
-        self.inicio_x, self.inicio_y = x_pos, y_pos
+        self._dibujar_marco_tablero(self.pantalla, x_pos, y_pos)
+        self._dibujar_fichas(x_pos, y_pos, tablero)
+
+    def _dibujar_marco_tablero(self, superficie, x_pos, y_pos):
         ancho_fondo = self.ancho_juego + (PADDING_LATERAL * 2)
         alto_fondo = self.ancho_juego + (PADDING_TABLERO * 2)
-        pygame.draw.rect(self.pantalla, pygame.Color(COLOR_TABLERO), (x_pos - PADDING_LATERAL, y_pos - PADDING_TABLERO, ancho_fondo, alto_fondo), border_radius=45)
+        pygame.draw.rect(superficie, pygame.Color(COLOR_TABLERO), (x_pos - PADDING_LATERAL, y_pos - PADDING_TABLERO, ancho_fondo, alto_fondo), border_radius=45)
 
         for i in range(9):
             fila, col = i // 3, i % 3
             x, y = x_pos + col * (TAMANO_CASILLA + ESPACIO), y_pos + fila * (TAMANO_CASILLA + ESPACIO)
-            pygame.draw.rect(self.pantalla, pygame.Color(COLOR_CASILLA_SOMBRA_3D), (x, y + 10, TAMANO_CASILLA, TAMANO_CASILLA), border_radius=25)
-            pygame.draw.rect(self.pantalla, pygame.Color(COLOR_CASILLA), (x, y, TAMANO_CASILLA, TAMANO_CASILLA), border_radius=25)
+            pygame.draw.rect(superficie, pygame.Color(COLOR_CASILLA_SOMBRA_3D), (x, y + 10, TAMANO_CASILLA, TAMANO_CASILLA), border_radius=25)
+            pygame.draw.rect(superficie, pygame.Color(COLOR_CASILLA), (x, y, TAMANO_CASILLA, TAMANO_CASILLA), border_radius=25)
+
+    def _dibujar_fichas(self, x_pos, y_pos, tablero):
+        # events.py y la línea ganadora ubican las casillas con inicio_x / inicio_y
+        self.inicio_x, self.inicio_y = x_pos, y_pos
+        for i in range(9):
             if tablero[i] != " ":
-                color = pygame.Color(COLOR_X if tablero[i] == "X" else COLOR_O)
-                txt = self.fuentes['ficha'].render(tablero[i], True, color)
+                fila, col = i // 3, i % 3
+                x, y = x_pos + col * (TAMANO_CASILLA + ESPACIO), y_pos + fila * (TAMANO_CASILLA + ESPACIO)
+                txt = self.glifos[tablero[i]]
                 self.pantalla.blit(txt, txt.get_rect(center=(x + TAMANO_CASILLA / 2, y + TAMANO_CASILLA / 2)))
 
  # ------------------------------
     # DIBUJAR BOTÓN CON IMAGEN
     # Crea un botón interactivo con sombra, efecto hover y un ícono centrado.
     # ------------------------------
-    def _dibujar_boton_con_imagen(self, rect, imagen_icon):
-        mouse_pos = pygame.mouse.get_pos()
-        hover = rect.collidepoint(mouse_pos)
-        
+    def _dibujar_boton_con_imagen(self, superficie, rect, imagen_icon, hover):
         # Sombra
         sombra = rect.copy(); sombra.y += 5
-        pygame.draw.rect(self.pantalla, (40, 40, 80), sombra, border_radius=12)
+        pygame.draw.rect(superficie, (40, 40, 80), sombra, border_radius=12)
         
         # Cuerpo
         color = (60, 63, 130) if hover else (55, 58, 127)
         rect_v = rect.copy()
         if hover: rect_v.y -= 4
-        pygame.draw.rect(self.pantalla, color, rect_v, border_radius=12)
+        pygame.draw.rect(superficie, color, rect_v, border_radius=12)
         
         if imagen_icon:
-            self.pantalla.blit(imagen_icon, imagen_icon.get_rect(center=rect_v.center))
-        return hover
+            superficie.blit(imagen_icon, imagen_icon.get_rect(center=rect_v.center))
 
     # --------------------
     # Dibuja una etiqueta elegante para identificar a la IA.
@@ -493,8 +552,7 @@ class InterfazGrafica:
     # --------------------
     def _dibujar_badge_ia(self, superficie, texto, centro_x, y_pos, es_activo):
 
-        fuente = self.fuentes['ui']
-        texto_surf = fuente.render(texto, True, (255, 255, 255))
+        texto_surf = self._texto('ui', texto, (255, 255, 255))
         
         # Tamaño del badge basado en el texto
         ancho_badge = texto_surf.get_width() + 30
@@ -523,18 +581,18 @@ class InterfazGrafica:
     # modo: 'ia_vs_ia' o 'humano_vs_ia'
     # v1: Puntos Izquierda Q-Learning o Humano -  empates: Puntos Centro -  v2: Puntos Derecha (Minimax o IA)
     # --------------------
-    def _dibujar_marcador(self, v1, empates, v2, modo):
+    def _dibujar_marcador(self, superficie, v1, empates, v2, modo):
 
         ancho, alto = 420, 45 
         rect_marcador = pygame.Rect(0, 0, ancho, alto)
         rect_marcador.center = (ANCHO_VENTANA // 2, ALTO_VENTANA - 60)
 
-        pygame.draw.rect(self.pantalla, (COLOR_CASILLA), rect_marcador, width=3, border_radius=15)
+        pygame.draw.rect(superficie, (COLOR_CASILLA), rect_marcador, width=3, border_radius=15)
 
         if modo == 'ia_vs_ia':
             texto = f"Q-LEARNING: {v1}  |  EMPATE: {empates}  |  MINIMAX: {v2}"
         else:
             texto = f"TÚ: {v1}  |  EMPATES: {empates}  |  IA: {v2}"
 
-        lbl_score = self.fuentes['score'].render(texto, True, (COLOR_CASILLA))
-        self.pantalla.blit(lbl_score, lbl_score.get_rect(center=rect_marcador.center))
+        lbl_score = self._texto('score', texto, COLOR_CASILLA)
+        superficie.blit(lbl_score, lbl_score.get_rect(center=rect_marcador.center))